@@ -0,0 +1,20 @@
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from .permissions import get_permissions_version
+
+
+class PermissionVersionJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that rejects access tokens carrying a stale
+    ``perm_version`` claim, so clients refresh after a role change.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if not settings.JWT_EMBED_PERMISSIONS:
+            return validated_token
+        perm_version = validated_token.get("perm_version")
+        if perm_version is not None and perm_version != get_permissions_version():
+            raise InvalidToken({"detail": "Permissions have changed, refresh the token"})
+        return validated_token
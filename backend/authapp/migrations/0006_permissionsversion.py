@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-18 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authapp', '0005_customuser_otp_customuser_otp_created_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PermissionsVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
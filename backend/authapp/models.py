@@ -1,9 +1,10 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.base_user import BaseUserManager
 from django.utils.translation import gettext_lazy as _
+from .permissions import invalidate_permission_matrix
 
 
 class CustomUserManager(BaseUserManager):
@@ -76,6 +77,34 @@ class Permission(models.Model):
         return f"{self.role.name} - {self.page}"
 
 
+class PermissionsVersion(models.Model):
+    """Single row counting committed role and permission changes."""
+
+    version = models.PositiveBigIntegerField(default=0)
+
+
+@receiver([post_save, post_delete], sender=Role)
+@receiver([post_save, post_delete], sender=Permission)
+def invalidate_permissions_cache(sender, **kwargs):
+    invalidate_permission_matrix()
+
+
+@receiver(pre_save, sender=CustomUser)
+def track_role_change(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or (update_fields is not None and "role" not in update_fields):
+        instance._role_changed = False
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list("role_id", flat=True).first()
+    instance._role_changed = previous != instance.role_id
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_on_role_change(sender, instance, created, **kwargs):
+    # Tokens carry the old role's claims until the version moves on
+    if not created and getattr(instance, "_role_changed", False):
+        invalidate_permission_matrix()
+
+
 @receiver(post_save, sender=Role)
 def set_default_permissions(sender, instance, created, **kwargs):
     if created:
@@ -299,8 +328,8 @@ def set_default_permissions(sender, instance, created, **kwargs):
                 "can_delete": False,
             },
         ]
-        for perm in default_permissions:
-            Permission.objects.create(
+        Permission.objects.bulk_create(
+            Permission(
                 role=instance,
                 page=perm["page"],
                 can_view=perm.get("can_view", False),
@@ -308,3 +337,6 @@ def set_default_permissions(sender, instance, created, **kwargs):
                 can_edit=perm.get("can_edit", False),
                 can_delete=perm.get("can_delete", False),
             )
+            for perm in default_permissions
+        )
+        invalidate_permission_matrix()
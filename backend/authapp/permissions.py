@@ -0,0 +1,117 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+SUPERADMIN_ROLE = "Superadmin"
+ACTIONS = ("can_view", "can_add", "can_edit", "can_delete")
+ACTION_BITS = {action: 1 << index for index, action in enumerate(ACTIONS)}
+PERMISSIONS_VERSION_KEY = "authapp:permissions:version"
+# The version lives in the database; the cache only saves the lookup, and
+# processes on a local cache catch up with other workers within this time
+PERMISSIONS_VERSION_TIMEOUT = 60
+
+# Per-process copy of the matrix; the shared version key tells every worker
+# when it has to reload.
+_matrix = {"version": None, "roles": {}}
+
+
+def encode_actions(permission):
+    """Bitmask of the can_* flags set on a Permission (or a dict of them)."""
+    get = permission.get if isinstance(permission, dict) else lambda name: getattr(permission, name)
+    bits = 0
+    for action, bit in ACTION_BITS.items():
+        if get(action):
+            bits |= bit
+    return bits
+
+
+def read_permissions_version():
+    from .models import PermissionsVersion
+
+    return PermissionsVersion.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+
+def get_permissions_version():
+    version = cache.get(PERMISSIONS_VERSION_KEY)
+    if version is None:
+        version = read_permissions_version()
+        cache.add(PERMISSIONS_VERSION_KEY, version, PERMISSIONS_VERSION_TIMEOUT)
+    return version
+
+
+def invalidate_permission_matrix():
+    """
+    Count a role or permission change. The counter row is updated in the
+    current transaction and published to the cache once it commits, so a
+    reload never pairs the new version with the old rows, and issued tokens
+    survive cache flushes and restarts.
+    """
+    from .models import PermissionsVersion
+
+    counter = PermissionsVersion.objects.filter(pk=1)
+    if not counter.update(version=F("version") + 1):
+        PermissionsVersion.objects.get_or_create(pk=1)
+        counter.update(version=F("version") + 1)
+    transaction.on_commit(
+        lambda: cache.set(PERMISSIONS_VERSION_KEY, read_permissions_version(), PERMISSIONS_VERSION_TIMEOUT)
+    )
+
+
+def load_permission_matrix():
+    """
+    All roles with their page bitmaps, read in one query:
+    {role_id: {"name": ..., "pages": {page: bits}}}.
+    """
+    from .models import Role
+
+    roles = {}
+    rows = Role.objects.values_list(
+        "id", "name", "permissions__page",
+        *(f"permissions__{action}" for action in ACTIONS),
+    )
+    for role_id, name, page, *flags in rows:
+        role = roles.setdefault(role_id, {"name": name, "pages": {}})
+        if page is not None:
+            role["pages"][page] = encode_actions(dict(zip(ACTIONS, flags)))
+    return roles
+
+
+def get_permission_matrix():
+    version = get_permissions_version()
+    if _matrix["version"] != version:
+        _matrix["roles"] = load_permission_matrix()
+        _matrix["version"] = version
+    return _matrix["roles"]
+
+
+def get_role_permissions(role_id):
+    return get_permission_matrix().get(role_id)
+
+
+def is_superadmin(role_id):
+    role = get_role_permissions(role_id)
+    return bool(role) and role["name"] == SUPERADMIN_ROLE
+
+
+def role_has_permission(role_id, page, action):
+    """``action`` is one of ACTIONS, e.g. "can_edit"."""
+    role = get_role_permissions(role_id)
+    if not role:
+        return False
+    if role["name"] == SUPERADMIN_ROLE:
+        return True
+    return bool(role["pages"].get(page, 0) & ACTION_BITS[action])
+
+
+def permission_claims(user):
+    """
+    Compact token claims for ``user``: the role name, the matrix version and
+    a page -> action bitmask map (pages without any action are left out).
+    """
+    role = get_role_permissions(user.role_id) or {"name": None, "pages": {}}
+    return {
+        "role": role["name"],
+        "is_superuser": user.is_superuser,
+        "perm_version": get_permissions_version(),
+        "perms": {page: bits for page, bits in role["pages"].items() if bits},
+    }
@@ -1,8 +1,11 @@
 from rest_framework import serializers
 from .models import CustomUser, Role, Permission
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from .permissions import permission_claims
 from django.conf import settings
-from django.core.mail import send_mail
+from notifications.services import send_email_later
 import random
 import string
 
@@ -106,15 +109,11 @@ class UserCreateSerializer(serializers.ModelSerializer):
             f'Please log in and change your password after your first login.\n\n'
             f'Regards,\nYour Team'
         )
-        from_email = settings.EMAIL_HOST_USER
-        recipient_list = [user.email]
-
-        send_mail(
+        send_email_later(
             subject,
             message,
-            from_email,
-            recipient_list,
-            fail_silently=False,
+            [user.email],
+            idempotency_key=f"user-credentials:{user.pk}",
         )
 
         return user
@@ -123,5 +122,27 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
-        token['role'] = user.role.name if user.role else None
-        return token
\ No newline at end of file
+        if settings.JWT_EMBED_PERMISSIONS:
+            for claim, value in permission_claims(user).items():
+                token[claim] = value
+        else:
+            token['role'] = user.role.name if user.role else None
+        return token
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if not settings.JWT_EMBED_PERMISSIONS:
+            return data
+
+        # Re-stamp the permission claims instead of copying them from the refresh token
+        access = AccessToken(data["access"])
+        user = CustomUser.objects.filter(
+            **{jwt_settings.USER_ID_FIELD: access[jwt_settings.USER_ID_CLAIM]}
+        ).first()
+        if user is not None:
+            for claim, value in permission_claims(user).items():
+                access[claim] = value
+            data["access"] = str(access)
+        return data
\ No newline at end of file
@@ -1,3 +1,48 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from .models import CustomUser, Permission, Role
+from .permissions import get_permissions_version, role_has_permission
+
+
+@override_settings(CACHES={
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "permission-tests",
+    }
+})
+class PermissionMatrixTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.role = Role.objects.create(name="Sales")
+
+    def test_version_changes_only_after_commit(self):
+        self.assertFalse(role_has_permission(self.role.pk, "Quotation", "can_edit"))
+        version = get_permissions_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Permission.objects.create(role=self.role, page="Quotation", can_edit=True)
+            # Other processes must not reload before the rows are committed
+            self.assertEqual(get_permissions_version(), version)
+        self.assertNotEqual(get_permissions_version(), version)
+        self.assertTrue(role_has_permission(self.role.pk, "Quotation", "can_edit"))
+
+    def test_version_survives_a_cache_flush(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Permission.objects.create(role=self.role, page="Quotation", can_view=True)
+        version = get_permissions_version()
+        cache.clear()
+        self.assertEqual(get_permissions_version(), version)
+
+    def test_role_reassignment_changes_the_version(self):
+        user = CustomUser.objects.create_user(email="sales@example.com", password="x", role=self.role)
+        other = Role.objects.create(name="Operations")
+        version = get_permissions_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save(update_fields=["last_login"])
+            user.save()
+        self.assertEqual(get_permissions_version(), version)
+
+        user.role = other
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        self.assertNotEqual(get_permissions_version(), version)
@@ -1,15 +1,14 @@
 import random
 import string
-from django.core.mail import send_mail
-from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny, BasePermission
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth import authenticate
 from .models import CustomUser, Role, Permission
+from .permissions import is_superadmin, role_has_permission
+from notifications.services import send_email_later
 from .serializers import (
     LoginSerializer,
     RequestOTPSerializer,
@@ -34,7 +33,8 @@ class HasPermission(BasePermission):
         if not request.user.is_authenticated:
             return False
 
-        if request.user.role and request.user.role.name == "Superadmin":
+        # Checked against the cached role matrix; role_id avoids loading the Role
+        if is_superadmin(request.user.role_id):
             return True
 
         page = getattr(view, 'page_name', view.__class__.__name__.lower().replace('view', ''))
@@ -47,26 +47,14 @@ class HasPermission(BasePermission):
         if not action:
             return False
 
-        return Permission.objects.filter(
-            role=request.user.role,
-            page=page,
-            **{action: True}
-        ).exists()
+        return role_has_permission(request.user.role_id, page, action)
 
 
 def has_permission(user, page, action):
     """
     Custom function to check if a user has permission for a given page and action.
     """
-    # Superadmin always has permission
-    if user.role and user.role.name == "Superadmin":
-        return True
-    if not user.role:
-        return False
-
-    return Permission.objects.filter(
-        role=user.role, page=page, **{f"can_{action}": True}
-    ).exists()
+    return role_has_permission(user.role_id, page, f"can_{action}")
 
 
 # ------------------ Auth Views ------------------
@@ -86,7 +74,7 @@ class LoginView(APIView):
             user = authenticate(request, email=email, password=password)
 
             if user is not None:
-                refresh = RefreshToken.for_user(user)
+                refresh = CustomTokenObtainPairSerializer.get_token(user)
                 return Response({
                     'access': str(refresh.access_token),
                     'refresh': str(refresh),
@@ -109,12 +97,11 @@ class RequestOTPView(APIView):
                 user.otp = otp
                 user.otp_created_at = timezone.now()
                 user.save()
-                send_mail(
+                send_email_later(
                     subject="Your OTP for Password Reset",
                     message=f"Your OTP is {otp}. It is valid for 10 minutes.",
-                    from_email=settings.EMAIL_HOST_USER,
                     recipient_list=[email],
-                    fail_silently=False,
+                    idempotency_key=f"otp:{user.pk}:{user.otp_created_at.timestamp()}",
                 )
                 return Response({"message": "OTP sent to your email"}, status=status.HTTP_200_OK)
             except CustomUser.DoesNotExist:
@@ -192,7 +179,7 @@ class RoleView(APIView):
         return Response(serializer.data)
 
     def post(self, request):
-        if not (request.user.role and request.user.role.name == "Superadmin"):
+        if not is_superadmin(request.user.role_id):
             return Response({'error': 'Only Superadmin can create roles'}, status=status.HTTP_403_FORBIDDEN)
 
         serializer = RoleCreateSerializer(data=request.data)
@@ -208,7 +195,7 @@ class RoleDetailView(APIView):
     def get(self, request, pk):
         try:
             role = Role.objects.get(pk=pk)
-            if role != request.user.role and request.user.role.name != "Superadmin":
+            if role.pk != request.user.role_id and not is_superadmin(request.user.role_id):
                 return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
             serializer = RoleSerializer(role)
             return Response(serializer.data)
@@ -246,7 +233,7 @@ class PermissionView(APIView):
     page_name = 'permissions'
 
     def post(self, request):
-        if not (request.user.role and request.user.role.name == "Superadmin"):
+        if not is_superadmin(request.user.role_id):
             return Response({'error': 'Only Superadmin can create permissions'}, status=status.HTTP_403_FORBIDDEN)
         serializer = PermissionSerializer(data=request.data)
         if serializer.is_valid():
@@ -270,7 +257,7 @@ class PermissionDetailView(APIView):
     page_name = 'permissions'
 
     def put(self, request, pk):
-        if not (request.user.role and request.user.role.name == "Superadmin"):
+        if not is_superadmin(request.user.role_id):
             return Response({'error': 'Only Superadmin can edit permissions'}, status=status.HTTP_403_FORBIDDEN)
         try:
             permission = Permission.objects.get(pk=pk)
@@ -283,7 +270,7 @@ class PermissionDetailView(APIView):
             return Response({'error': 'Permission not found'}, status=status.HTTP_404_NOT_FOUND)
 
     def delete(self, request, pk):
-        if not (request.user.role and request.user.role.name == "Superadmin"):
+        if not is_superadmin(request.user.role_id):
             return Response({'error': 'Only Superadmin can delete permissions'}, status=status.HTTP_403_FORBIDDEN)
         try:
             permission = Permission.objects.get(pk=pk)
@@ -305,7 +292,7 @@ class UserManagementView(APIView):
         return Response(serializer.data)
 
     def post(self, request):
-        if not (request.user.role and request.user.role.name == "Superadmin"):
+        if not is_superadmin(request.user.role_id):
             return Response({'error': 'Only Superadmin can create users'}, status=status.HTTP_403_FORBIDDEN)
         serializer = UserCreateSerializer(data=request.data)
         if serializer.is_valid():
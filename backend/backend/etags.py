@@ -0,0 +1,48 @@
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import parse_etags
+
+
+def collection_version_key(model):
+    return f"collection:{model._meta.label_lower}:version"
+
+
+def get_collection_versions(*models):
+    """Current version stamp of each model's collection, in the given order."""
+    keys = [collection_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid.uuid4().hex, None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_collection_version(*models):
+    """
+    Give each model's collection a new version stamp once the current
+    transaction commits, so readers never pair a new stamp with old rows.
+    """
+    def bump():
+        cache.set_many({collection_version_key(model): uuid.uuid4().hex for model in models}, None)
+
+    transaction.on_commit(bump)
+
+
+def make_etag(*parts):
+    """Strong ETag over ``parts``."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request, etag):
+    """True when the request's If-None-Match covers ``etag``."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    # Compression middleware may hand the client a weak copy of the tag
+    etags = [tag.removeprefix("W/") for tag in parse_etags(header)]
+    return "*" in etags or etag in etags
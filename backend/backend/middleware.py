@@ -0,0 +1,157 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger("backend.queries")
+
+# Duplicate fingerprints kept per endpoint in the metrics registry
+MAX_FINGERPRINTS = 20
+IN_LIST_RE = re.compile(r"\((?:%s, )+%s\)")
+NUMBER_RE = re.compile(r"\b\d+\b")
+
+# Per-process metrics, keyed by "<method> <view name>"
+_endpoint_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+def fingerprint(sql):
+    """SQL with IN lists and inlined numbers collapsed, so repeats of one query match."""
+    return NUMBER_RE.sub("?", IN_LIST_RE.sub("(...)", sql))
+
+
+class QueryStats:
+    """Database queries run while handling one request and the time spent in them."""
+
+    def __init__(self, fingerprints=False):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter() if fingerprints else None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            if self.fingerprints is not None:
+                self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self):
+        """{fingerprint: times run} for queries run more than once."""
+        if not self.fingerprints:
+            return {}
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+
+def response_row_count(response):
+    """Rows in a DRF list response, read from data it already evaluated."""
+    data = getattr(response, "data", None)
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        data = data["results"]
+    return len(data) if isinstance(data, list) else None
+
+
+def endpoint_key(request):
+    match = getattr(request, "resolver_match", None)
+    return f"{request.method} {match.view_name if match else request.path}"
+
+
+def record_endpoint(key, stats):
+    duplicates = stats.duplicates
+    with _metrics_lock:
+        metrics = _endpoint_metrics.setdefault(key, {
+            "requests": 0,
+            "queries": 0,
+            "max_queries": 0,
+            "duplicate_queries": 0,
+            "db_ms": 0.0,
+            "fingerprints": Counter(),
+        })
+        metrics["requests"] += 1
+        metrics["queries"] += stats.count
+        metrics["max_queries"] = max(metrics["max_queries"], stats.count)
+        metrics["duplicate_queries"] += sum(count - 1 for count in duplicates.values())
+        metrics["db_ms"] += stats.duration * 1000
+        metrics["fingerprints"].update(duplicates)
+        if len(metrics["fingerprints"]) > MAX_FINGERPRINTS:
+            metrics["fingerprints"] = Counter(
+                dict(metrics["fingerprints"].most_common(MAX_FINGERPRINTS))
+            )
+
+
+def endpoint_metrics():
+    """Snapshot of the per-endpoint metrics recorded by this process."""
+    with _metrics_lock:
+        return {
+            key: {
+                "requests": metrics["requests"],
+                "avg_queries": round(metrics["queries"] / metrics["requests"], 1),
+                "max_queries": metrics["max_queries"],
+                "duplicate_queries": metrics["duplicate_queries"],
+                "avg_db_ms": round(metrics["db_ms"] / metrics["requests"], 1),
+                "top_duplicates": [
+                    {"sql": sql, "count": count}
+                    for sql, count in metrics["fingerprints"].most_common(5)
+                ],
+            }
+            for key, metrics in sorted(_endpoint_metrics.items())
+        }
+
+
+def reset_endpoint_metrics():
+    with _metrics_lock:
+        _endpoint_metrics.clear()
+
+
+class QueryCountMiddleware:
+    """
+    Logs the query count, database time and total time of every request,
+    plus the row count of list responses. The stats are also available to
+    views as ``request.query_stats``.
+
+    With ``QUERY_METRICS_ENABLED`` the middleware also fingerprints queries
+    to spot duplicates, adds X-Query-Count, X-Query-Duplicates and
+    X-DB-Time-Ms response headers and aggregates per-endpoint metrics for
+    /api/_metrics.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics_enabled = settings.QUERY_METRICS_ENABLED
+        stats = QueryStats(fingerprints=metrics_enabled)
+        request.query_stats = stats
+        started = time.perf_counter()
+        with connection.execute_wrapper(stats):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+        rows = response_row_count(response)
+        logger.info(
+            f"{request.method} {request.path} status={response.status_code} "
+            f"queries={stats.count} db_ms={stats.duration * 1000:.1f} "
+            f"total_ms={elapsed * 1000:.1f}" + (f" rows={rows}" if rows is not None else ""),
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+                "queries": stats.count,
+                "db_ms": round(stats.duration * 1000, 1),
+                "total_ms": round(elapsed * 1000, 1),
+                "rows": rows,
+            },
+        )
+        if metrics_enabled:
+            duplicates = stats.duplicates
+            response["X-Query-Count"] = str(stats.count)
+            response["X-Query-Duplicates"] = str(sum(count - 1 for count in duplicates.values()))
+            response["X-DB-Time-Ms"] = f"{stats.duration * 1000:.1f}"
+            record_endpoint(endpoint_key(request), stats)
+        return response
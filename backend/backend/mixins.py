@@ -0,0 +1,194 @@
+import json
+
+from django.conf import settings
+from django.db.models import Max
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from .etags import etag_matches, get_collection_versions, make_etag
+
+
+class DynamicFieldsMixin:
+    """
+    Serializer mixin that accepts a ``fields`` kwarg and drops every other
+    field from the output.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class SparseFieldsMixin:
+    """
+    ViewSet mixin for ``?fields=id,series_number,...`` on read requests.
+    The serializer must use ``DynamicFieldsMixin``.
+    """
+
+    fields_query_param = "fields"
+
+    def get_requested_fields(self):
+        request = getattr(self, "request", None)
+        if request is None or request.method != "GET":
+            return None
+        requested = request.query_params.get(self.fields_query_param)
+        if not requested:
+            return None
+        return [name.strip() for name in requested.split(",") if name.strip()]
+
+    def get_serializer(self, *args, **kwargs):
+        if "fields" not in kwargs:
+            fields = self.get_requested_fields()
+            if fields:
+                kwargs["fields"] = fields
+        return super().get_serializer(*args, **kwargs)
+
+
+def summary_columns(serializer_class):
+    """
+    ``(only, select_related)`` for a flat serializer: one column per field
+    source, following dotted sources such as ``quotation.company_name``
+    through joins.
+    """
+    opts = serializer_class.Meta.model._meta
+    only, related = [], set()
+    for field in serializer_class().fields.values():
+        if field.source == "*":
+            continue
+        path = field.source.split(".")
+        if len(path) > 1:
+            related.add("__".join(path[:-1]))
+            only.append("__".join(path))
+        else:
+            # A foreign key by name would pull in the related row; the
+            # summary only needs its id column.
+            only.append(opts.get_field(path[0]).attname)
+    return only, sorted(related)
+
+
+class SummaryViewMixin:
+    """
+    ViewSet mixin for ``?view=summary`` on list requests: rows are rendered
+    by ``summary_serializer_class``, a flat serializer of header fields, from
+    a queryset narrowed with ``.only()`` to the columns it reads and without
+    the prefetches of the full representation.
+    """
+
+    view_query_param = "view"
+    summary_serializer_class = None
+
+    def is_summary_view(self):
+        request = getattr(self, "request", None)
+        return (
+            request is not None
+            and self.action == "list"
+            and request.query_params.get(self.view_query_param) == "summary"
+        )
+
+    def get_serializer_class(self):
+        if self.is_summary_view():
+            return self.summary_serializer_class
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.is_summary_view():
+            only, related = summary_columns(self.summary_serializer_class)
+            queryset = (
+                queryset.select_related(None)
+                .prefetch_related(None)
+                .select_related(*related)
+                .only(*only)
+            )
+        return queryset
+
+
+class StreamingExportMixin:
+    """
+    ViewSet mixin for ``?page_size=all``: streams the whole filtered queryset
+    as a JSON array, serializing ``export_chunk_size`` rows at a time instead
+    of building the full response in memory.
+    """
+
+    export_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("page_size") != "all":
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.paginator is not None:
+            queryset = queryset.order_by(
+                *self.paginator.get_ordering(request, queryset, self)
+            )
+        return StreamingHttpResponse(
+            self.stream_json(queryset), content_type="application/json"
+        )
+
+    def stream_json(self, queryset):
+        yield "["
+        separator = ""
+        chunk = []
+        for obj in queryset.iterator(chunk_size=self.export_chunk_size):
+            chunk.append(obj)
+            if len(chunk) == self.export_chunk_size:
+                yield from self._dump_chunk(chunk, separator)
+                separator = ","
+                chunk = []
+        if chunk:
+            yield from self._dump_chunk(chunk, separator)
+        yield "]"
+
+    def _dump_chunk(self, chunk, separator):
+        for row in self.get_serializer(chunk, many=True).data:
+            yield separator + json.dumps(row, cls=JSONEncoder)
+            separator = ","
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin for ``ETag``/``If-None-Match`` on list and detail reads;
+    a matching request gets a 304 without running the list query.
+
+    The tag covers the request URL and format and the version stamps of
+    ``etag_models`` (every model the response renders), which are bumped
+    whenever one of them is saved or deleted. When the stamps live in a
+    per-process cache (``ETAG_WATERMARKS``), ``etag_watermark`` names an
+    indexed timestamp field whose latest value in the filtered queryset is
+    also covered, so saves another process made still change the tag.
+    """
+
+    etag_models = ()
+    etag_watermark = None
+
+    def get_etag(self, request):
+        parts = [request.get_full_path(), request.accepted_renderer.format]
+        parts += get_collection_versions(*self.etag_models)
+        if self.etag_watermark and settings.ETAG_WATERMARKS:
+            queryset = self.filter_queryset(self.get_queryset())
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            if lookup_url_kwarg in self.kwargs:
+                queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            parts.append(queryset.order_by().aggregate(latest=Max(self.etag_watermark))["latest"])
+        return make_etag(*parts)
+
+    def conditional_response(self, view, request, *args, **kwargs):
+        etag = self.get_etag(request)
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response = view(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+            # Let browsers keep the response but revalidate before reuse
+            response["Cache-Control"] = "private, no-cache"
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
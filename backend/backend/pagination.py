@@ -0,0 +1,35 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination ordered by ``created_at`` then ``id``.
+
+    Pagination is opt-in: list responses stay plain arrays unless the client
+    sends ``cursor`` or ``page_size``, so existing screens keep working.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        field_names = {field.name for field in queryset.model._meta.get_fields()}
+        if "created_at" not in field_names:
+            return ("-id",)
+        return self.ordering
+
+
+class ReportPagination(PageNumberPagination):
+    """Page-number pagination for report rows, which sort on arbitrary columns."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 500
@@ -0,0 +1,148 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import serializers
+from rest_framework.utils import html
+
+from .etags import get_collection_versions
+
+ROW_CACHE_SIZE = 2048
+ROW_CACHE_TTL = 5 * 60
+
+
+class RowCache:
+    """
+    Per-process LRU of reference rows by model and pk. Entries expire after
+    ``ttl`` seconds, or as soon as the model's collection version changes.
+    Callers get copies, so nothing they do leaks into other requests.
+    """
+
+    def __init__(self, maxsize=ROW_CACHE_SIZE, ttl=ROW_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._rows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, model, pks, version):
+        label = model._meta.label_lower
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for pk in pks:
+                entry = self._rows.get((label, pk))
+                if entry is None:
+                    continue
+                obj, entry_version, expires = entry
+                if entry_version != version or expires < now:
+                    del self._rows[(label, pk)]
+                    continue
+                self._rows.move_to_end((label, pk))
+                found[pk] = copy.copy(obj)
+        return found
+
+    def set_many(self, model, rows, version):
+        label = model._meta.label_lower
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for pk, obj in rows.items():
+                self._rows[(label, pk)] = (copy.copy(obj), version, expires)
+                self._rows.move_to_end((label, pk))
+            while len(self._rows) > self.maxsize:
+                self._rows.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._rows.clear()
+
+
+row_cache = RowCache()
+
+
+def resolve_pks(queryset, values, cached=False):
+    """
+    {value: instance} for the ``values`` that name a row of ``queryset``,
+    loaded with one in_bulk query. Values may be ids in any form the pk field
+    accepts or instances, which are passed through; None, malformed and
+    unknown ids are left out. With ``cached`` rows are read through the row
+    cache, which is only valid for an unfiltered queryset.
+    """
+    model = queryset.model
+    resolved, wanted = {}, {}
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, model):
+            resolved[value] = value
+            continue
+        # bool is an int subclass, but True is not an id
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            continue
+        try:
+            wanted[value] = model._meta.pk.to_python(value)
+        except (TypeError, ValueError, DjangoValidationError):
+            continue
+    if not wanted:
+        return resolved
+
+    pks = set(wanted.values())
+    rows = {}
+    if cached:
+        version = get_collection_versions(model)[0]
+        rows = row_cache.get_many(model, pks, version)
+    missing = pks - set(rows)
+    if missing:
+        loaded = queryset.in_bulk(missing)
+        rows.update(loaded)
+        if cached:
+            row_cache.set_many(model, loaded, version)
+    for value, pk in wanted.items():
+        if pk in rows:
+            resolved[value] = rows[pk]
+    return resolved
+
+
+class BatchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that looks values up in rows resolved ahead of
+    time by BatchedListSerializer, instead of one query per value. Pass
+    ``cached=True`` for reference tables read through the row cache.
+    """
+
+    def __init__(self, cached=False, **kwargs):
+        self.cached = cached
+        self.resolved = {}
+        super().__init__(**kwargs)
+
+    def prefetch(self, values):
+        self.resolved.update(resolve_pks(self.get_queryset(), values, cached=self.cached))
+
+    def to_internal_value(self, data):
+        if self.pk_field is None and isinstance(data, (str, int)) and not isinstance(data, bool):
+            if data not in self.resolved:
+                self.prefetch([data])
+            if data in self.resolved:
+                return self.resolved[data]
+        # Unknown or malformed values get the usual errors
+        return super().to_internal_value(data)
+
+
+class BatchedListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that resolves the BatchedPrimaryKeyRelatedFields of its
+    child for every row at once (one query per field) before validating the
+    rows one by one.
+    """
+
+    def to_internal_value(self, data):
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+        if isinstance(data, list):
+            rows = [row for row in data if isinstance(row, Mapping)]
+            for field in self.child.fields.values():
+                if isinstance(field, BatchedPrimaryKeyRelatedField) and not field.read_only:
+                    field.prefetch(row.get(field.field_name) for row in rows)
+        return super().to_internal_value(data)
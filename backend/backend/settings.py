@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+from celery.schedules import crontab
 
 # Load environment variables from .env file
 load_dotenv()
@@ -47,6 +48,8 @@ INSTALLED_APPS = [
     "series",
     "pre_job",
     "job_execution",
+    "dashboard",
+    "notifications",
 ]
 
 MIDDLEWARE = [
@@ -59,6 +62,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "backend.middleware.QueryCountMiddleware",
 ]
 
 ROOT_URLCONF = "backend.urls"
@@ -129,11 +133,13 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authapp.authentication.PermissionVersionJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_PAGINATION_CLASS": "backend.pagination.CreatedAtCursorPagination",
+    "PAGE_SIZE": 50,
 }
 
 # Simple JWT settings
@@ -143,8 +149,15 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": False,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "authapp.serializers.CustomTokenRefreshSerializer",
 }
 
+# Embed the role permission matrix (page -> action bitmask) in access tokens
+JWT_EMBED_PERMISSIONS = os.getenv("JWT_EMBED_PERMISSIONS", "False") == "True"
+
+# Query fingerprints, X-Query-* response headers and the /api/_metrics endpoint
+QUERY_METRICS_ENABLED = os.getenv("QUERY_METRICS_ENABLED", "False") == "True"
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if os.getenv("CORS_ALLOWED_ORIGINS") else [
     "http://localhost:5173",
@@ -159,11 +172,14 @@ CORS_ALLOW_HEADERS = [
     "authorization",
     "content-type",
     "dnt",
+    "if-none-match",
     "origin",
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
 ]
+# Conditional GETs on list endpoints revalidate with the ETag
+CORS_EXPOSE_HEADERS = ["etag"]
 
 # CSRF Trusted Origins - using same domains as CORS
 CSRF_TRUSTED_ORIGINS = os.getenv("CSRF_TRUSTED_ORIGINS", "").split(",") if os.getenv("CSRF_TRUSTED_ORIGINS") else [
@@ -192,6 +208,27 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880
 
 
+# Cache: shared Redis when available so every gunicorn/celery worker sees the
+# same invalidations, per-process memory otherwise.
+if os.getenv("REDIS_HOST"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT', '6379')}/2",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Per-process caches miss the ETag version bumps of other workers, so lists
+# then also check MAX(updated_at); a shared cache sees every bump.
+ETAG_WATERMARKS = not os.getenv("REDIS_HOST")
+
+
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND')
@@ -200,6 +237,16 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+CELERY_BEAT_SCHEDULE = {
+    'flush-notifications': {
+        'task': 'notifications.tasks.flush_notifications',
+        'schedule': 15.0,
+    },
+    'refresh-calibration-due-summary': {
+        'task': 'job_execution.tasks.refresh_calibration_due_summary_task',
+        'schedule': crontab(hour=1, minute=0),
+    },
+}
 
 # CELERY_BROKER_URL = 'redis://localhost:6379/0'
 # CELERY_RESULT_BACKEND = 'redis://localhost:6379/1'
@@ -0,0 +1,135 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authapp.models import CustomUser, Role
+from channels.models import RFQChannel
+from item.models import Item
+from job_execution.models import (
+    DeliveryNote,
+    DeliveryNoteItem,
+    DeliveryNoteItemComponent,
+    Invoice,
+    WorkOrder,
+    WorkOrderItem,
+)
+from pre_job.models import (
+    RFQ,
+    RFQItem,
+    PurchaseOrder,
+    PurchaseOrderItem,
+    Quotation,
+    QuotationItem,
+)
+from team.models import TeamMember, Technician
+from unit.models import Unit
+
+
+def create_order_fixtures(count=3, lines=3):
+    """
+    ``count`` complete order chains (RFQ -> quotation -> PO -> work order ->
+    delivery note -> invoices), each document with ``lines`` items.
+    """
+    channel = RFQChannel.objects.create(channel_name="Email")
+    salesperson = TeamMember.objects.create(name="Sales", email="sales@example.com")
+    technician = Technician.objects.create(name="Tech", email="tech@example.com")
+    unit = Unit.objects.create(name="Each")
+    items = [Item.objects.create(name=f"Item {index}") for index in range(lines)]
+    today = timezone.localdate()
+    for number in range(count):
+        rfq = RFQ.objects.create(
+            company_name=f"Company {number}",
+            rfq_channel=channel,
+            assigned_sales_person=salesperson,
+            rfq_status="Completed",
+            series_number=f"TEST-RFQ-{number:03d}",
+        )
+        quotation = Quotation.objects.create(
+            rfq=rfq,
+            company_name=rfq.company_name,
+            rfq_channel=channel,
+            assigned_sales_person=salesperson,
+            series_number=f"TEST-QUO-{number:03d}",
+        )
+        purchase_order = PurchaseOrder.objects.create(
+            quotation=quotation, series_number=f"TEST-PO-{number:03d}"
+        )
+        work_order = WorkOrder.objects.create(
+            purchase_order=purchase_order,
+            quotation=quotation,
+            wo_number=f"TEST-WO-{number:03d}",
+            status="Approved",
+        )
+        delivery_note = DeliveryNote.objects.create(
+            work_order=work_order,
+            dn_number=f"TEST-DN-{number:03d}",
+            signed_delivery_note="delivery_notes/signed.pdf",
+            delivery_status="Delivered",
+        )
+        for index, item in enumerate(items):
+            line = {"item": item, "quantity": index + 1, "unit": unit, "unit_price": 10}
+            RFQItem.objects.create(rfq=rfq, **line)
+            QuotationItem.objects.create(quotation=quotation, **line)
+            PurchaseOrderItem.objects.create(purchase_order=purchase_order, **line)
+            WorkOrderItem.objects.create(
+                work_order=work_order,
+                assigned_to=technician,
+                calibration_due_date=today + timedelta(days=index * 5),
+                **line,
+            )
+            delivery_note_item = DeliveryNoteItem.objects.create(
+                delivery_note=delivery_note, item=item, quantity=line["quantity"], uom=unit
+            )
+            DeliveryNoteItemComponent.objects.create(
+                delivery_note_item=delivery_note_item, component="Range", value="0-10"
+            )
+            Invoice.objects.create(
+                delivery_note=delivery_note, delivery_note_item=delivery_note_item
+            )
+        for document in (rfq, quotation, purchase_order):
+            document.refresh_totals()
+
+
+@override_settings(CACHES={
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "query-budget-tests",
+    }
+}, ETAG_WATERMARKS=False)
+class QueryBudgetTestCase(TestCase):
+    """
+    Base for query budget tests: requests run as a Superadmin and
+    assertQueryBudget fails when a route needs more queries than allowed.
+    Tests run in one process, so the cache is shared as it is with Redis.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        role = Role.objects.create(name="Superadmin")
+        cls.user = CustomUser.objects.create_user(
+            email="admin@example.com", password="password", role=role
+        )
+
+    def setUp(self):
+        # Start every test with cold permission and terms caches
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertQueryBudget(self, url, budget):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content[:500])
+        queries = len(context.captured_queries)
+        self.assertLessEqual(
+            queries,
+            budget,
+            f"GET {url} ran {queries} queries, budget is {budget}:\n"
+            + "\n".join(query["sql"] for query in context.captured_queries),
+        )
+        return response
@@ -19,6 +19,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from .views import QueryMetricsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -34,6 +35,8 @@ urlpatterns = [
                 path("", include("series.urls")),
                 path("", include("pre_job.urls")),
                 path("", include("job_execution.urls")),
+                path("", include("dashboard.urls")),
+                path("_metrics", QueryMetricsView.as_view(), name="query_metrics"),
             ]
         ),
     ),
@@ -0,0 +1,41 @@
+import os
+
+from django.conf import settings
+from django.http import Http404
+from rest_framework.permissions import BasePermission
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from authapp.permissions import is_superadmin
+from .middleware import endpoint_metrics, reset_endpoint_metrics
+
+
+class IsSuperadmin(BasePermission):
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(
+            user and user.is_authenticated
+            and (user.is_superuser or is_superadmin(user.role_id))
+        )
+
+
+class QueryMetricsView(APIView):
+    """
+    Per-endpoint query metrics collected by QueryCountMiddleware in this
+    worker process. Only served when QUERY_METRICS_ENABLED is set; DELETE
+    clears the counters.
+    """
+
+    permission_classes = [IsSuperadmin]
+
+    def initial(self, request, *args, **kwargs):
+        if not settings.QUERY_METRICS_ENABLED:
+            raise Http404
+        super().initial(request, *args, **kwargs)
+
+    def get(self, request):
+        return Response({"pid": os.getpid(), "endpoints": endpoint_metrics()})
+
+    def delete(self, request):
+        reset_endpoint_metrics()
+        return Response(status=204)
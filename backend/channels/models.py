@@ -1,7 +1,16 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.etags import bump_collection_version
 
 class RFQChannel(models.Model):
     channel_name = models.CharField(max_length=100, unique=True, null=True, blank=True, help_text="The name of the RFQ channel (e.g., WhatsApp, Email)")
 
     def __str__(self):
-        return self.channel_name
\ No newline at end of file
+        return self.channel_name
+
+
+@receiver([post_save, post_delete], sender=RFQChannel)
+def bump_channels_version(sender, **kwargs):
+    bump_collection_version(sender)
@@ -2,8 +2,10 @@ from rest_framework import viewsets
 from .models import RFQChannel
 from .serializers import RFQChannelSerializer
 from rest_framework.permissions import AllowAny
+from backend.mixins import ConditionalGetMixin
 
-class RFQChannelViewSet(viewsets.ModelViewSet):
+class RFQChannelViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = RFQChannel.objects.all()
+    etag_models = (RFQChannel,)
     serializer_class = RFQChannelSerializer
     permission_classes = [AllowAny]
\ No newline at end of file
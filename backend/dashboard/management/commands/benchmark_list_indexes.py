@@ -0,0 +1,210 @@
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from job_execution.models import DeliveryNote, Invoice, WorkOrder
+from pre_job.models import RFQ, PurchaseOrder, Quotation
+
+# Synthetic rows carry this marker so they can be found and removed again
+MARKER = "__benchmark__"
+WO_PREFIX = "BENCH-WO-"
+DN_PREFIX = "BENCH-DN-"
+INDEXED_MODELS = [RFQ, Quotation, PurchaseOrder, WorkOrder, DeliveryNote, Invoice]
+
+
+def choices(model, field):
+    return [value for value, _ in model._meta.get_field(field).choices]
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let bulk_create keep the spread-out created_at/updated_at values."""
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = (
+        "Load synthetic documents and compare the plans and timings of the list "
+        "view queries with and without the Meta.indexes of the list models. "
+        "Drops and recreates indexes: only for local databases."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000, help="Invoices to create; other tables get a tenth")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per query; the best time is reported")
+        parser.add_argument("--days", type=int, default=3 * 365, help="Spread created_at over this many days")
+        parser.add_argument("--skip-load", action="store_true", help="Reuse rows kept by an earlier --keep run")
+        parser.add_argument("--keep", action="store_true", help="Keep the synthetic rows afterwards")
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG:
+            raise CommandError("Refusing to drop indexes with DEBUG off; run this against a local database.")
+        self.random = random.Random(42)
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now()
+        self.days = options["days"]
+
+        if not options["skip_load"]:
+            started = time.perf_counter()
+            self.load(options["rows"])
+            self.stdout.write(f"Loaded synthetic rows in {time.perf_counter() - started:.1f}s")
+
+        queries = self.queries()
+        try:
+            with connection.schema_editor() as editor:
+                for model in INDEXED_MODELS:
+                    for index in model._meta.indexes:
+                        editor.remove_index(model, index)
+            before = self.run(queries, options["repeat"])
+        finally:
+            with connection.schema_editor() as editor:
+                for model in INDEXED_MODELS:
+                    for index in model._meta.indexes:
+                        editor.add_index(model, index)
+        after = self.run(queries, options["repeat"])
+
+        for label, _ in queries:
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(f"  without indexes: {before[label][0]:.2f} ms")
+            self.stdout.write(f"  with indexes:    {after[label][0]:.2f} ms")
+            self.stdout.write("  plan without indexes:")
+            self.stdout.write(self.indent(before[label][1]))
+            self.stdout.write("  plan with indexes:")
+            self.stdout.write(self.indent(after[label][1]))
+
+        if not options["keep"]:
+            self.cleanup()
+
+    def queries(self):
+        delivery_note_id = (
+            DeliveryNote.objects.filter(dn_number__startswith=DN_PREFIX)
+            .values_list("id", flat=True)
+            .first()
+        )
+        since = self.now - timedelta(days=7)
+        return [
+            ("Work orders by status, newest first",
+             WorkOrder.objects.filter(status="Approved").order_by("-created_at", "-id")[:50]),
+            ("Latest work orders",
+             WorkOrder.objects.order_by("-created_at", "-id")[:50]),
+            ("Invoices of a delivery note by status",
+             Invoice.objects.filter(delivery_note_id=delivery_note_id, invoice_status="pending")),
+            ("Invoice status counts since last week",
+             Invoice.objects.filter(updated_at__gte=since).order_by().values("invoice_status").annotate(count=Count("id"))),
+            ("Quotations by status, newest first",
+             Quotation.objects.filter(quotation_status="Approved").order_by("-created_at", "-id")[:50]),
+            ("RFQs by status, newest first",
+             RFQ.objects.filter(rfq_status="Pending").order_by("-created_at", "-id")[:50]),
+            ("Purchase orders by status, newest first",
+             PurchaseOrder.objects.filter(status="Collected").order_by("-created_at", "-id")[:50]),
+            ("Highest work order number for a prefix",
+             WorkOrder.objects.filter(wo_number__startswith=WO_PREFIX).order_by("-wo_number").values("wo_number")[:1]),
+        ]
+
+    def run(self, queries, repeat):
+        results = {}
+        for label, queryset in queries:
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                elapsed = (time.perf_counter() - started) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+            results[label] = (best, queryset.explain())
+        return results
+
+    @staticmethod
+    def indent(text):
+        return "\n".join(f"    {line}" for line in str(text).splitlines())
+
+    def created_at(self):
+        return self.now - timedelta(seconds=self.random.randrange(self.days * 86400))
+
+    def load(self, rows):
+        documents = max(rows // 10, 1)
+        with explicit_timestamps(*INDEXED_MODELS):
+            rfq_ids = self.create(RFQ, documents, lambda n: RFQ(
+                company_name=MARKER,
+                rfq_status=self.random.choice(choices(RFQ, "rfq_status")),
+                created_at=self.created_at(),
+            ), RFQ.objects.filter(company_name=MARKER))
+            quotation_ids = self.create(Quotation, documents, lambda n: Quotation(
+                rfq_id=rfq_ids[n],
+                company_name=MARKER,
+                quotation_status=self.random.choice(choices(Quotation, "quotation_status")),
+                next_followup_date=self.now.date(),
+                created_at=self.created_at(),
+            ), Quotation.objects.filter(company_name=MARKER))
+            po_ids = self.create(PurchaseOrder, documents, lambda n: PurchaseOrder(
+                quotation_id=quotation_ids[n],
+                client_po_number=MARKER,
+                status=self.random.choice(choices(PurchaseOrder, "status")),
+                created_at=self.created_at(),
+            ), PurchaseOrder.objects.filter(client_po_number=MARKER))
+            work_order_ids = self.create(WorkOrder, documents, lambda n: WorkOrder(
+                purchase_order_id=po_ids[n],
+                quotation_id=quotation_ids[n],
+                wo_number=f"{WO_PREFIX}{n:07d}",
+                status=self.random.choice(choices(WorkOrder, "status")),
+                created_at=self.created_at(),
+            ), WorkOrder.objects.filter(wo_number__startswith=WO_PREFIX))
+            delivery_note_ids = self.create(DeliveryNote, documents, lambda n: DeliveryNote(
+                work_order_id=work_order_ids[n],
+                dn_number=f"{DN_PREFIX}{n:07d}",
+                delivery_status="Delivered",
+                created_at=self.created_at(),
+            ), DeliveryNote.objects.filter(dn_number__startswith=DN_PREFIX))
+
+            def invoice(n):
+                created_at = self.created_at()
+                return Invoice(
+                    delivery_note_id=self.random.choice(delivery_note_ids),
+                    invoice_status=self.random.choice(choices(Invoice, "invoice_status")),
+                    remarks=MARKER,
+                    created_at=created_at,
+                    updated_at=created_at + timedelta(days=self.random.randrange(30)),
+                )
+
+            self.create(Invoice, rows, invoice)
+
+    def create(self, model, count, build, created=None):
+        """
+        bulk_create ``count`` rows in batches and return the new ids read back
+        from ``created`` (MySQL does not return them from the insert).
+        """
+        for start in range(0, count, self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(
+                    [build(n) for n in range(start, min(start + self.batch_size, count))]
+                )
+        self.stdout.write(f"  {model.__name__}: {count} rows")
+        if created is None:
+            return None
+        return list(created.order_by("id").values_list("id", flat=True))
+
+    def cleanup(self):
+        Invoice.objects.filter(remarks=MARKER).delete()
+        # Quotations, purchase orders, work orders and delivery notes cascade
+        RFQ.objects.filter(company_name=MARKER).delete()
+        self.stdout.write("Removed synthetic rows")
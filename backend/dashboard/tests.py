@@ -0,0 +1,198 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from authapp.models import CustomUser, Permission, Role
+
+from backend.testing import QueryBudgetTestCase, create_order_fixtures
+from job_execution.models import DeliveryNote, Invoice, WorkOrder, WorkOrderItem
+from pre_job.models import Quotation
+from team.models import TeamMember
+
+
+class QueryBudgetTests(QueryBudgetTestCase):
+    """Query budgets for the dashboard and report routes with three full order chains."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=3)
+
+    def test_dashboard_summary(self):
+        self.assertQueryBudget("/api/dashboard/summary/", 8)
+
+    def test_report_routes(self):
+        self.assertQueryBudget("/api/reports/orders/", 6)
+        self.assertQueryBudget("/api/reports/orders/?group_by=invoice_status", 3)
+        self.assertQueryBudget("/api/reports/due-dates/", 3)
+
+    def test_invalid_filters_are_rejected(self):
+        for url, error in (
+            ("/api/reports/orders/?salesperson=abc", "salesperson must be an integer id"),
+            ("/api/reports/due-dates/?salesperson=abc", "salesperson must be an integer id"),
+            ("/api/reports/due-dates/?date_from=2024-02-30", "Invalid 'date_from' value, expected an ISO date"),
+            ("/api/reports/orders/?date_to=2024-13-01", "Invalid 'date_to' value, expected an ISO date"),
+            ("/api/reports/orders/?date_to=soon", "Invalid 'date_to' value, expected an ISO date"),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 400, url)
+            self.assertEqual(response.json(), {"error": error})
+
+
+class ReportTests(QueryBudgetTestCase):
+    """Report rows, buckets, groups and filters on chains with known answers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=4)
+        cls.today = timezone.localdate()
+        work_orders = {wo.wo_number[-1]: wo for wo in WorkOrder.objects.all()}
+        dns = {dn.dn_number[-1]: dn for dn in DeliveryNote.objects.all()}
+
+        # Invoice status: processed wins over raised, which wins over pending
+        Invoice.objects.filter(pk=dns["0"].invoices.first().pk).update(invoice_status="processed")
+        Invoice.objects.filter(pk=dns["1"].invoices.first().pk).update(invoice_status="raised")
+        dns["3"].invoices.update(invoice_status="processed")
+        # A signed note without items is N/A; unsigned and temporary ones are left out
+        DeliveryNote.objects.create(
+            work_order=work_orders["2"], dn_number="TEST-DN-EMPTY",
+            signed_delivery_note="delivery_notes/signed.pdf", delivery_status="Delivered",
+        )
+        DeliveryNote.objects.create(work_order=work_orders["1"], dn_number="TEST-DN-UNSIGNED")
+        DeliveryNote.objects.create(
+            work_order=work_orders["1"], dn_number="TEMP-DN-1",
+            signed_delivery_note="delivery_notes/signed.pdf",
+        )
+
+        # Due dates in days from today; work order 2 keeps the fixture's 0, 5 and 10
+        for number, days in (("0", (-2, 1, 20)), ("1", (6, 8, 9)), ("3", (None, None, None))):
+            for item, offset in zip(work_orders[number].items.order_by("id"), days):
+                WorkOrderItem.objects.filter(pk=item.pk).update(
+                    calibration_due_date=None if offset is None else cls.today + timedelta(days=offset)
+                )
+
+        cls.second = TeamMember.objects.create(name="Second", email="second@example.com")
+        Quotation.objects.filter(series_number__in=["TEST-QUO-002", "TEST-QUO-003"]).update(
+            assigned_sales_person=cls.second
+        )
+        WorkOrder.objects.filter(pk=work_orders["0"].pk).update(
+            created_at=timezone.now() - timedelta(days=30)
+        )
+
+    def results(self, url):
+        response = self.client.get(url + ("&" if "?" in url else "?") + "page_size=100")
+        self.assertEqual(response.status_code, 200, response.content[:500])
+        return response.json()["results"]
+
+    def groups(self, url):
+        return {group["label"]: group["count"] for group in self.results(url)}
+
+    def dn_numbers(self, url):
+        return sorted(row["delivery_note"]["dn_number"] for row in self.results(url))
+
+    def test_order_rows(self):
+        rows = {row["delivery_note"]["dn_number"]: row for row in self.results("/api/reports/orders/")}
+        self.assertEqual(
+            {number: (row["invoice_status"], row["calibration_status"]) for number, row in rows.items()},
+            {
+                "TEST-DN-000": ("processed", "EXPIRED"),
+                "TEST-DN-001": ("raised", "URGENT"),
+                "TEST-DN-002": ("pending", "CRITICAL"),
+                "TEST-DN-EMPTY": ("N/A", "CRITICAL"),
+                "TEST-DN-003": ("processed", "N/A"),
+            },
+        )
+        row = rows["TEST-DN-001"]
+        self.assertEqual(row["earliest_calibration_due_date"], (self.today + timedelta(days=6)).isoformat())
+        self.assertEqual(row["salesperson"]["name"], "Sales")
+        self.assertEqual(row["quotation"]["series_number"], "TEST-QUO-001")
+        self.assertEqual(len(row["work_order"]["items"]), 3)
+        self.assertEqual(row["invoice"]["invoice_status"], "raised")
+
+    def test_order_groups(self):
+        self.assertEqual(
+            self.groups("/api/reports/orders/?group_by=invoice_status"),
+            {"processed": 2, "raised": 1, "pending": 1, "N/A": 1},
+        )
+        self.assertEqual(
+            self.groups("/api/reports/orders/?group_by=calibration_status"),
+            {"CRITICAL": 2, "EXPIRED": 1, "URGENT": 1, "N/A": 1},
+        )
+        self.assertEqual(
+            self.groups("/api/reports/orders/?group_by=salesperson"), {"Second": 3, "Sales": 2}
+        )
+
+    def test_order_filters(self):
+        self.assertEqual(
+            self.dn_numbers("/api/reports/orders/?status=processed"), ["TEST-DN-000", "TEST-DN-003"]
+        )
+        self.assertEqual(
+            self.dn_numbers("/api/reports/orders/?calibration_status=critical"),
+            ["TEST-DN-002", "TEST-DN-EMPTY"],
+        )
+        self.assertEqual(
+            self.dn_numbers(f"/api/reports/orders/?salesperson={self.second.pk}"),
+            ["TEST-DN-002", "TEST-DN-003", "TEST-DN-EMPTY"],
+        )
+        week_ago = (self.today - timedelta(days=7)).isoformat()
+        self.assertEqual(self.dn_numbers(f"/api/reports/orders/?date_to={week_ago}"), ["TEST-DN-000"])
+        self.assertEqual(len(self.results(f"/api/reports/orders/?date_from={week_ago}")), 4)
+
+    def test_due_date_rows_and_groups(self):
+        rows = self.results("/api/reports/due-dates/")
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(
+            [(row["days_left"], row["status"]) for row in rows],
+            [(-2, "OVERDUE"), (0, "TODAY"), (1, "CRITICAL"), (5, "URGENT"), (6, "URGENT"),
+             (8, "OK"), (9, "OK"), (10, "OK"), (20, "OK")],
+        )
+        self.assertEqual(
+            self.groups("/api/reports/due-dates/?group_by=status"),
+            {"OK": 4, "URGENT": 2, "OVERDUE": 1, "TODAY": 1, "CRITICAL": 1},
+        )
+        self.assertEqual(
+            self.groups("/api/reports/due-dates/?group_by=company"),
+            {"Company 0": 3, "Company 1": 3, "Company 2": 3},
+        )
+
+    def test_due_date_filters(self):
+        self.assertEqual(
+            [row["days_left"] for row in self.results("/api/reports/due-dates/?status=urgent")], [5, 6]
+        )
+        date_from, date_to = self.today.isoformat(), (self.today + timedelta(days=5)).isoformat()
+        self.assertEqual(
+            [row["days_left"] for row in self.results(
+                f"/api/reports/due-dates/?date_from={date_from}&date_to={date_to}"
+            )],
+            [0, 1, 5],
+        )
+        self.assertEqual(
+            {row["company_name"] for row in self.results(
+                f"/api/reports/due-dates/?salesperson={self.second.pk}"
+            )},
+            {"Company 2"},
+        )
+
+
+class ReportPermissionTests(QueryBudgetTestCase):
+    """Each report is gated by its own page in the role's permissions."""
+
+    def setUp(self):
+        super().setUp()
+        # New roles get can_view on both report pages by default
+        self.role = Role.objects.create(name="Sales")
+        self.client.force_authenticate(
+            CustomUser.objects.create_user(email="sales@example.com", password="password", role=self.role)
+        )
+
+    def test_report_pages(self):
+        self.assertEqual(self.client.get("/api/reports/orders/").status_code, 200)
+        self.assertEqual(self.client.get("/api/reports/due-dates/").status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            permission = Permission.objects.get(role=self.role, page="due_date_reports")
+            permission.can_view = False
+            permission.save()
+        self.assertEqual(self.client.get("/api/reports/orders/").status_code, 200)
+        self.assertEqual(self.client.get("/api/reports/due-dates/").status_code, 403)
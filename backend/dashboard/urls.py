@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import DashboardSummaryView, DueDateReportView, OrderReportView
+
+urlpatterns = [
+    path("dashboard/summary/", DashboardSummaryView.as_view(), name="dashboard_summary"),
+    path("reports/orders/", OrderReportView.as_view(), name="report_orders"),
+    path("reports/due-dates/", DueDateReportView.as_view(), name="report_due_dates"),
+]
@@ -0,0 +1,479 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import (
+    Case, CharField, Count, Exists, F, Min, OuterRef, Q, Subquery, Value, When,
+)
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from authapp.views import HasPermission
+from backend.pagination import ReportPagination
+from pre_job.models import RFQ, Quotation, PurchaseOrder
+from job_execution.models import (
+    WorkOrder, WorkOrderItem, DeliveryNote, DeliveryNoteItem, Invoice,
+)
+
+# Work orders in these states are finished and can no longer be overdue.
+FINISHED_WORK_ORDER_STATUSES = ["Delivered", "Closed"]
+
+
+def parse_since(value):
+    """Parse the ``since`` query param as an ISO datetime or date."""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        parsed_date = parse_date(value)
+        if parsed_date is None:
+            return None
+        parsed = datetime.combine(parsed_date, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def count_by(queryset, field):
+    return {
+        row[field]: row["count"]
+        for row in queryset.order_by().values(field).annotate(count=Count("id"))
+    }
+
+
+class DashboardSummaryView(APIView):
+    """
+    Dashboard counters computed with aggregate queries.
+
+    Pass ``?since=<ISO datetime>`` to only count records created after that
+    moment (invoices are matched on ``updated_at`` so status changes are
+    picked up). The returned ``generated_at`` can be sent back as the next
+    ``since`` value for incremental polling.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        generated_at = timezone.now()
+        since_param = request.query_params.get("since")
+        since = None
+        if since_param:
+            since = parse_since(since_param)
+            if since is None:
+                return Response(
+                    {"error": "Invalid 'since' value, expected an ISO date or datetime"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        rfqs = RFQ.objects.all()
+        quotations = Quotation.objects.all()
+        purchase_orders = PurchaseOrder.objects.all()
+        work_orders = WorkOrder.objects.all()
+        delivery_notes = DeliveryNote.objects.all()
+        invoices = Invoice.objects.all()
+        if since:
+            rfqs = rfqs.filter(created_at__gte=since)
+            quotations = quotations.filter(created_at__gte=since)
+            purchase_orders = purchase_orders.filter(created_at__gte=since)
+            work_orders = work_orders.filter(created_at__gte=since)
+            delivery_notes = delivery_notes.filter(created_at__gte=since)
+            invoices = invoices.filter(updated_at__gte=since)
+
+        rfq_counts = rfqs.annotate(
+            has_quotation=Exists(Quotation.objects.filter(rfq=OuterRef("pk")))
+        ).aggregate(
+            total=Count("id"),
+            pending_without_quotation=Count(
+                "id", filter=Q(rfq_status="Pending", has_quotation=False)
+            ),
+        )
+        work_order_counts = work_orders.aggregate(
+            total=Count("id"),
+            overdue=Count(
+                "id",
+                filter=Q(expected_completion_date__lt=generated_at.date())
+                & ~Q(status__in=FINISHED_WORK_ORDER_STATUSES),
+            ),
+        )
+        invoice_counts = invoices.aggregate(
+            total=Count("id"),
+            processed=Count("id", filter=Q(invoice_status="processed")),
+        )
+
+        quotation_statuses = count_by(quotations, "quotation_status")
+
+        return Response(
+            {
+                "generated_at": generated_at.isoformat(),
+                "since": since.isoformat() if since else None,
+                "rfqs": rfq_counts,
+                "quotations": {
+                    "total": sum(quotation_statuses.values()),
+                    "by_status": quotation_statuses,
+                },
+                "purchase_orders": {"total": purchase_orders.count()},
+                "work_orders": {
+                    **work_order_counts,
+                    "by_status": count_by(work_orders, "status"),
+                },
+                "delivery_notes": {"total": delivery_notes.count()},
+                "invoices": {
+                    **invoice_counts,
+                    "by_status": count_by(invoices, "invoice_status"),
+                },
+            }
+        )
+
+
+# Report paths from a work order up the sales chain
+PO = "work_order__purchase_order"
+QUOTATION = f"{PO}__quotation"
+RFQ_PATH = f"{QUOTATION}__rfq"
+
+
+def parse_report_date(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        # Well formed but impossible, e.g. 2024-02-30
+        parsed = None
+    if parsed is None:
+        raise ValidationError({"error": f"Invalid '{name}' value, expected an ISO date"})
+    return parsed
+
+
+def start_of_day(value):
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def signed_delivery_notes():
+    """Delivery notes the reports count: numbered and with a signed copy."""
+    return (
+        DeliveryNote.objects.filter(dn_number__isnull=False)
+        .exclude(dn_number__startswith="TEMP-DN")
+        .exclude(signed_delivery_note="")
+        .exclude(signed_delivery_note__isnull=True)
+    )
+
+
+def due_date_buckets(field, today, buckets):
+    """Case expression naming the first ``(label, max days from today)`` bucket ``field`` falls in."""
+    whens = [When(**{f"{field}__isnull": True}, then=Value("N/A"))]
+    for label, days in buckets:
+        whens.append(When(**{f"{field}__lte": today + timedelta(days=days)}, then=Value(label)))
+    return Case(*whens, default=Value("OK"), output_field=CharField())
+
+
+class ReportView(APIView):
+    """
+    Base for report endpoints: filtering, ordering, joins and grouping run in
+    the database and only the requested page of rows is serialized.
+
+    ``?group_by=<name>`` returns ``{key, label, count}`` groups instead of
+    rows. Both forms are paginated with ``?page`` and ``?page_size``.
+    """
+
+    permission_classes = [HasPermission]
+    pagination_class = ReportPagination
+    # name -> (key lookup, label lookup)
+    group_choices = {}
+    # name -> order_by() arguments; "-name" reverses
+    ordering_choices = {}
+    default_ordering = None
+    search_fields = ()
+    row_fields = ()
+
+    def get_queryset(self, today):
+        raise NotImplementedError
+
+    def filter_queryset(self, queryset, today):
+        search = self.request.query_params.get("search", "").strip()
+        if search:
+            query = Q()
+            for field in self.search_fields:
+                query |= Q(**{f"{field}__icontains": search})
+            queryset = queryset.filter(query)
+        salesperson = self.request.query_params.get("salesperson")
+        if salesperson:
+            try:
+                salesperson = int(salesperson)
+            except ValueError:
+                raise ValidationError({"error": "salesperson must be an integer id"})
+            queryset = queryset.filter(**{f"{QUOTATION}__assigned_sales_person": salesperson})
+        return queryset
+
+    def order_queryset(self, queryset):
+        ordering = self.request.query_params.get("ordering") or self.default_ordering
+        descending = ordering.startswith("-")
+        expressions = self.ordering_choices.get(ordering.lstrip("-"))
+        if expressions is None:
+            raise ValidationError({
+                "error": f"Invalid ordering, expected one of: {', '.join(self.ordering_choices)}"
+            })
+        return queryset.order_by(*(
+            F(name).desc(nulls_last=True) if descending else F(name).asc(nulls_last=True)
+            for name in expressions
+        ))
+
+    def get(self, request):
+        today = timezone.localdate()
+        queryset = self.filter_queryset(self.get_queryset(today), today)
+        paginator = self.pagination_class()
+        group_by = request.query_params.get("group_by")
+        if group_by:
+            if group_by not in self.group_choices:
+                raise ValidationError({
+                    "error": f"Invalid group_by, expected one of: {', '.join(self.group_choices)}"
+                })
+            key, label = self.group_choices[group_by]
+            groups = (
+                queryset.order_by()
+                .values(key=F(key), label=F(label))
+                .annotate(count=Count("id"))
+                .order_by("-count", "key")
+            )
+            page = paginator.paginate_queryset(groups, request, view=self)
+            return paginator.get_paginated_response(page)
+        rows = self.order_queryset(queryset).values(*self.row_fields)
+        page = paginator.paginate_queryset(rows, request, view=self)
+        return paginator.get_paginated_response(self.build_rows(page, today))
+
+    def build_rows(self, rows, today):
+        return rows
+
+
+class OrderReportView(ReportView):
+    """
+    One row per signed delivery note with its work order, purchase order,
+    quotation, RFQ, channel and first invoice.
+
+    Filters: ``date_from``/``date_to`` (work order creation date),
+    ``status`` (invoice status), ``calibration_status``, ``work_order_status``,
+    ``salesperson`` (team member id) and ``search``.
+    """
+
+    page_name = "view_reports"
+    group_choices = {
+        "salesperson": (f"{QUOTATION}__assigned_sales_person", f"{QUOTATION}__assigned_sales_person__name"),
+        "channel": (f"{RFQ_PATH}__rfq_channel", f"{RFQ_PATH}__rfq_channel__channel_name"),
+        "invoice_status": ("invoice_status", "invoice_status"),
+        "calibration_status": ("calibration_status", "calibration_status"),
+        "work_order_status": ("work_order__status", "work_order__status"),
+    }
+    ordering_choices = {
+        "created_at": ("work_order__created_at", "id"),
+        "calibration_due": ("earliest_calibration_due_date", "id"),
+    }
+    default_ordering = "-created_at"
+    search_fields = (
+        f"{RFQ_PATH}__series_number",
+        f"{QUOTATION}__series_number",
+        f"{QUOTATION}__company_name",
+        f"{PO}__series_number",
+        "work_order__wo_number",
+        "dn_number",
+    )
+    row_fields = (
+        "id", "dn_number", "work_order_id", "work_order__wo_number",
+        "work_order__status", "work_order__created_at",
+        f"{PO}_id", f"{PO}__series_number",
+        f"{QUOTATION}_id", f"{QUOTATION}__series_number", f"{QUOTATION}__company_name",
+        f"{RFQ_PATH}_id", f"{RFQ_PATH}__series_number",
+        f"{RFQ_PATH}__rfq_channel_id", f"{RFQ_PATH}__rfq_channel__channel_name",
+        f"{QUOTATION}__assigned_sales_person_id", f"{QUOTATION}__assigned_sales_person__name",
+        "invoice_status", "calibration_status", "earliest_calibration_due_date",
+        "first_invoice_id",
+    )
+
+    def get_queryset(self, today):
+        invoices = Invoice.objects.filter(delivery_note=OuterRef("pk"))
+        earliest_due = (
+            WorkOrderItem.objects.filter(
+                work_order=OuterRef("work_order"), calibration_due_date__isnull=False
+            )
+            .order_by()
+            .values("work_order")
+            .annotate(first=Min("calibration_due_date"))
+            .values("first")
+        )
+        return signed_delivery_notes().annotate(
+            first_invoice_id=Subquery(invoices.order_by("id").values("id")[:1]),
+            invoice_status=Case(
+                When(~Exists(DeliveryNoteItem.objects.filter(delivery_note=OuterRef("pk"))), then=Value("N/A")),
+                When(Exists(invoices.filter(invoice_status="processed")), then=Value("processed")),
+                When(Exists(invoices.filter(invoice_status="raised")), then=Value("raised")),
+                default=Value("pending"),
+                output_field=CharField(),
+            ),
+            earliest_calibration_due_date=Subquery(earliest_due),
+        ).annotate(
+            calibration_status=due_date_buckets(
+                "earliest_calibration_due_date", today,
+                [("EXPIRED", -1), ("CRITICAL", 3), ("URGENT", 7)],
+            ),
+        )
+
+    def filter_queryset(self, queryset, today):
+        queryset = super().filter_queryset(queryset, today)
+        params = self.request.query_params
+        date_from = parse_report_date(self.request, "date_from")
+        date_to = parse_report_date(self.request, "date_to")
+        if date_from:
+            queryset = queryset.filter(work_order__created_at__gte=start_of_day(date_from))
+        if date_to:
+            queryset = queryset.filter(work_order__created_at__lt=start_of_day(date_to + timedelta(days=1)))
+        if params.get("status"):
+            queryset = queryset.filter(invoice_status=params["status"])
+        if params.get("calibration_status"):
+            queryset = queryset.filter(calibration_status=params["calibration_status"].upper())
+        if params.get("work_order_status"):
+            queryset = queryset.filter(work_order__status=params["work_order_status"])
+        return queryset
+
+    def build_rows(self, rows, today):
+        invoices = Invoice.objects.in_bulk(
+            [row["first_invoice_id"] for row in rows if row["first_invoice_id"]]
+        )
+        items = {}
+        for item in (
+            WorkOrderItem.objects.filter(work_order_id__in={row["work_order_id"] for row in rows})
+            .order_by("id")
+            .values("id", "work_order_id", "item_id", "item__name", "calibration_due_date", "uuc_serial_number")
+        ):
+            items.setdefault(item["work_order_id"], []).append({
+                "id": item["id"],
+                "item": item["item_id"],
+                "item_name": item["item__name"],
+                "calibration_due_date": item["calibration_due_date"],
+                "uuc_serial_number": item["uuc_serial_number"],
+            })
+        return [
+            {
+                "id": f"wo-{row['work_order_id']}-dn-{row['id']}",
+                "rfq": {"id": row[f"{RFQ_PATH}_id"], "series_number": row[f"{RFQ_PATH}__series_number"]},
+                "quotation": {
+                    "id": row[f"{QUOTATION}_id"],
+                    "series_number": row[f"{QUOTATION}__series_number"],
+                    "company_name": row[f"{QUOTATION}__company_name"],
+                },
+                "purchase_order": {"id": row[f"{PO}_id"], "series_number": row[f"{PO}__series_number"]},
+                "work_order": {
+                    "id": row["work_order_id"],
+                    "wo_number": row["work_order__wo_number"],
+                    "status": row["work_order__status"],
+                    "created_at": row["work_order__created_at"],
+                    "items": items.get(row["work_order_id"], []),
+                },
+                "delivery_note": {"id": row["id"], "dn_number": row["dn_number"]},
+                "channel": {
+                    "id": row[f"{RFQ_PATH}__rfq_channel_id"],
+                    "channel_name": row[f"{RFQ_PATH}__rfq_channel__channel_name"],
+                },
+                "salesperson": {
+                    "id": row[f"{QUOTATION}__assigned_sales_person_id"],
+                    "name": row[f"{QUOTATION}__assigned_sales_person__name"],
+                },
+                "invoice": self.invoice_data(invoices.get(row["first_invoice_id"])),
+                "invoice_status": row["invoice_status"],
+                "calibration_status": row["calibration_status"],
+                "earliest_calibration_due_date": row["earliest_calibration_due_date"],
+            }
+            for row in rows
+        ]
+
+    def invoice_data(self, invoice):
+        if invoice is None:
+            return None
+        due_date = None
+        if invoice.due_in_days:
+            due_date = invoice.created_at.date() + timedelta(days=invoice.due_in_days)
+        return {
+            "id": invoice.id,
+            "invoice_status": invoice.invoice_status,
+            "created_at": invoice.created_at,
+            "due_in_days": invoice.due_in_days,
+            "due_date": due_date,
+            "received_date": invoice.received_date,
+            "final_invoice_file": self.file_url(invoice.final_invoice_file),
+            "processed_certificate_file": self.file_url(invoice.processed_certificate_file),
+        }
+
+    def file_url(self, file):
+        return self.request.build_absolute_uri(file.url) if file else None
+
+
+class DueDateReportView(ReportView):
+    """
+    One row per work order item with a calibration due date, for work orders
+    that have at least one signed delivery note.
+
+    Filters: ``date_from``/``date_to`` (due date), ``status`` (OVERDUE,
+    TODAY, CRITICAL, URGENT, OK), ``salesperson`` and ``search``.
+    """
+
+    page_name = "due_date_reports"
+    group_choices = {
+        "company": (f"{QUOTATION}__company_name", f"{QUOTATION}__company_name"),
+        "salesperson": (f"{QUOTATION}__assigned_sales_person", f"{QUOTATION}__assigned_sales_person__name"),
+        "status": ("due_status", "due_status"),
+    }
+    ordering_choices = {
+        "due_date": ("calibration_due_date", "id"),
+        "company": (f"{QUOTATION}__company_name", "calibration_due_date", "id"),
+    }
+    default_ordering = "due_date"
+    search_fields = (
+        f"{QUOTATION}__company_name",
+        "work_order__wo_number",
+        "item__name",
+        "uuc_serial_number",
+    )
+    row_fields = (
+        "id", "work_order_id", "work_order__wo_number", f"{QUOTATION}__company_name",
+        "item_id", "item__name", "uuc_serial_number", "calibration_due_date", "due_status",
+    )
+
+    def get_queryset(self, today):
+        return WorkOrderItem.objects.filter(
+            calibration_due_date__isnull=False,
+        ).filter(
+            Exists(signed_delivery_notes().filter(work_order=OuterRef("work_order")))
+        ).annotate(
+            due_status=due_date_buckets(
+                "calibration_due_date", today,
+                [("OVERDUE", -1), ("TODAY", 0), ("CRITICAL", 3), ("URGENT", 7)],
+            ),
+        )
+
+    def filter_queryset(self, queryset, today):
+        queryset = super().filter_queryset(queryset, today)
+        date_from = parse_report_date(self.request, "date_from")
+        date_to = parse_report_date(self.request, "date_to")
+        if date_from:
+            queryset = queryset.filter(calibration_due_date__gte=date_from)
+        if date_to:
+            queryset = queryset.filter(calibration_due_date__lte=date_to)
+        if self.request.query_params.get("status"):
+            queryset = queryset.filter(due_status=self.request.query_params["status"].upper())
+        return queryset
+
+    def build_rows(self, rows, today):
+        return [
+            {
+                "id": row["id"],
+                "work_order": row["work_order_id"],
+                "wo_number": row["work_order__wo_number"],
+                "company_name": row[f"{QUOTATION}__company_name"],
+                "item": row["item_id"],
+                "item_name": row["item__name"],
+                "serial_number": row["uuc_serial_number"],
+                "due_date": row["calibration_due_date"],
+                "days_left": (row["calibration_due_date"] - today).days,
+                "status": row["due_status"],
+            }
+            for row in rows
+        ]
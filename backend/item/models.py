@@ -1,8 +1,17 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.etags import bump_collection_version
 
 class Item(models.Model):
     name = models.CharField(max_length=255, unique=True, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+@receiver([post_save, post_delete], sender=Item)
+def bump_items_version(sender, **kwargs):
+    bump_collection_version(sender)
@@ -1,3 +1,38 @@
-from django.test import TestCase
+from backend.relations import resolve_pks, row_cache
+from backend.testing import QueryBudgetTestCase
 
-# Create your tests here.
+from .models import Item
+
+
+class ConditionalGetTests(QueryBudgetTestCase):
+    def test_not_modified_until_an_item_changes(self):
+        Item.objects.create(name="Multimeter")
+        etag = self.client.get("/api/items/")["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/items/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Item.objects.create(name="Oscilloscope")
+        response = self.client.get("/api/items/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+
+
+class RowCacheTests(QueryBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        row_cache.clear()
+
+    def test_cached_rows_until_the_collection_changes(self):
+        item = Item.objects.create(name="Multimeter")
+        with self.assertNumQueries(1):
+            self.assertEqual(resolve_pks(Item.objects.all(), [item.pk, str(item.pk)], cached=True)[item.pk], item)
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_pks(Item.objects.all(), [str(item.pk)], cached=True)[str(item.pk)].name, "Multimeter")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            item.name = "Clamp meter"
+            item.save()
+        self.assertEqual(resolve_pks(Item.objects.all(), [item.pk], cached=True)[item.pk].name, "Clamp meter")
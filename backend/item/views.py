@@ -2,8 +2,10 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from .models import Item
 from .serializers import  ItemSerializer
+from backend.mixins import ConditionalGetMixin
 
-class ItemViewSet(viewsets.ModelViewSet):
+class ItemViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Item.objects.all()
+    etag_models = (Item,)
     serializer_class = ItemSerializer
     permission_classes = [AllowAny]
\ No newline at end of file
@@ -0,0 +1,133 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from item.models import Item
+from job_execution.models import (
+    DeliveryNote,
+    DeliveryNoteItem,
+    DeliveryNoteItemComponent,
+    WorkOrder,
+    WorkOrderItem,
+)
+from job_execution.views import WorkOrderViewSet
+from team.models import Technician
+from unit.models import Unit
+
+# Synthetic rows carry these markers so they can be found and removed again
+WO_PREFIX = "BENCH-WOL-"
+DN_PREFIX = "BENCH-DNL-"
+MARKER = "__benchmark__"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load synthetic work orders and count the queries and time needed to "
+        "serialize them with and without the WorkOrderViewSet read plan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=1000, help="Work orders to create")
+        parser.add_argument("--items", type=int, default=5, help="Items per work order and delivery note")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--skip-baseline", action="store_true", help="Only measure the read plan")
+        parser.add_argument("--keep", action="store_true", help="Keep the synthetic rows afterwards")
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG:
+            raise CommandError("Refusing to load synthetic rows with DEBUG off; run this against a local database.")
+        self.batch_size = options["batch_size"]
+        try:
+            started = time.perf_counter()
+            self.load(options["count"], options["items"])
+            self.stdout.write(f"Loaded synthetic rows in {time.perf_counter() - started:.1f}s")
+            view = self.list_view()
+            work_orders = WorkOrder.objects.filter(wo_number__startswith=WO_PREFIX)
+            runs = [("with read plan", view.with_read_plan(work_orders))]
+            if not options["skip_baseline"]:
+                runs.append(("without read plan", work_orders))
+            for label, queryset in runs:
+                queries, elapsed, rows = self.measure(view, queryset)
+                self.stdout.write(self.style.MIGRATE_HEADING(f"{rows} work orders {label}"))
+                self.stdout.write(f"  queries: {queries}")
+                self.stdout.write(f"  time:    {elapsed:.0f} ms")
+        finally:
+            if not options["keep"]:
+                self.cleanup()
+
+    @staticmethod
+    def list_view():
+        """A WorkOrderViewSet set up as for GET /api/work-orders/."""
+        view = WorkOrderViewSet(action_map={"get": "list"}, format_kwarg=None)
+        view.request = view.initialize_request(APIRequestFactory().get("/api/work-orders/"))
+        return view
+
+    @staticmethod
+    def measure(view, queryset):
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as context:
+            data = view.get_serializer(queryset.order_by("id"), many=True).data
+        elapsed = (time.perf_counter() - started) * 1000
+        return len(context.captured_queries), elapsed, len(data)
+
+    def load(self, count, lines):
+        unit = Unit.objects.create(name=MARKER)
+        technician = Technician.objects.create(name=MARKER, email="benchmark@example.com")
+        Item.objects.bulk_create([Item(name=f"{MARKER}{index}") for index in range(lines)])
+        items = list(Item.objects.filter(name__startswith=MARKER).order_by("id"))
+
+        work_order_ids = self.create(WorkOrder, count, lambda n: WorkOrder(
+            wo_number=f"{WO_PREFIX}{n:07d}",
+            status="Approved",
+        ), WorkOrder.objects.filter(wo_number__startswith=WO_PREFIX))
+        self.create(WorkOrderItem, count * lines, lambda n: WorkOrderItem(
+            work_order_id=work_order_ids[n // lines],
+            item=items[n % lines],
+            quantity=1,
+            unit=unit,
+            unit_price=10,
+            assigned_to=technician,
+        ))
+        delivery_note_ids = self.create(DeliveryNote, count, lambda n: DeliveryNote(
+            work_order_id=work_order_ids[n],
+            dn_number=f"{DN_PREFIX}{n:07d}",
+            delivery_status="Delivered",
+        ), DeliveryNote.objects.filter(dn_number__startswith=DN_PREFIX))
+        delivery_note_item_ids = self.create(DeliveryNoteItem, count * lines, lambda n: DeliveryNoteItem(
+            delivery_note_id=delivery_note_ids[n // lines],
+            item=items[n % lines],
+            quantity=1,
+            uom=unit,
+        ), DeliveryNoteItem.objects.filter(delivery_note__dn_number__startswith=DN_PREFIX))
+        self.create(DeliveryNoteItemComponent, count * lines, lambda n: DeliveryNoteItemComponent(
+            delivery_note_item_id=delivery_note_item_ids[n],
+            component="Range",
+            value="0-10",
+        ))
+
+    def create(self, model, count, build, created=None):
+        """
+        bulk_create ``count`` rows in batches and return the new ids read back
+        from ``created`` (MySQL does not return them from the insert).
+        """
+        for start in range(0, count, self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(
+                    [build(n) for n in range(start, min(start + self.batch_size, count))]
+                )
+        self.stdout.write(f"  {model.__name__}: {count} rows")
+        if created is None:
+            return None
+        return list(created.order_by("id").values_list("id", flat=True))
+
+    def cleanup(self):
+        # Items, delivery notes and their components cascade
+        WorkOrder.objects.filter(wo_number__startswith=WO_PREFIX).delete()
+        Item.objects.filter(name__startswith=MARKER).delete()
+        Unit.objects.filter(name=MARKER).delete()
+        Technician.objects.filter(name=MARKER).delete()
+        self.stdout.write("Removed synthetic rows")
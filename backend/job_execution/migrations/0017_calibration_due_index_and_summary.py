@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('item', '0001_initial'),
+        ('job_execution', '0016_invoice_remarks_invoice_signed_invoice_file'),
+        ('team', '0002_technician'),
+        ('unit', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalibrationDueSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_date', models.DateField()),
+                ('customer', models.CharField(blank=True, default='', max_length=100)),
+                ('item_count', models.PositiveIntegerField(default=0)),
+                ('work_order_count', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='workorderitem',
+            index=models.Index(fields=['calibration_due_date', 'work_order'], name='wo_item_calibration_due_idx'),
+        ),
+        migrations.AddField(
+            model_name='calibrationduesummary',
+            name='technician',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='team.technician'),
+        ),
+        migrations.AddIndex(
+            model_name='calibrationduesummary',
+            index=models.Index(fields=['due_date', 'customer'], name='calibration_summary_due_idx'),
+        ),
+    ]
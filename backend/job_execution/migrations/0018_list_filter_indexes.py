@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_execution', '0017_calibration_due_index_and_summary'),
+        ('pre_job', '0022_document_totals'),
+        ('series', '0002_seriescounter'),
+        ('team', '0002_technician'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='deliverynote',
+            index=models.Index(fields=['created_at'], name='dn_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['delivery_note', 'invoice_status'], name='invoice_dn_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['invoice_status', 'updated_at'], name='invoice_status_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['created_at'], name='invoice_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workorder',
+            index=models.Index(fields=['status', 'created_at'], name='wo_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workorder',
+            index=models.Index(fields=['created_at'], name='wo_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 07:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_execution', '0020_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calibrationduesummary',
+            name='work_order_share',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
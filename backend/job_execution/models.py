@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from backend.etags import bump_collection_version
 from pre_job.models import PurchaseOrder, Quotation
 from item.models import Item
 from unit.models import Unit
@@ -55,6 +58,7 @@ class WorkOrder(models.Model):
     site_location = models.TextField(null=True, blank=True)
     remarks = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     manager_approval_status = models.CharField(
         max_length=20,
         choices=[
@@ -80,6 +84,12 @@ class WorkOrder(models.Model):
     )
     application_status = models.CharField(max_length=20, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="wo_status_created_idx"),
+            models.Index(fields=["created_at"], name="wo_created_idx"),
+        ]
+
     def __str__(self):
         return f"WO {self.wo_number} - {self.quotation.company_name or 'Unnamed'}"
 
@@ -111,10 +121,49 @@ class WorkOrderItem(models.Model):
         related_name="work_order_items",
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["calibration_due_date", "work_order"],
+                name="wo_item_calibration_due_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.item} - {self.work_order}"
 
 
+class CalibrationDueSummary(models.Model):
+    """
+    Daily snapshot of calibration due dates per customer and technician,
+    rebuilt by the refresh_calibration_due_summary beat task.
+    """
+
+    due_date = models.DateField()
+    customer = models.CharField(max_length=100, blank=True, default="")
+    technician = models.ForeignKey(
+        Technician,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    item_count = models.PositiveIntegerField(default=0)
+    work_order_count = models.PositiveIntegerField(default=0)
+    # Each work order due on a date is credited to one of its technician rows,
+    # so shares (unlike work_order_count) add up across technicians
+    work_order_share = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["due_date", "customer"], name="calibration_summary_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.due_date} - {self.customer or 'Unnamed'} ({self.item_count})"
+
+
 class DeliveryNote(models.Model):
     work_order = models.ForeignKey(
         WorkOrder, on_delete=models.CASCADE, related_name="delivery_notes"
@@ -131,6 +180,12 @@ class DeliveryNote(models.Model):
         NumberSeries, on_delete=models.SET_NULL, null=True, blank=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="dn_created_idx"),
+        ]
 
     def __str__(self):
         return f"DN {self.dn_number} - {self.work_order.wo_number}"
@@ -209,8 +264,25 @@ class Invoice(models.Model):
     received_date = models.DateField(null=True, blank=True)
     payment_reference_number = models.CharField(max_length=100, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     remarks = models.TextField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["delivery_note", "invoice_status"], name="invoice_dn_status_idx"),
+            models.Index(fields=["invoice_status", "updated_at"], name="invoice_status_updated_idx"),
+            models.Index(fields=["created_at"], name="invoice_created_idx"),
+        ]
+
     def __str__(self):
         return f"Invoice for DN {self.delivery_note.dn_number} - Status: {self.invoice_status}"
+
+
+@receiver([post_save, post_delete], sender=WorkOrder)
+@receiver([post_save, post_delete], sender=WorkOrderItem)
+@receiver([post_save, post_delete], sender=DeliveryNote)
+@receiver([post_save, post_delete], sender=DeliveryNoteItem)
+@receiver([post_save, post_delete], sender=DeliveryNoteItemComponent)
+@receiver([post_save, post_delete], sender=Invoice)
+def bump_documents_version(sender, **kwargs):
+    bump_collection_version(sender)
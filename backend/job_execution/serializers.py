@@ -11,15 +11,15 @@ from pre_job.models import PurchaseOrder, Quotation
 from item.models import Item
 from unit.models import Unit
 from series.models import NumberSeries
+from series.services import SeriesAllocator
 from team.models import Technician
-from django.db.models import Max
-from django.core.mail import send_mail
-from django.conf import settings
 from django.utils import timezone
 from datetime import date, timedelta
 import logging
 from authapp.models import CustomUser, Role
-from pre_job.tasks import send_invoice_status_email_task
+from pre_job.emails import queue_invoice_status_email
+from backend.mixins import DynamicFieldsMixin
+from backend.relations import BatchedListSerializer, BatchedPrimaryKeyRelatedField
 
 logger = logging.getLogger(__name__)
 
@@ -31,16 +31,17 @@ class DeliveryNoteItemComponentSerializer(serializers.ModelSerializer):
 
 
 class DeliveryNoteItemSerializer(serializers.ModelSerializer):
-    item = serializers.PrimaryKeyRelatedField(
-        queryset=Item.objects.all(), allow_null=True
+    item = BatchedPrimaryKeyRelatedField(
+        cached=True, queryset=Item.objects.all(), allow_null=True
     )
-    uom = serializers.PrimaryKeyRelatedField(
-        queryset=Unit.objects.all(), allow_null=True
+    uom = BatchedPrimaryKeyRelatedField(
+        cached=True, queryset=Unit.objects.all(), allow_null=True
     )
     components = DeliveryNoteItemComponentSerializer(many=True, required=False)
 
     class Meta:
         model = DeliveryNoteItem
+        list_serializer_class = BatchedListSerializer
         fields = [
             "id",
             "item",
@@ -88,7 +89,7 @@ class DeliveryNoteItemSerializer(serializers.ModelSerializer):
 
 
 
-class DeliveryNoteSerializer(serializers.ModelSerializer):
+class DeliveryNoteSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     work_order_id = serializers.PrimaryKeyRelatedField(
         source="work_order", read_only=True
     )
@@ -160,14 +161,14 @@ class InitiateDeliverySerializer(serializers.Serializer):
 
 
 class WorkOrderItemSerializer(serializers.ModelSerializer):
-    item = serializers.PrimaryKeyRelatedField(
-        queryset=Item.objects.all(), allow_null=True
+    item = BatchedPrimaryKeyRelatedField(
+        cached=True, queryset=Item.objects.all(), allow_null=True
     )
-    unit = serializers.PrimaryKeyRelatedField(
-        queryset=Unit.objects.all(), allow_null=True
+    unit = BatchedPrimaryKeyRelatedField(
+        cached=True, queryset=Unit.objects.all(), allow_null=True
     )
-    assigned_to = serializers.PrimaryKeyRelatedField(
-        queryset=Technician.objects.all(), allow_null=True, required=False
+    assigned_to = BatchedPrimaryKeyRelatedField(
+        cached=True, queryset=Technician.objects.all(), allow_null=True, required=False
     )
     total_price = serializers.SerializerMethodField()
     calibration_date = serializers.DateField(
@@ -179,6 +180,7 @@ class WorkOrderItemSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = WorkOrderItem
+        list_serializer_class = BatchedListSerializer
         fields = [
             "id",
             "item",
@@ -222,7 +224,7 @@ class WorkOrderItemSerializer(serializers.ModelSerializer):
 
 
 
-class InvoiceSerializer(serializers.ModelSerializer):
+class InvoiceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     delivery_note_id = serializers.PrimaryKeyRelatedField(
         source="delivery_note", queryset=DeliveryNote.objects.all()
     )
@@ -285,114 +287,6 @@ class InvoiceSerializer(serializers.ModelSerializer):
 
         return data
 
-    def send_invoice_status_change_email(self, invoice, new_status):
-        email_sent = False
-        recipient_list = []
-        work_order = invoice.delivery_note.work_order
-
-        if (
-            work_order.quotation
-            and work_order.quotation.assigned_sales_person
-            and work_order.quotation.assigned_sales_person.email
-        ):
-            recipient_list.append(
-                (
-                    work_order.quotation.assigned_sales_person.email,
-                    work_order.quotation.assigned_sales_person.name,
-                )
-            )
-
-        if settings.ADMIN_EMAIL:
-            recipient_list.append((settings.ADMIN_EMAIL, None))
-
-        superadmin_role = Role.objects.filter(name="Superadmin").first()
-        if superadmin_role:
-            superadmin_users = CustomUser.objects.filter(role=superadmin_role)
-            for user in superadmin_users:
-                if user.email:
-                    recipient_list.append((user.email, user.name or user.username))
-
-        recipient_dict = {email: name for email, name in recipient_list}
-        recipient_list = [(email, name) for email, name in recipient_dict.items()]
-
-        if recipient_list:
-            for email, name in recipient_list:
-                salutation = (
-                    "Dear Admin"
-                    if email == settings.ADMIN_EMAIL
-                    else f"Dear {name}" if name else "Dear Recipient"
-                )
-
-                # UPDATED: Better messaging for optional files
-                if new_status == "raised":
-                    subject = f"Invoice #{invoice.id} Raised - Action Required"
-                    file_info = f"📄 Final Invoice File: {'Uploaded ✓' if invoice.final_invoice_file else 'Pending upload'}"
-                    due_info = (
-                        f"⏰ Due in Days: {invoice.due_in_days or 'Not specified'}"
-                    )
-                    action_message = (
-                        "The invoice has been raised and requires your attention."
-                    )
-                elif new_status == "processed":
-                    subject = f"Invoice #{invoice.id} Processed - Payment Received"
-                    file_info = f"📄 Processed Certificate File: {'Uploaded ✓' if invoice.processed_certificate_file else 'Pending upload'}"
-                    due_info = (
-                        f"📅 Received Date: {invoice.received_date or 'Not specified'}"
-                    )
-                    action_message = "The invoice has been marked as processed. Payment has been received."
-                else:
-                    subject = f"Invoice #{invoice.id} Status Changed to {new_status}"
-                    file_info = ""
-                    due_info = ""
-                    action_message = (
-                        f"The invoice status has been updated to {new_status}."
-                    )
-
-                message = (
-                    f"{salutation},\n\n"
-                    f"{action_message}\n\n"
-                    f"Invoice Details:\n"
-                    f"------------------------------------------------------------\n"
-                    f"🔹 Work Order Number: {work_order.wo_number}\n"
-                    f"🔹 Delivery Note Number: {invoice.delivery_note.dn_number}\n"
-                    f"🔹 Invoice ID: {invoice.id}\n"
-                    f"🔹 Project: {work_order.quotation.company_name if work_order.quotation else 'Unnamed'}\n"
-                    f"🔹 New Invoice Status: {new_status.upper()}\n"
-                )
-
-                if due_info:
-                    message += f"{due_info}\n"
-                if file_info:
-                    message += f"{file_info}\n"
-
-                message += (
-                    f"------------------------------------------------------------\n"
-                    f"Please log in to your PrimeCRM dashboard to review the details and take any necessary actions.\n\n"
-                    f"Best regards,\n"
-                    f"PrimeCRM Team\n"
-                    f"---\n"
-                    f"This is an automated message. Please do not reply to this email."
-                )
-
-                try:
-                    send_mail(
-                        subject=subject,
-                        message=message,
-                        from_email=settings.EMAIL_HOST_USER,
-                        recipient_list=[email],
-                        fail_silently=False,
-                    )
-                    email_sent = True
-                    logger.info(
-                        f"Invoice status change email sent to {email} for Invoice #{invoice.id}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send invoice status change email to {email} for Invoice #{invoice.id}: {str(e)}"
-                    )
-
-        return email_sent
-
     def create(self, validated_data):
         invoice = Invoice.objects.create(**validated_data)
         new_status = validated_data.get("invoice_status")
@@ -424,11 +318,14 @@ class InvoiceSerializer(serializers.ModelSerializer):
     
     def send_invoice_status_change_email(self, invoice, new_status):
         """
-        Sends invoice status email asynchronously using Celery
+        Queues the invoice status email in the notifications outbox
         """
         try:
-            from pre_job.tasks import send_invoice_status_email_task
-            send_invoice_status_email_task.delay(invoice.id, new_status)
+            queue_invoice_status_email(
+                invoice,
+                new_status,
+                idempotency_key=f"invoice-status:{invoice.id}:{new_status}:{invoice.updated_at.timestamp()}",
+            )
             logger.info(f"Invoice status email queued for Invoice #{invoice.id} - Status: {new_status}")
             return True
         except Exception as e:
@@ -439,15 +336,15 @@ class InvoiceSerializer(serializers.ModelSerializer):
 
 
 
-class WorkOrderSerializer(serializers.ModelSerializer):
+class WorkOrderSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     purchase_order = serializers.PrimaryKeyRelatedField(
         queryset=PurchaseOrder.objects.all(), allow_null=True
     )
     quotation = serializers.PrimaryKeyRelatedField(
         queryset=Quotation.objects.all(), allow_null=True
     )
-    created_by = serializers.PrimaryKeyRelatedField(
-        queryset=Technician.objects.all(), allow_null=True, required=False
+    created_by = BatchedPrimaryKeyRelatedField(
+        cached=True, queryset=Technician.objects.all(), allow_null=True, required=False
     )
     items = WorkOrderItemSerializer(many=True, required=False)
     delivery_notes = DeliveryNoteSerializer(many=True, read_only=True)
@@ -568,14 +465,9 @@ class WorkOrderSerializer(serializers.ModelSerializer):
         else:
             validated_data["created_by"] = None
         try:
-            wo_series = NumberSeries.objects.get(series_name="Work Order")
+            wo_number = SeriesAllocator("Work Order", WorkOrder, "wo_number").allocate()
         except NumberSeries.DoesNotExist:
             raise serializers.ValidationError("Work Order series not found.")
-        max_sequence = WorkOrder.objects.filter(
-            wo_number__startswith=wo_series.prefix
-        ).aggregate(Max("wo_number"))["wo_number__max"]
-        sequence = 1 if not max_sequence else int(max_sequence.split("-")[-1]) + 1
-        wo_number = f"{wo_series.prefix}-{sequence:06d}"
         work_order = WorkOrder.objects.create(
             wo_number=wo_number,
             purchase_order=validated_data.get("purchase_order"),
@@ -611,3 +503,57 @@ class WorkOrderSerializer(serializers.ModelSerializer):
                 WorkOrderItem.objects.create(work_order=instance, **item_data)
                 logger.info(f"Updated items for WorkOrder {instance.id}")
         return instance
+
+
+class WorkOrderSummarySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Header fields for the work order list screens (``?view=summary``)."""
+
+    customer = serializers.CharField(source="quotation.company_name", read_only=True)
+
+    class Meta:
+        model = WorkOrder
+        fields = [
+            "id",
+            "wo_number",
+            "purchase_order",
+            "quotation",
+            "customer",
+            "status",
+            "manager_approval_status",
+            "decline_reason",
+            "onsite_or_lab",
+            "wo_type",
+            "application_status",
+            "date_received",
+            "expected_completion_date",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
+class InvoiceSummarySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Header fields for the invoice list screens (``?view=summary``)."""
+
+    dn_number = serializers.CharField(source="delivery_note.dn_number", read_only=True)
+    wo_number = serializers.CharField(source="delivery_note.work_order.wo_number", read_only=True)
+    customer = serializers.CharField(
+        source="delivery_note.work_order.quotation.company_name", read_only=True
+    )
+
+    class Meta:
+        model = Invoice
+        fields = [
+            "id",
+            "delivery_note",
+            "delivery_note_item",
+            "dn_number",
+            "wo_number",
+            "customer",
+            "invoice_status",
+            "due_in_days",
+            "received_date",
+            "payment_reference_number",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
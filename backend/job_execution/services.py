@@ -0,0 +1,186 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count, Min, Sum
+from django.utils import timezone
+
+from backend.etags import bump_collection_version
+
+from .models import (
+    CalibrationDueSummary,
+    DeliveryNoteItem,
+    DeliveryNoteItemComponent,
+    Invoice,
+    WorkOrderItem,
+)
+
+# Window kept in the calibration due summary, in days around today
+SUMMARY_PAST_DAYS = 365
+SUMMARY_FUTURE_DAYS = 365
+
+
+class DeliveryNoteBuilder:
+    """
+    Collects the items, components and pending invoices of a delivery note in
+    memory and writes each table with a single bulk_create.
+    """
+
+    def __init__(self, delivery_note):
+        self.delivery_note = delivery_note
+        self.items = []
+        self.components = []
+
+    def add_item(self, item=None, range=None, quantity=None, delivered_quantity=None, uom=None, components=()):
+        self.items.append(
+            DeliveryNoteItem(
+                delivery_note=self.delivery_note,
+                item=item,
+                range=range,
+                quantity=quantity,
+                delivered_quantity=delivered_quantity,
+                uom=uom,
+            )
+        )
+        self.components.append(
+            [
+                (component_data.get("component"), component_data.get("value"))
+                for component_data in components
+            ]
+        )
+
+    def add_work_order_items(self, work_order_items):
+        for item in work_order_items:
+            self.add_item(
+                item=item.item,
+                range=item.range,
+                quantity=item.quantity,
+                delivered_quantity=item.quantity,
+                uom=item.unit,
+            )
+
+    def add_items_data(self, items_data):
+        for item_data in items_data:
+            self.add_item(
+                item=item_data.get("item"),
+                range=item_data.get("range"),
+                quantity=item_data.get("quantity"),
+                delivered_quantity=item_data.get("delivered_quantity"),
+                uom=item_data.get("uom"),
+                components=item_data.get("components", []),
+            )
+
+    def save(self):
+        """
+        Insert everything collected so far. Must run inside a transaction.
+        Returns the created DeliveryNoteItem instances.
+        """
+        if not self.items:
+            return []
+        self._create_items()
+        Invoice.objects.bulk_create(
+            Invoice(
+                delivery_note=self.delivery_note,
+                delivery_note_item=delivery_note_item,
+                invoice_status="pending",
+            )
+            for delivery_note_item in self.items
+        )
+        DeliveryNoteItemComponent.objects.bulk_create(
+            DeliveryNoteItemComponent(
+                delivery_note_item=delivery_note_item,
+                component=component,
+                value=value,
+            )
+            for delivery_note_item, components in zip(self.items, self.components)
+            for component, value in components
+        )
+        # bulk_create sends no post_save signals
+        bump_collection_version(DeliveryNoteItem, DeliveryNoteItemComponent, Invoice)
+        return self.items
+
+    def _create_items(self):
+        if connection.features.can_return_rows_from_bulk_insert:
+            DeliveryNoteItem.objects.bulk_create(self.items)
+            return
+        # MySQL does not hand back the new ids, so read them back in insert
+        # order; nothing else writes to this delivery note inside the
+        # surrounding transaction.
+        existing_ids = set(self.delivery_note.items.values_list("id", flat=True))
+        DeliveryNoteItem.objects.bulk_create(self.items)
+        new_ids = [
+            pk
+            for pk in self.delivery_note.items.order_by("id").values_list("id", flat=True)
+            if pk not in existing_ids
+        ]
+        for delivery_note_item, pk in zip(self.items, new_ids):
+            delivery_note_item.pk = pk
+            delivery_note_item._state.adding = False
+            delivery_note_item._state.db = self.delivery_note._state.db
+
+
+def delivered_quantities(work_order):
+    """Quantity already placed on the work order's delivery notes, per item id."""
+    rows = (
+        DeliveryNoteItem.objects.filter(
+            delivery_note__work_order=work_order, item__isnull=False
+        )
+        .values("item")
+        .annotate(total=Sum("quantity"))
+    )
+    return {row["item"]: row["total"] or 0 for row in rows}
+
+
+def calibrations_due(within_days=None, customer=None, technician=None, today=None):
+    """
+    Work order items with a calibration due date, earliest first. Items due
+    more than ``within_days`` from today are left out; overdue ones stay in.
+    """
+    today = today or timezone.localdate()
+    queryset = WorkOrderItem.objects.filter(calibration_due_date__isnull=False)
+    if within_days is not None:
+        queryset = queryset.filter(calibration_due_date__lte=today + timedelta(days=within_days))
+    if customer:
+        queryset = queryset.filter(work_order__quotation__company_name__icontains=customer)
+    if technician:
+        queryset = queryset.filter(assigned_to=technician)
+    return queryset.order_by("calibration_due_date", "work_order", "id")
+
+
+def refresh_calibration_due_summary(today=None):
+    """
+    Rebuild CalibrationDueSummary from two grouped queries over the indexed
+    due date range. Returns the number of summary rows written.
+    """
+    today = today or timezone.localdate()
+    items = WorkOrderItem.objects.filter(
+        calibration_due_date__gte=today - timedelta(days=SUMMARY_PAST_DAYS),
+        calibration_due_date__lte=today + timedelta(days=SUMMARY_FUTURE_DAYS),
+    ).order_by()
+    rows = items.values(
+        "calibration_due_date", "work_order__quotation__company_name", "assigned_to"
+    ).annotate(item_count=Count("id"), work_order_count=Count("work_order", distinct=True))
+    # Credit each work order to the lowest technician id among its items due that day
+    shares = Counter(
+        (row["calibration_due_date"], row["work_order__quotation__company_name"] or "", row["technician"])
+        for row in items.values(
+            "calibration_due_date", "work_order", "work_order__quotation__company_name"
+        ).annotate(technician=Min("assigned_to"))
+    )
+    refreshed_at = timezone.now()
+    summaries = []
+    for row in rows:
+        customer = row["work_order__quotation__company_name"] or ""
+        summaries.append(CalibrationDueSummary(
+            due_date=row["calibration_due_date"],
+            customer=customer,
+            technician_id=row["assigned_to"],
+            item_count=row["item_count"],
+            work_order_count=row["work_order_count"],
+            work_order_share=shares[(row["calibration_due_date"], customer, row["assigned_to"])],
+            refreshed_at=refreshed_at,
+        ))
+    with transaction.atomic():
+        CalibrationDueSummary.objects.all().delete()
+        CalibrationDueSummary.objects.bulk_create(summaries, batch_size=1000)
+    return len(summaries)
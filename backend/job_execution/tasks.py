@@ -0,0 +1,13 @@
+from celery import shared_task
+import logging
+
+from .services import refresh_calibration_due_summary
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_calibration_due_summary_task():
+    count = refresh_calibration_due_summary()
+    logger.info(f"Calibration due summary refreshed with {count} rows")
+    return count
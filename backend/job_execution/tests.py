@@ -1,3 +1,177 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.test import override_settings
+from django.utils import timezone
+
+from backend.testing import QueryBudgetTestCase, create_order_fixtures
+
+from notifications.models import Notification
+from team.models import Technician
+
+from .models import DeliveryNote, DeliveryNoteItemComponent, Invoice, WorkOrder, WorkOrderItem
+from .serializers import WorkOrderSummarySerializer
+from .services import refresh_calibration_due_summary
+
+
+class QueryBudgetTests(QueryBudgetTestCase):
+    """Query budgets for the job execution routes with three full order chains."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=3)
+        cls.work_order = WorkOrder.objects.first()
+        cls.delivery_note = DeliveryNote.objects.first()
+        cls.invoice = Invoice.objects.first()
+
+    def test_work_order_routes(self):
+        self.assertQueryBudget("/api/work-orders/", 5)
+        self.assertQueryBudget(f"/api/work-orders/{self.work_order.pk}/", 5)
+
+    def test_delivery_note_routes(self):
+        self.assertQueryBudget("/api/delivery-notes/", 3)
+        self.assertQueryBudget(f"/api/delivery-notes/{self.delivery_note.pk}/", 3)
+
+    def test_invoice_routes(self):
+        self.assertQueryBudget("/api/invoices/", 1)
+        self.assertQueryBudget(f"/api/invoices/{self.invoice.pk}/", 1)
+
+    def test_summary_views(self):
+        response = self.assertQueryBudget("/api/work-orders/?view=summary", 1)
+        self.assertEqual(
+            set(response.json()[0]),
+            set(WorkOrderSummarySerializer.Meta.fields),
+        )
+        response = self.assertQueryBudget("/api/invoices/?view=summary&fields=id,customer", 1)
+        self.assertEqual(set(response.json()[0]), {"id", "customer"})
+
+    def test_calibration_due_route(self):
+        self.assertQueryBudget("/api/calibrations/due/?within_days=30", 2)
+
+
+class ConditionalGetTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=2)
+
+    def test_not_modified_costs_no_queries(self):
+        etag = self.client.get("/api/work-orders/")["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/work-orders/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_nested_write_changes_the_etag(self):
+        etag = self.client.get("/api/work-orders/")["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            component = DeliveryNoteItemComponent.objects.first()
+            component.value = "0-20"
+            component.save()
+        response = self.client.get("/api/work-orders/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(ETAG_WATERMARKS=True)
+    def test_watermark_catches_writes_without_signals(self):
+        etag = self.client.get("/api/invoices/")["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/invoices/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        Invoice.objects.filter(pk=Invoice.objects.first().pk).update(
+            invoice_status="raised", updated_at=timezone.now() + timedelta(seconds=1)
+        )
+        response = self.client.get("/api/invoices/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class LargeListQueryBudgetTests(QueryBudgetTestCase):
+    """The list budgets hold with more rows: the read plans do not grow with the data."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=10, lines=5)
+
+    def test_list_routes(self):
+        self.assertQueryBudget("/api/work-orders/", 5)
+        self.assertQueryBudget("/api/delivery-notes/", 3)
+        self.assertQueryBudget("/api/purchase-orders/", 2)
+
+
+class QueryMetricsTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=2)
+
+    @override_settings(QUERY_METRICS_ENABLED=True)
+    def test_headers_and_metrics_endpoint(self):
+        self.client.delete("/api/_metrics")
+        response = self.client.get("/api/work-orders/")
+        self.assertTrue(response["X-Query-Count"].isdigit())
+        self.assertIn("X-Query-Duplicates", response)
+        self.assertIn("X-DB-Time-Ms", response)
+
+        metrics = self.client.get("/api/_metrics").json()["endpoints"]
+        work_orders = metrics["GET workorder-list"]
+        self.assertEqual(work_orders["requests"], 1)
+        self.assertEqual(work_orders["max_queries"], int(response["X-Query-Count"]))
+
+    def test_metrics_endpoint_disabled_by_default(self):
+        self.assertNotIn("X-Query-Count", self.client.get("/api/invoices/"))
+        self.assertEqual(self.client.get("/api/_metrics").status_code, 404)
+
+
+class CalibrationDueSummaryTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=1, lines=3)
+        cls.due_date = timezone.localdate() + timedelta(days=10)
+        cls.technician = Technician.objects.create(name="Second", email="second@example.com")
+        # One work order whose items due on one day are split across two technicians
+        WorkOrderItem.objects.update(calibration_due_date=cls.due_date)
+        WorkOrderItem.objects.filter(pk=WorkOrderItem.objects.first().pk).update(
+            assigned_to=cls.technician
+        )
+        refresh_calibration_due_summary()
+
+    def test_work_order_split_across_technicians_counts_once(self):
+        results = self.client.get("/api/calibrations/due/summary/").json()["results"]
+        self.assertEqual(
+            results,
+            [{"due_date": self.due_date.isoformat(), "item_count": 3, "work_order_count": 1}],
+        )
+
+    def test_technician_filter(self):
+        for technician, items in ((self.technician, 1), (Technician.objects.get(name="Tech"), 2)):
+            results = self.client.get(
+                f"/api/calibrations/due/summary/?technician={technician.pk}"
+            ).json()["results"]
+            self.assertEqual(results[0]["item_count"], items)
+            self.assertEqual(results[0]["work_order_count"], 1)
+
+    def test_non_numeric_technician_is_rejected(self):
+        for url in ("/api/calibrations/due/", "/api/calibrations/due/summary/"):
+            response = self.client.get(f"{url}?technician=abc")
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json(), {"error": "technician must be an integer id"})
+
+
+@override_settings(ADMIN_EMAIL="office@example.com")
+class InvoiceStatusEmailTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=1, lines=1)
+        cls.invoice = Invoice.objects.get()
+
+    def test_status_change_notifies_salesperson_admin_and_superadmins(self):
+        response = self.client.patch(
+            f"/api/invoices/{self.invoice.pk}/", {"invoice_status": "raised", "due_in_days": 30}, format="json"
+        )
+        self.assertEqual(response.status_code, 200, response.content[:500])
+        self.assertEqual(
+            set(Notification.objects.values_list("recipient_email", flat=True)),
+            {"sales@example.com", "office@example.com", "admin@example.com"},
+        )
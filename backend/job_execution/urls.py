@@ -1,6 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import WorkOrderViewSet, DeliveryNoteViewSet, DeliveryNoteItemComponentViewSet, InvoiceViewSet
+from .views import (
+    WorkOrderViewSet,
+    DeliveryNoteViewSet,
+    DeliveryNoteItemComponentViewSet,
+    InvoiceViewSet,
+    CalibrationDueView,
+    CalibrationDueSummaryView,
+)
 
 router = DefaultRouter()
 router.register(r'work-orders', WorkOrderViewSet)
@@ -9,5 +16,7 @@ router.register(r'delivery-note-item-components', DeliveryNoteItemComponentViewS
 router.register(r'invoices', InvoiceViewSet)
 
 urlpatterns = [
+    path('calibrations/due/', CalibrationDueView.as_view(), name='calibrations-due'),
+    path('calibrations/due/summary/', CalibrationDueSummaryView.as_view(), name='calibrations-due-summary'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
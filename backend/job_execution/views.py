@@ -2,8 +2,12 @@ from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
 from .models import (
+    CalibrationDueSummary,
     WorkOrder,
+    WorkOrderItem,
     DeliveryNote,
     DeliveryNoteItem,
     DeliveryNoteItemComponent,
@@ -16,20 +20,41 @@ from .serializers import (
     DeliveryNoteItemSerializer,
     DeliveryNoteItemComponentSerializer,
     InvoiceSerializer,
+    InvoiceSummarySerializer,
+    WorkOrderSummarySerializer,
 )
-from django.db.models import Max
 from series.models import NumberSeries
+from series.services import SeriesAllocator
+from .services import DeliveryNoteBuilder, calibrations_due, delivered_quantities
 import logging
+from datetime import timedelta
 from django.db import transaction
+from django.db.models import Max, Prefetch, Sum
+from django.utils import timezone
 from unit.models import Unit
+from pre_job.models import Quotation
+from team.models import Technician
+from backend.mixins import ConditionalGetMixin, SparseFieldsMixin, StreamingExportMixin, SummaryViewMixin
+from backend.pagination import ReportPagination
 
 logger = logging.getLogger(__name__)
 
 
-class WorkOrderViewSet(viewsets.ModelViewSet):
+class WorkOrderViewSet(ConditionalGetMixin, SummaryViewMixin, SparseFieldsMixin, StreamingExportMixin, viewsets.ModelViewSet):
     queryset = WorkOrder.objects.all()
     serializer_class = WorkOrderSerializer
+    summary_serializer_class = WorkOrderSummarySerializer
     permission_classes = [IsAuthenticated]
+    etag_models = (
+        WorkOrder,
+        WorkOrderItem,
+        DeliveryNote,
+        DeliveryNoteItem,
+        DeliveryNoteItemComponent,
+        Technician,
+        Quotation,
+    )
+    etag_watermark = "updated_at"
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -44,8 +69,31 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.filter(status=status)
         logger.info(
-            f"Queryset filtered: purchase_order={purchase_order_id}, status={status}, count={queryset.count()}"
+            f"Queryset filtered: purchase_order={purchase_order_id}, status={status}"
         )
+        if self.request.method == "GET":
+            queryset = self.with_read_plan(queryset)
+        return queryset
+
+    def with_read_plan(self, queryset):
+        """
+        Load everything WorkOrderSerializer renders in a fixed number of
+        queries, whatever the number of work orders, items or delivery notes.
+        Item, unit and technician are rendered as ids straight from the
+        foreign key columns, so they need no joins.
+        """
+        fields = self.get_requested_fields()
+        if fields is None or "created_by_name" in fields:
+            queryset = queryset.select_related("created_by")
+        if fields is None or "items" in fields:
+            queryset = queryset.prefetch_related("items")
+        if fields is None or "delivery_notes" in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "delivery_notes",
+                    queryset=DeliveryNote.objects.prefetch_related("items__components"),
+                )
+            )
         return queryset
 
     def create(self, request, *args, **kwargs):
@@ -134,21 +182,12 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
                     dn_number=f"TEMP-DN-{work_order.id:06d}",
                     delivery_status="Delivery Pending",
                 )
-                for item in work_order.items.all():
-                    delivery_note_item = DeliveryNoteItem.objects.create(
-                        delivery_note=delivery_note,
-                        item=item.item,
-                        range=item.range,
-                        quantity=item.quantity,
-                        delivered_quantity=item.quantity,
-                        uom=item.unit,
-                    )
-                    # Create an Invoice for each DeliveryNoteItem with default status
-                    Invoice.objects.create(
-                        delivery_note=delivery_note,
-                        delivery_note_item=delivery_note_item,
-                        invoice_status="pending",
-                    )
+                # One pending Invoice per DeliveryNoteItem, written in bulk
+                builder = DeliveryNoteBuilder(delivery_note)
+                builder.add_work_order_items(
+                    work_order.items.select_related("item", "unit")
+                )
+                builder.save()
                 logger.info(
                     f"Created new Delivery Note with temp DN for WorkOrder {pk}"
                 )
@@ -439,11 +478,8 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
             )
 
         with transaction.atomic():
-            work_order_items = {
-                item.id: item.quantity for item in work_order.items.all()
-            }
-            existing_dns = work_order.delivery_notes.all()
-            assigned_quantities = {}
+            work_order_items = dict(work_order.items.values_list("id", "quantity"))
+            assigned_quantities = delivered_quantities(work_order)
 
             for item_data in items_data:
                 item_id = item_data.get("item").id if item_data.get("item") else None
@@ -452,14 +488,6 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
                         item_id, 0
                     ) + (item_data.get("quantity") or 0)
 
-            for dn in existing_dns:
-                for dn_item in dn.items.all():
-                    item_id = dn_item.item.id if dn_item.item else None
-                    if item_id:
-                        assigned_quantities[item_id] = assigned_quantities.get(
-                            item_id, 0
-                        ) + (dn_item.quantity or 0)
-
             for item_id, total_quantity in work_order_items.items():
                 assigned = assigned_quantities.get(item_id, 0)
                 if assigned > total_quantity:
@@ -470,38 +498,18 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
                         status=status.HTTP_400_BAD_REQUEST,
                     )
 
-            max_sequence = DeliveryNote.objects.filter(
-                dn_number__startswith=dn_series.prefix
-            ).aggregate(Max("dn_number"))["dn_number__max"]
-            sequence = 1 if not max_sequence else int(max_sequence.split("-")[-1]) + 1
-            dn_number = f"{dn_series.prefix}-{sequence:06d}"
+            dn_number = SeriesAllocator(
+                "Delivery Note", DeliveryNote, "dn_number"
+            ).allocate()
 
             if delivery_type == "Single":
                 delivery_note = work_order.delivery_notes.first()
                 if delivery_note:
                     delivery_note.dn_number = dn_number
                     delivery_note.items.all().delete()
-                    for item_data in items_data:
-                        components_data = item_data.pop("components", [])
-                        delivery_note_item = DeliveryNoteItem.objects.create(
-                            delivery_note=delivery_note,
-                            item=item_data.get("item"),
-                            range=item_data.get("range"),
-                            quantity=item_data.get("quantity"),
-                            delivered_quantity=item_data.get("delivered_quantity"),
-                            uom=item_data.get("uom"),
-                        )
-                        Invoice.objects.create(
-                            delivery_note=delivery_note,
-                            delivery_note_item=delivery_note_item,
-                            invoice_status="pending",
-                        )
-                        for component_data in components_data:
-                            DeliveryNoteItemComponent.objects.create(
-                                delivery_note_item=delivery_note_item,
-                                component=component_data.get("component"),
-                                value=component_data.get("value"),
-                            )
+                    builder = DeliveryNoteBuilder(delivery_note)
+                    builder.add_items_data(items_data)
+                    builder.save()
                     delivery_note.save()
                     logger.info(f"Updated Delivery Note {dn_number} for WorkOrder {pk}")
                 else:
@@ -511,30 +519,12 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
                         delivery_status="Delivery Pending",
                         series=dn_series,
                     )
-                    for item_data in items_data:
-                        components_data = item_data.pop("components", [])
-                        delivery_note_item = DeliveryNoteItem.objects.create(
-                            delivery_note=delivery_note,
-                            item=item_data.get("item"),
-                            range=item_data.get("range"),
-                            quantity=item_data.get("quantity"),
-                            delivered_quantity=item_data.get("delivered_quantity"),
-                            uom=item_data.get("uom"),
-                        )
-                        Invoice.objects.create(
-                            delivery_note=delivery_note,
-                            delivery_note_item=delivery_note_item,
-                            invoice_status="pending",
-                        )
-                        for component_data in components_data:
-                            DeliveryNoteItemComponent.objects.create(
-                                delivery_note_item=delivery_note_item,
-                                component=component_data.get("component"),
-                                value=component_data.get("value"),
-                            )
-                    logger.info(
-                        f"Created Delivery Note {dn_number} for WorkOrder {pk} with {len(items_data)} items"
-                    )
+                    builder = DeliveryNoteBuilder(delivery_note)
+                    builder.add_items_data(items_data)
+                    builder.save()
+                logger.info(
+                    f"Created Delivery Note {dn_number} for WorkOrder {pk} with {len(items_data)} items"
+                )
             else:  # Multiple
                 delivery_note = DeliveryNote.objects.create(
                     work_order=work_order,
@@ -542,30 +532,12 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
                     delivery_status="Delivery Pending",
                     series=dn_series,
                 )
-                for item_data in items_data:
-                    components_data = item_data.pop("components", [])
-                    delivery_note_item = DeliveryNoteItem.objects.create(
-                        delivery_note=delivery_note,
-                        item=item_data.get("item"),
-                        range=item_data.get("range"),
-                        quantity=item_data.get("quantity"),
-                        delivered_quantity=item_data.get("delivered_quantity"),
-                        uom=item_data.get("uom"),
-                    )
-                    Invoice.objects.create(
-                        delivery_note=delivery_note,
-                        delivery_note_item=delivery_note_item,
-                        invoice_status="pending",
-                    )
-                    for component_data in components_data:
-                        DeliveryNoteItemComponent.objects.create(
-                            delivery_note_item=delivery_note_item,
-                            component=component_data.get("component"),
-                            value=component_data.get("value"),
-                        )
-                    logger.info(
-                        f"Created Delivery Note {dn_number} for WorkOrder {pk} with {len(items_data)} items"
-                    )
+                builder = DeliveryNoteBuilder(delivery_note)
+                builder.add_items_data(items_data)
+                builder.save()
+                logger.info(
+                    f"Created Delivery Note {dn_number} for WorkOrder {pk} with {len(items_data)} items"
+                )
 
         return Response(
             {
@@ -576,10 +548,18 @@ class WorkOrderViewSet(viewsets.ModelViewSet):
         )
 
 
-class DeliveryNoteViewSet(viewsets.ModelViewSet):
+class DeliveryNoteViewSet(ConditionalGetMixin, SparseFieldsMixin, StreamingExportMixin, viewsets.ModelViewSet):
     queryset = DeliveryNote.objects.all()
     serializer_class = DeliveryNoteSerializer
     permission_classes = [IsAuthenticated]
+    etag_models = (DeliveryNote, DeliveryNoteItem, DeliveryNoteItemComponent, WorkOrder)
+    etag_watermark = "updated_at"
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method == "GET":
+            queryset = queryset.select_related("work_order").prefetch_related("items__components")
+        return queryset
 
     @action(detail=True, methods=["post"], url_path="upload-signed-note")
     def upload_signed_note(self, request, pk=None):
@@ -629,10 +609,13 @@ class DeliveryNoteItemComponentViewSet(viewsets.ModelViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class InvoiceViewSet(viewsets.ModelViewSet):
+class InvoiceViewSet(ConditionalGetMixin, SummaryViewMixin, SparseFieldsMixin, StreamingExportMixin, viewsets.ModelViewSet):
     queryset = Invoice.objects.all()
     serializer_class = InvoiceSerializer
+    summary_serializer_class = InvoiceSummarySerializer
     permission_classes = [IsAuthenticated]
+    etag_models = (Invoice, DeliveryNote, WorkOrder, Quotation)
+    etag_watermark = "updated_at"
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -647,7 +630,7 @@ class InvoiceViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.filter(invoice_status=invoice_status)
         logger.info(
-            f"Queryset filtered: delivery_note_id={delivery_note_id}, invoice_status={invoice_status}, count={queryset.count()}"
+            f"Queryset filtered: delivery_note_id={delivery_note_id}, invoice_status={invoice_status}"
         )
         return queryset
 
@@ -716,7 +699,7 @@ class InvoiceViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.filter(invoice_status=invoice_status)
         logger.info(
-            f"Queryset filtered: delivery_note_id={delivery_note_id}, invoice_status={invoice_status}, count={queryset.count()}"
+            f"Queryset filtered: delivery_note_id={delivery_note_id}, invoice_status={invoice_status}"
         )
         return queryset
 
@@ -752,3 +735,110 @@ class InvoiceViewSet(viewsets.ModelViewSet):
         self.perform_destroy(instance)
         logger.info(f"Invoice {instance.id} deleted")
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def calibration_filters(request):
+    """``within_days``, ``customer`` and ``technician`` from the query string."""
+    within_days = request.query_params.get("within_days")
+    if within_days is not None:
+        try:
+            within_days = int(within_days)
+        except ValueError:
+            within_days = -1
+        if within_days < 0:
+            raise ValidationError({"error": "within_days must be a non-negative integer"})
+    technician = request.query_params.get("technician") or None
+    if technician is not None:
+        try:
+            technician = int(technician)
+        except ValueError:
+            raise ValidationError({"error": "technician must be an integer id"})
+    return {
+        "within_days": within_days,
+        "customer": request.query_params.get("customer"),
+        "technician": technician,
+    }
+
+
+class CalibrationDueView(APIView):
+    """
+    Work order items by calibration due date, earliest (overdue) first.
+    Filters: ``within_days``, ``customer`` (company name) and ``technician`` (id).
+    """
+
+    permission_classes = [IsAuthenticated]
+    pagination_class = ReportPagination
+
+    def get(self, request):
+        filters = calibration_filters(request)
+        today = timezone.localdate()
+        rows = calibrations_due(today=today, **filters).values(
+            "id",
+            "work_order_id",
+            "work_order__wo_number",
+            "work_order__quotation__company_name",
+            "item_id",
+            "item__name",
+            "uuc_serial_number",
+            "certificate_number",
+            "calibration_date",
+            "calibration_due_date",
+            "assigned_to_id",
+            "assigned_to__name",
+        )
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(rows, request, view=self)
+        return paginator.get_paginated_response([
+            {
+                "id": row["id"],
+                "work_order": row["work_order_id"],
+                "wo_number": row["work_order__wo_number"],
+                "customer": row["work_order__quotation__company_name"],
+                "item": row["item_id"],
+                "item_name": row["item__name"],
+                "serial_number": row["uuc_serial_number"],
+                "certificate_number": row["certificate_number"],
+                "calibration_date": row["calibration_date"],
+                "calibration_due_date": row["calibration_due_date"],
+                "days_left": (row["calibration_due_date"] - today).days,
+                "technician": row["assigned_to_id"],
+                "technician_name": row["assigned_to__name"],
+            }
+            for row in page
+        ])
+
+
+class CalibrationDueSummaryView(APIView):
+    """
+    Item and work order counts per due date, read from the daily
+    CalibrationDueSummary snapshot. Accepts the same filters as
+    CalibrationDueView.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        filters = calibration_filters(request)
+        summaries = CalibrationDueSummary.objects.all()
+        if filters["within_days"] is not None:
+            summaries = summaries.filter(
+                due_date__lte=timezone.localdate() + timedelta(days=filters["within_days"])
+            )
+        if filters["customer"]:
+            summaries = summaries.filter(customer__icontains=filters["customer"])
+        if filters["technician"]:
+            summaries = summaries.filter(technician=filters["technician"])
+        # A work order with items for several technicians has a row for each;
+        # only one technician's rows can be summed by their distinct counts
+        work_orders = "work_order_count" if filters["technician"] else "work_order_share"
+        rows = (
+            summaries.order_by("due_date")
+            .values("due_date")
+            .annotate(item_count=Sum("item_count"), work_order_count=Sum(work_orders))
+        )
+        return Response({
+            "refreshed_at": CalibrationDueSummary.objects.aggregate(
+                refreshed_at=Max("refreshed_at")
+            )["refreshed_at"],
+            "results": list(rows),
+        })
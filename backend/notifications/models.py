@@ -0,0 +1,37 @@
+from django.db import models
+
+
+class Notification(models.Model):
+    """One outbound email waiting in (or drained from) the outbox."""
+
+    recipient_email = models.EmailField()
+    recipient_name = models.CharField(max_length=255, blank=True, null=True)
+    subject = models.CharField(max_length=255)
+    message = models.TextField()
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ("pending", "Pending"),
+            ("sending", "Sending"),
+            ("sent", "Sent"),
+            ("failed", "Failed"),
+        ],
+        default="pending",
+    )
+    # Set by callers that may run more than once (task retries); a repeat
+    # enqueue with the same key is ignored
+    idempotency_key = models.CharField(max_length=255, unique=True, blank=True, null=True)
+    claim = models.CharField(max_length=32, blank=True, null=True)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Failed sends wait until then before the next flush picks them up again
+    next_attempt_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "id"])]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.recipient_email} ({self.status})"
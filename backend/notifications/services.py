@@ -0,0 +1,50 @@
+import hashlib
+
+from django.db import transaction
+
+from .models import Notification
+
+
+def recipient_key(idempotency_key, email):
+    """Fixed-length outbox key for one recipient of an idempotent send."""
+    return hashlib.sha256(f"{idempotency_key}:{email.lower()}".encode()).hexdigest()
+
+
+def queue_email(subject, recipients, build_message, idempotency_key=None):
+    """
+    Write one outbox row per distinct recipient email.
+    ``recipients`` is a list of (email, name) pairs and ``build_message`` is
+    called with each (email, name) to render that recipient's body.
+    With ``idempotency_key`` a second call for the same key and recipient is
+    a no-op. Returns the number of notifications passed to the outbox.
+    """
+    seen = set()
+    notifications = []
+    for email, name in recipients:
+        if not email or email.lower() in seen:
+            continue
+        seen.add(email.lower())
+        notifications.append(
+            Notification(
+                recipient_email=email,
+                recipient_name=name,
+                subject=subject,
+                message=build_message(email, name),
+                idempotency_key=recipient_key(idempotency_key, email) if idempotency_key else None,
+            )
+        )
+    Notification.objects.bulk_create(notifications, ignore_conflicts=bool(idempotency_key))
+    return len(notifications)
+
+
+def send_email_later(subject, message, recipient_list, idempotency_key):
+    """
+    Send a single email from Celery once the current transaction commits.
+    Used for messages that should not sit in the outbox table (OTPs,
+    credentials) or wait for the next flush.
+    """
+    from .tasks import send_email_task
+
+    transaction.on_commit(
+        lambda: send_email_task.delay(subject, message, recipient_list, idempotency_key)
+    )
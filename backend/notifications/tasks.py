@@ -0,0 +1,154 @@
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.db.models import F, Q
+from django.utils import timezone
+from datetime import timedelta
+import logging
+import uuid
+
+from .models import Notification
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 200
+MAX_ATTEMPTS = 3
+# Rows left in "sending" this long belong to a flush that died mid-way
+STALE_CLAIM_AFTER = timedelta(minutes=10)
+SENT_MARKER_TIMEOUT = 60 * 60 * 24
+# Wait before retrying a failed send, doubled for every further attempt
+RETRY_BACKOFF = timedelta(minutes=5)
+
+
+def due_notifications():
+    """Pending rows whose backoff, if any, has run out."""
+    return Notification.objects.filter(status="pending").filter(
+        Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=timezone.now())
+    )
+
+
+@shared_task
+def flush_notifications(batch_size=FLUSH_BATCH_SIZE):
+    """
+    Drain the outbox in batches over a single SMTP connection.
+    Rows with the same recipient, subject and body are sent once. When the
+    connection cannot be opened nothing is claimed and the next flush tries
+    again, without using up any row's attempts.
+    """
+    Notification.objects.filter(
+        status="sending", claimed_at__lt=timezone.now() - STALE_CLAIM_AFTER
+    ).update(status="pending", claim=None)
+
+    if not due_notifications().exists():
+        return 0
+    try:
+        connection = get_connection(fail_silently=False)
+        connection.open()
+    except Exception as e:
+        logger.error(f"Could not open mail connection, leaving the outbox for the next flush: {e}")
+        return 0
+
+    total_sent = 0
+    try:
+        while True:
+            claim = uuid.uuid4().hex
+            pending_ids = list(
+                due_notifications().order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not pending_ids:
+                break
+            # Concurrent flushes only ever see the rows they managed to claim
+            Notification.objects.filter(id__in=pending_ids, status="pending").update(
+                status="sending", claim=claim, claimed_at=timezone.now(), attempts=F("attempts") + 1
+            )
+            batch = list(Notification.objects.filter(claim=claim, status="sending"))
+            if batch:
+                total_sent += send_batch(batch, connection)
+            if len(pending_ids) < batch_size:
+                break
+    finally:
+        connection.close()
+    return total_sent
+
+
+def send_batch(notifications, connection):
+    groups = {}
+    for notification in notifications:
+        key = (notification.recipient_email.lower(), notification.subject, notification.message)
+        groups.setdefault(key, []).append(notification)
+
+    sent_ids, failed = [], []
+    for group in groups.values():
+        notification = group[0]
+        message = EmailMessage(
+            subject=notification.subject,
+            body=notification.message,
+            from_email=settings.EMAIL_HOST_USER,
+            to=[notification.recipient_email],
+            connection=connection,
+        )
+        try:
+            connection.send_messages([message])
+            sent_ids.extend(n.id for n in group)
+        except Exception as e:
+            logger.error(f"Failed to send '{notification.subject}' to {notification.recipient_email}: {e}")
+            failed.append((group, str(e)))
+
+    if sent_ids:
+        Notification.objects.filter(id__in=sent_ids).update(
+            status="sent", claim=None, sent_at=timezone.now(), last_error=None, next_attempt_at=None
+        )
+    for group, error in failed:
+        release(group, error)
+    logger.info(f"Notification flush sent {len(sent_ids)} of {len(notifications)} outbox rows")
+    return len(sent_ids)
+
+
+def release(notifications, error):
+    """
+    Put rows back in the queue after a backoff that doubles with every
+    attempt, or give up once MAX_ATTEMPTS is reached.
+    """
+    by_attempts = {}
+    for notification in notifications:
+        by_attempts.setdefault(notification.attempts, []).append(notification.id)
+    now = timezone.now()
+    for attempts, ids in by_attempts.items():
+        if attempts >= MAX_ATTEMPTS:
+            Notification.objects.filter(id__in=ids).update(
+                status="failed", claim=None, last_error=error, next_attempt_at=None
+            )
+        else:
+            Notification.objects.filter(id__in=ids).update(
+                status="pending",
+                claim=None,
+                last_error=error,
+                next_attempt_at=now + RETRY_BACKOFF * 2 ** max(attempts - 1, 0),
+            )
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_email_task(self, subject, message, recipient_list, idempotency_key):
+    """
+    Send one email, at most once per ``idempotency_key``: the marker is taken
+    before sending and only dropped again when the send fails.
+    """
+    marker = f"notifications:sent:{idempotency_key}"
+    if not cache.add(marker, self.request.id or True, SENT_MARKER_TIMEOUT):
+        logger.info(f"Skipping email '{subject}', already sent for {idempotency_key}")
+        return False
+    try:
+        send_mail(
+            subject=subject,
+            message=message,
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=recipient_list,
+            fail_silently=False,
+        )
+    except Exception as exc:
+        cache.delete(marker)
+        logger.error(f"Failed to send email '{subject}' to {recipient_list}: {exc}")
+        raise self.retry(exc=exc)
+    logger.info(f"Email '{subject}' sent to {recipient_list}")
+    return True
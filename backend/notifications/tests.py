@@ -0,0 +1,72 @@
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .models import Notification
+from .services import queue_email
+from .tasks import MAX_ATTEMPTS, flush_notifications
+
+
+class UnreachableEmailBackend(EmailBackend):
+    def open(self):
+        raise ConnectionRefusedError("SMTP server unreachable")
+
+
+class FailingEmailBackend(EmailBackend):
+    def send_messages(self, messages):
+        raise ConnectionResetError("Connection reset")
+
+
+def queue(count):
+    Notification.objects.bulk_create(
+        Notification(recipient_email=f"user{n}@example.com", subject="Hello", message="Body")
+        for n in range(count)
+    )
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class FlushNotificationsTests(TestCase):
+    def test_sends_the_outbox_in_batches(self):
+        queue(5)
+        self.assertEqual(flush_notifications(batch_size=2), 5)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertFalse(Notification.objects.exclude(status="sent").exists())
+
+    @override_settings(EMAIL_BACKEND="notifications.tests.UnreachableEmailBackend")
+    def test_unreachable_server_keeps_the_backlog(self):
+        queue(5)
+        for _ in range(MAX_ATTEMPTS + 1):
+            self.assertEqual(flush_notifications(batch_size=2), 0)
+        self.assertEqual(Notification.objects.filter(status="pending", attempts=0).count(), 5)
+
+    @override_settings(EMAIL_BACKEND="notifications.tests.FailingEmailBackend")
+    def test_failed_sends_back_off_and_give_up(self):
+        queue(3)
+        self.assertEqual(flush_notifications(batch_size=1), 0)
+        # Every row was tried once in this flush and waits for its backoff
+        self.assertEqual(
+            Notification.objects.filter(
+                status="pending", attempts=1, next_attempt_at__gt=timezone.now()
+            ).count(),
+            3,
+        )
+        flush_notifications(batch_size=1)
+        self.assertEqual(Notification.objects.filter(attempts=1).count(), 3)
+
+        for _ in range(2, MAX_ATTEMPTS + 1):
+            Notification.objects.update(next_attempt_at=timezone.now())
+            flush_notifications(batch_size=1)
+        self.assertEqual(
+            Notification.objects.filter(status="failed", attempts=MAX_ATTEMPTS).count(), 3
+        )
+
+
+class QueueEmailTests(TestCase):
+    def test_long_keys_and_addresses_fit_the_outbox(self):
+        recipients = [(f"{'a' * 200}@example.com", "A"), (f"{'A' * 200}@EXAMPLE.com", "A")]
+        key = "quotation-submitted:" + "x" * 300
+        self.assertEqual(queue_email("Hello", recipients, lambda email, name: "Body", key), 1)
+        self.assertEqual(queue_email("Hello", recipients, lambda email, name: "Body", key), 1)
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(len(Notification.objects.get().idempotency_key), 64)
@@ -0,0 +1,100 @@
+from django.conf import settings
+from authapp.models import CustomUser
+from notifications.services import queue_email
+
+
+def queue_rfq_creation_email(rfq_data, recipients, idempotency_key=None):
+    """
+    Queue the new RFQ notification in the outbox
+    recipients: list of tuples [(email, name), (email, name), ...]
+    """
+    subject = f"New RFQ Created: #{rfq_data['series_number']}"
+
+    def build_message(email, recipient_name):
+        return (
+            f"Dear {recipient_name},\n\n"
+            f"A new Request for Quotation (RFQ) has been created in PrimeCRM:\n"
+            f"------------------------------------------------------------\n"
+            f"RFQ Number: {rfq_data['series_number']}\n"
+            f"Project: {rfq_data.get('company_name', 'Not specified')}\n"
+            f"Due Date: {rfq_data.get('due_date', 'Not specified')}\n"
+            f"Assigned To: {rfq_data.get('assigned_name', 'Not assigned')}\n"
+            f"Company: {rfq_data.get('company_name', 'Not specified')}\n"
+            f"Contact: {rfq_data.get('contact_name', 'Not specified')}\n"
+            f"Contact Email: {rfq_data.get('contact_email', 'Not specified')}\n"
+            f"------------------------------------------------------------\n"
+            f"Please log in to PrimeCRM to view details.\n\n"
+            f"Best regards,\nPrimeCRM Team"
+        )
+
+    return queue_email(subject, recipients, build_message, idempotency_key)
+
+
+def queue_quotation_submission_email(quotation_data, recipients, idempotency_key=None):
+    """
+    Queue the quotation submission notification in the outbox
+    recipients: list of tuples [(email, name), (email, name), ...]
+    """
+    subject = f"New Quotation Submitted: #{quotation_data.get('series_number', 'N/A')}"
+
+    def build_message(email, recipient_name):
+        return (
+            f"Dear {recipient_name},\n\n"
+            f"A new quotation has been submitted in PrimeCRM:\n"
+            f"------------------------------------------------------------\n"
+            f"Quotation No: {quotation_data.get('series_number', 'N/A')}\n"
+            f"Company: {quotation_data.get('company_name', 'Not specified')}\n"
+            f"Contact: {quotation_data.get('contact_name', 'Not specified')} "
+            f"({quotation_data.get('contact_email', 'Not specified')})\n"
+            f"Assigned To: {quotation_data.get('assigned_name', 'Not assigned')}\n"
+            f"Status: {quotation_data.get('status', 'Pending')}\n"
+            f"------------------------------------------------------------\n"
+            f"Please log in to review.\n\n"
+            f"Best regards,\nPrimeCRM System"
+        )
+
+    return queue_email(subject, recipients, build_message, idempotency_key)
+
+
+def queue_invoice_status_email(invoice, new_status, idempotency_key=None):
+    """
+    Queue the invoice status update notification in the outbox
+    """
+    subject = f"Invoice Status Updated: {new_status.title()}"
+    message = (
+        f"Dear Team,\n\n"
+        f"The invoice status has been updated:\n"
+        f"------------------------------------------------\n"
+        f"Invoice ID: {invoice.id}\n"
+        f"Delivery Note: {invoice.delivery_note.dn_number if invoice.delivery_note else 'N/A'}\n"
+        f"New Status: {new_status.title()}\n"
+        f"{'Due in ' + str(invoice.due_in_days) + ' days' if new_status == 'raised' and invoice.due_in_days else ''}\n"
+        f"{'Received on: ' + invoice.received_date.strftime('%Y-%m-%d') if new_status == 'processed' else ''}\n"
+        f"------------------------------------------------\n"
+        f"Please check the system.\n\n"
+        f"Best regards,\nPrimeCRM System"
+    )
+
+    return queue_email(subject, invoice_status_recipients(invoice), lambda email, name: message, idempotency_key)
+
+
+def invoice_status_recipients(invoice):
+    """
+    The quotation's salesperson, the admin inbox and every Superadmin user,
+    as (email, name) pairs
+    """
+    recipients = []
+    work_order = invoice.delivery_note.work_order if invoice.delivery_note else None
+    sales_person = work_order.quotation.assigned_sales_person if work_order and work_order.quotation else None
+    if sales_person and sales_person.email:
+        recipients.append((sales_person.email, sales_person.name))
+
+    if settings.ADMIN_EMAIL:
+        recipients.append((settings.ADMIN_EMAIL, None))
+
+    for email, name, username in CustomUser.objects.filter(role__name="Superadmin").values_list(
+        "email", "name", "username"
+    ):
+        if email:
+            recipients.append((email, name or username))
+    return recipients
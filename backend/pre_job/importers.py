@@ -0,0 +1,228 @@
+from itertools import islice
+
+import openpyxl
+import pandas as pd
+from django.db import transaction
+from django.db.models.functions import Lower
+from backend.etags import bump_collection_version
+from item.models import Item
+from unit.models import Unit
+
+COLUMN_MAPPING = {
+    'item': ['item', 'name', 'item_name', 'description'],
+    'quantity': ['quantity', 'qty', 'qty.', 'amount'],
+    'unit': ['unit', 'units', 'uom', 'measurement'],
+    'unit_price': ['unit_price', 'price', 'unitprice', 'cost'],
+    'sl_no': ['sl_no', 'sl.no', 'sl', 'sno', 'id'],
+}
+DEFAULT_UNIT = 'Each'
+# Keeps each IN (...) list well under backend parameter limits
+LOOKUP_BATCH_SIZE = 1000
+# Rows parsed and resolved per round trip; bounds memory for large catalogs
+IMPORT_BATCH_SIZE = 2000
+
+
+def normalize_column_name(column):
+    return str(column).strip().lower().replace(' ', '_')
+
+
+def resolve_columns(columns):
+    """Map the standard column names to the headers present in the sheet."""
+    actual_columns = {}
+    for standard_name, possible_names in COLUMN_MAPPING.items():
+        for possible in possible_names:
+            if possible in columns:
+                actual_columns[standard_name] = possible
+                break
+    return actual_columns
+
+
+def _text(series):
+    """Stripped strings with blanks turned into NA."""
+    series = series.astype('string').str.strip()
+    return series.mask(series == '')
+
+
+def _number(series):
+    return pd.to_numeric(series, errors='coerce')
+
+
+def read_price_list(upload, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Yield the uploaded sheet as DataFrames of at most ``batch_size`` rows,
+    reading straight from the file object instead of loading it whole.
+    """
+    name = upload.name.lower()
+    if name.endswith('.csv'):
+        yield from pd.read_csv(upload, chunksize=batch_size)
+    elif name.endswith('.xlsx'):
+        yield from _read_xlsx(upload, batch_size)
+    else:
+        # Legacy .xls has no streaming reader
+        yield pd.read_excel(upload)
+
+
+def _read_xlsx(upload, batch_size):
+    workbook = openpyxl.load_workbook(upload, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [f'column_{index}' if column is None else column for index, column in enumerate(header)]
+        empty = True
+        for batch in iter(lambda: list(islice(rows, batch_size)), []):
+            df = pd.DataFrame([row[:len(header)] for row in batch], columns=header)
+            yield df.dropna(how='all')
+            empty = False
+        if empty:
+            yield pd.DataFrame(columns=header)
+    finally:
+        workbook.close()
+
+
+def import_price_list(upload, batch_size=IMPORT_BATCH_SIZE, on_batch=None):
+    """
+    Stream ``upload`` through a PriceListImporter batch by batch.
+    ``on_batch`` is called with the importer after every batch.
+    """
+    importer = None
+    start_index = 0
+    for df in read_price_list(upload, batch_size):
+        if importer is None:
+            importer = PriceListImporter(df.columns)
+            if importer.missing_required_columns:
+                return importer.missing_columns_error()
+        importer.import_frame(df, start_index)
+        start_index += len(df)
+        if on_batch:
+            on_batch(importer)
+    if importer is None:
+        return PriceListImporter([]).missing_columns_error()
+    return importer.result()
+
+
+class PriceListImporter:
+    """
+    Turns price list rows into RFQ item payloads.
+    Item and unit names are resolved for a whole frame at once: one lookup
+    query per model, one bulk_create for the missing names.
+    """
+
+    def __init__(self, columns):
+        self.found_columns = [normalize_column_name(column) for column in columns]
+        self.columns = resolve_columns(self.found_columns)
+        self.items = []
+        self.created_items = []
+        self.created_units = []
+        self.rows_processed = 0
+        self.rows_failed = 0
+
+    @property
+    def missing_required_columns(self):
+        return 'item' not in self.columns or 'quantity' not in self.columns
+
+    def import_frame(self, df, start_index=0):
+        df = df.copy()
+        df.columns = [normalize_column_name(column) for column in df.columns]
+        rows = self._normalize(df, start_index)
+        self.rows_processed += len(df)
+        self.rows_failed += len(df) - len(rows)
+        if rows.empty:
+            return []
+
+        with transaction.atomic():
+            items, created_items = self._resolve_names(Item, rows['item_name'])
+            units, created_units = self._resolve_names(Unit, rows['unit_name'])
+        self.created_items.extend(created_items)
+        self.created_units.extend(created_units)
+
+        rows['item_key'] = rows['item_name'].str.lower()
+        rows['unit_key'] = rows['unit_name'].str.lower()
+        rows = (
+            rows.drop(columns=['item_name', 'unit_name'])
+            .merge(items.rename(columns={'id': 'item', 'name': 'item_name'}), left_on='item_key', right_on='key')
+            .drop(columns=['key'])
+            .merge(units.rename(columns={'id': 'unit', 'name': 'unit_name'}), left_on='unit_key', right_on='key')
+            .sort_values('position')
+        )
+        rows['unit_price'] = rows['unit_price'].astype(object).where(rows['unit_price'].notna(), None)
+        items_data = rows[
+            ['sl_no', 'item', 'item_name', 'quantity', 'unit', 'unit_name', 'unit_price']
+        ].to_dict('records')
+        self.items.extend(items_data)
+        return items_data
+
+    def result(self):
+        return {
+            "success": True,
+            "items": self.items,
+            "total_items": len(self.items),
+            "created_items": self.created_items,
+            "created_units": self.created_units,
+            "message": f"Successfully processed {len(self.items)} items"
+        }
+
+    def missing_columns_error(self):
+        return {
+            "error": "Excel must contain 'Item' and 'Quantity' columns",
+            "found_columns": self.found_columns
+        }
+
+    def _column(self, df, name):
+        column = self.columns.get(name)
+        if column is None or column not in df.columns:
+            return pd.Series(pd.NA, index=df.index, dtype='object')
+        return df[column]
+
+    def _normalize(self, df, start_index):
+        position = pd.RangeIndex(start_index, start_index + len(df))
+        item_name = _text(self._column(df, 'item'))
+        quantity_text = _text(self._column(df, 'quantity'))
+        sl_no = _number(self._column(df, 'sl_no'))
+        rows = pd.DataFrame({
+            'position': position,
+            'sl_no': sl_no.where(sl_no.notna() & (sl_no != 0), pd.Series(position + 1, index=df.index)),
+            'item_name': item_name,
+            'quantity': _number(quantity_text).fillna(1).astype(float),
+            'unit_name': _text(self._column(df, 'unit')).fillna(DEFAULT_UNIT),
+            'unit_price': _number(self._column(df, 'unit_price')).astype(float),
+        }, index=df.index)
+        # Rows without an item name or quantity are skipped
+        rows = rows[item_name.notna() & quantity_text.notna()]
+        rows['sl_no'] = rows['sl_no'].astype(int)
+        return rows.reset_index(drop=True)
+
+    @staticmethod
+    def _resolve_names(model, names):
+        """
+        Case-insensitive get-or-create for every distinct name in ``names``.
+        Returns a frame of key/id/name and the names that were created.
+        """
+        wanted = (
+            pd.DataFrame({'name': names.astype(str), 'key': names.str.lower().astype(str)})
+            .drop_duplicates('key')
+        )
+        existing = _lookup(model, wanted['key'].tolist())
+        missing = wanted[~wanted['key'].isin(existing['key'])]
+        created = missing['name'].tolist()
+        if created:
+            model.objects.bulk_create(
+                [model(name=name) for name in created],
+                ignore_conflicts=True,
+            )
+            # bulk_create sends no post_save signals
+            bump_collection_version(model)
+            existing = pd.concat([existing, _lookup(model, missing['key'].tolist())])
+        return existing.drop_duplicates('key'), created
+
+
+def _lookup(model, keys):
+    rows = []
+    for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+        rows.extend(
+            model.objects.annotate(key=Lower('name'))
+            .filter(key__in=keys[start:start + LOOKUP_BATCH_SIZE])
+            .values('key', 'id', 'name')
+        )
+    return pd.DataFrame(rows, columns=['key', 'id', 'name'])
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from pre_job.models import RFQ, PurchaseOrder, Quotation, backfill_totals
+
+# model, related name of the items' parent FK, lookup of the VAT flag
+DOCUMENTS = [
+    (RFQ, "rfq", "vat_applicable"),
+    (Quotation, "quotation", "vat_applicable"),
+    (PurchaseOrder, "purchase_order", "quotation__vat_applicable"),
+]
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored subtotal, VAT and grand total of RFQs, quotations and purchase orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        for model, parent_field, vat_lookup in DOCUMENTS:
+            updated = backfill_totals(model, parent_field, vat_lookup, options["batch_size"])
+            self.stdout.write(f"{model.__name__}: {updated} updated")
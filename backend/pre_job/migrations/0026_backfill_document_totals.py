@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from pre_job.models import backfill_totals
+
+# model name, related name of the items' parent FK, lookup of the VAT flag
+DOCUMENTS = [
+    ("RFQ", "rfq", "vat_applicable"),
+    ("Quotation", "quotation", "vat_applicable"),
+    ("PurchaseOrder", "purchase_order", "quotation__vat_applicable"),
+]
+
+
+def backfill(apps, schema_editor):
+    # Rows that predate 0022 got 0.00 totals from the column default
+    for model_name, parent_field, vat_lookup in DOCUMENTS:
+        backfill_totals(apps.get_model("pre_job", model_name), parent_field, vat_lookup)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pre_job', '0025_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -1,267 +1,416 @@
-from django.db import models
-from datetime import timedelta
-from django.utils import timezone
-from series.models import NumberSeries
-from decimal import Decimal
-
-
-class RFQ(models.Model):
-    company_name = models.CharField(max_length=100, null=True, blank=True)
-    company_address = models.TextField(null=True, blank=True)
-    company_phone = models.CharField(max_length=100, null=True, blank=True)
-    company_email = models.EmailField(null=True, blank=True)
-    rfq_channel = models.ForeignKey(
-        "channels.RFQChannel", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    point_of_contact_name = models.CharField(max_length=100, null=True, blank=True)
-    point_of_contact_email = models.EmailField(null=True, blank=True)
-    point_of_contact_phone = models.CharField(max_length=100, null=True, blank=True)
-    assigned_sales_person = models.ForeignKey(
-        "team.TeamMember", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    due_date_for_quotation = models.DateField(null=True, blank=True)
-    rfq_status = models.CharField(
-        max_length=20,
-        choices=[
-            ("Pending", "Pending"),
-            ("Processing", "Processing"),
-            ("Completed", "Completed"),
-        ],
-        null=True,
-        blank=True,
-    )
-    series_number = models.CharField(max_length=50, unique=True, blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    email_sent = models.BooleanField(default=False, blank=True, null=True)
-    vat_applicable = models.BooleanField(default=False, blank=True, null=True)
-
-    def __str__(self):
-        return f"RFQ {self.id} - {self.company_name or 'Unnamed'}"
-
-    def get_subtotal(self):
-        return (
-            sum(
-                item.quantity * item.unit_price
-                for item in self.items.all()
-                if item.quantity and item.unit_price
-            )
-            or 0
-        )
-
-    def get_vat_amount(self):
-        if self.vat_applicable:
-            return self.get_subtotal() * Decimal("0.15")
-        return 0
-
-    def get_grand_total(self):
-        return self.get_subtotal() + self.get_vat_amount()
-
-
-class RFQItem(models.Model):
-    rfq = models.ForeignKey(RFQ, related_name="items", on_delete=models.CASCADE)
-    item = models.ForeignKey(
-        "item.Item", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    quantity = models.PositiveIntegerField(null=True, blank=True)
-    unit = models.ForeignKey(
-        "unit.Unit", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    unit_price = models.DecimalField(
-        max_digits=10, decimal_places=2, null=True, blank=True
-    )
-
-    def __str__(self):
-        return f"{self.item} - {self.rfq}"
-
-# models.py - Updated QuotationTerms model
-class QuotationTerms(models.Model):
-    content = models.TextField(null=True, blank=True, default="")
-    updated_at = models.DateTimeField(null=True, blank=True, auto_now=True)
-    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)  # ✅ ADD created_at field
-    is_default = models.BooleanField(default=False)
-    
-    class Meta:
-        verbose_name_plural = "Quotation Terms & Conditions"
-        ordering = ['-updated_at']  # ✅ ADDED: Show latest first
-
-    def __str__(self):
-        if self.is_default:
-            return f"Default Terms ({self.updated_at.strftime('%Y-%m-%d') if self.updated_at else 'N/A'})"
-        return f"Custom Terms ({self.updated_at.strftime('%Y-%m-%d') if self.updated_at else 'N/A'})"
-
-    def save(self, *args, **kwargs):
-        # Ensure only one default term exists
-        if self.is_default:
-            # Use pk instead of id for consistency (pk works before and after save)
-            QuotationTerms.objects.filter(is_default=True).exclude(pk=self.pk).update(is_default=False)
-        super().save(*args, **kwargs)
-
-
-class Quotation(models.Model):
-    rfq = models.ForeignKey(RFQ, on_delete=models.CASCADE, related_name="quotations")
-    company_name = models.CharField(max_length=100, null=True, blank=True)
-    company_address = models.TextField(null=True, blank=True)
-    company_phone = models.CharField(max_length=50, null=True, blank=True)
-    company_email = models.EmailField(null=True, blank=True)
-    rfq_channel = models.ForeignKey(
-        "channels.RFQChannel", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    point_of_contact_name = models.CharField(max_length=100, null=True, blank=True)
-    point_of_contact_email = models.EmailField(null=True, blank=True)
-    point_of_contact_phone = models.CharField(max_length=50, null=True, blank=True)
-    assigned_sales_person = models.ForeignKey(
-        "team.TeamMember", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    due_date_for_quotation = models.DateField(null=True, blank=True)
-    quotation_status = models.CharField(
-        max_length=20,
-        choices=[
-            ("Pending", "Pending"),
-            ("Approved", "Approved"),
-            ("PO Created", "PO Created"),
-            ("Not Approved", "Not Approved"),
-        ],
-        default="Pending",
-    )
-    not_approved_reason_remark = models.TextField(null=True, blank=True)
-    next_followup_date = models.DateField(null=True, blank=True)
-    followup_frequency = models.CharField(
-        max_length=20,
-        choices=[
-            ("24_hours", "24 Hours"),
-            ("3_days", "3 Days"),
-            ("7_days", "7 Days"),
-            ("every_7th_day", "Every 7th Day"),
-        ],
-        default="24_hours",
-    )
-    remarks = models.TextField(null=True, blank=True)
-    series_number = models.CharField(max_length=50, unique=True, blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    email_sent = models.BooleanField(default=False, blank=True, null=True)
-    vat_applicable = models.BooleanField(default=False, blank=True, null=True)
-    terms = models.ForeignKey(
-        QuotationTerms, on_delete=models.SET_NULL, null=True, blank=True
-    )
-
-    def __str__(self):
-        return f"Quotation {self.id} - {self.company_name or 'Unnamed'}"
-
-    def save(self, *args, **kwargs):
-        if not self.next_followup_date or "followup_frequency" in kwargs.get(
-            "update_fields", []
-        ):
-            today = self.created_at.date() if self.created_at else timezone.now().date()
-            if self.followup_frequency == "24_hours":
-                self.next_followup_date = today + timedelta(days=1)
-            elif self.followup_frequency == "3_days":
-                self.next_followup_date = today + timedelta(days=3)
-            elif self.followup_frequency == "7_days":
-                self.next_followup_date = today + timedelta(days=7)
-            elif self.followup_frequency == "every_7th_day":
-                self.next_followup_date = today + timedelta(days=7)
-        super().save(*args, **kwargs)
-
-    def get_subtotal(self):
-        return (
-            sum(
-                item.quantity * item.unit_price
-                for item in self.items.all()
-                if item.quantity and item.unit_price
-            )
-            or 0
-        )
-
-    def get_vat_amount(self):
-        if self.vat_applicable:
-            return self.get_subtotal() * Decimal("0.15")
-        return 0
-
-    def get_grand_total(self):
-        return self.get_subtotal() + self.get_vat_amount()
-
-
-class QuotationItem(models.Model):
-    quotation = models.ForeignKey(
-        Quotation, related_name="items", on_delete=models.CASCADE
-    )
-    item = models.ForeignKey(
-        "item.Item", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    quantity = models.PositiveIntegerField(null=True, blank=True)
-    unit = models.ForeignKey(
-        "unit.Unit", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    unit_price = models.DecimalField(
-        max_digits=10, decimal_places=2, null=True, blank=True
-    )
-
-    def __str__(self):
-        return f"{self.item} - {self.quotation}"
-
-
-class PurchaseOrder(models.Model):
-    quotation = models.ForeignKey(
-        Quotation, on_delete=models.CASCADE, related_name="purchase_orders"
-    )
-    order_type = models.CharField(
-        max_length=20,
-        choices=[("full", "Full"), ("partial", "Partial")],
-        default="full",
-    )
-    client_po_number = models.CharField(max_length=100, blank=True, null=True)
-    po_file = models.FileField(upload_to="po_files/", blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    series_number = models.CharField(max_length=50, unique=True, blank=True, null=True)
-    status = models.CharField(
-        max_length=20,
-        choices=[
-            ("Collection Pending", "Collection Pending"),
-            ("Collected", "Collected"),
-            ("Completed", "Completed"),
-        ],
-        default="Collection Pending",
-    )
-
-    def __str__(self):
-        return f"PO {self.id} - {self.quotation.company_name or 'Unnamed'} ({self.order_type})"
-
-    def save(self, *args, **kwargs):
-        if not self.series_number and self._state.adding:
-            try:
-                po_series = NumberSeries.objects.get(series_name="PurchaseOrder")
-                max_sequence = PurchaseOrder.objects.filter(
-                    series_number__startswith=po_series.prefix
-                ).aggregate(models.Max("series_number"))["series_number__max"]
-                sequence = 1
-                if max_sequence:
-                    sequence = int(max_sequence.split("-")[-1]) + 1
-                self.series_number = f"{po_series.prefix}-{sequence:06d}"
-            except NumberSeries.DoesNotExist:
-                max_sequence = PurchaseOrder.objects.filter(
-                    series_number__startswith="PO-PRIME"
-                ).aggregate(models.Max("series_number"))["series_number__max"]
-                sequence = 1
-                if max_sequence:
-                    sequence = int(max_sequence.split("-")[-1]) + 1
-                self.series_number = f"PO-PRIME-{sequence:06d}"
-        super().save(*args, **kwargs)
-
-
-class PurchaseOrderItem(models.Model):
-    purchase_order = models.ForeignKey(
-        PurchaseOrder, related_name="items", on_delete=models.CASCADE
-    )
-    item = models.ForeignKey(
-        "item.Item", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    quantity = models.PositiveIntegerField(null=True, blank=True)
-    unit = models.ForeignKey(
-        "unit.Unit", on_delete=models.SET_NULL, null=True, blank=True
-    )
-    unit_price = models.DecimalField(
-        max_digits=10, decimal_places=2, null=True, blank=True
-    )
-
-    def __str__(self):
-        return f"{self.item} - {self.purchase_order}"
+from django.db import models
+from django.conf import settings
+from datetime import timedelta
+from django.utils import timezone
+from series.models import NumberSeries
+from series.services import SeriesAllocator
+from decimal import Decimal, ROUND_HALF_UP
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from backend.etags import bump_collection_version
+from .terms import DEFAULT_TERMS_CONTENT
+
+DEFAULT_TERMS_CACHE_KEY = "pre_job:default_terms:content"
+DEFAULT_TERMS_CACHE_TIMEOUT = 60 * 60
+VAT_RATE = Decimal("0.15")
+TOTAL_FIELDS = ["subtotal", "vat_amount", "grand_total"]
+MONEY_FIELD = DecimalField(max_digits=20, decimal_places=2)
+
+
+def round_money(value):
+    return Decimal(value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def backfill_totals(model, parent_field, vat_lookup, batch_size=1000):
+    """
+    Recompute the stored totals of every ``model`` row in batches of
+    ``batch_size``, one grouped items query per batch, and save the changed
+    ones with bulk_update. ``parent_field`` is the items' FK to ``model`` and
+    ``vat_lookup`` the path to the VAT flag. Also used by migrations with
+    historical models. Returns the number of rows updated.
+    """
+    item_model = model._meta.get_field("items").related_model
+    updated = 0
+    last_pk = 0
+    while True:
+        rows = list(
+            model.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", vat_lookup, *TOTAL_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return updated
+        last_pk = rows[-1][0]
+        subtotals = dict(
+            item_model.objects.filter(**{f"{parent_field}_id__in": [row[0] for row in rows]})
+            .order_by()
+            .values_list(parent_field)
+            .annotate(
+                total=Sum(ExpressionWrapper(F("quantity") * F("unit_price"), output_field=MONEY_FIELD))
+            )
+        )
+        changed = []
+        for pk, vat_applicable, *stored in rows:
+            subtotal = round_money(subtotals.get(pk) or 0)
+            vat_amount = round_money(subtotal * VAT_RATE) if vat_applicable else Decimal("0.00")
+            totals = [subtotal, vat_amount, subtotal + vat_amount]
+            if totals != stored:
+                changed.append(model(pk=pk, **dict(zip(TOTAL_FIELDS, totals))))
+        with transaction.atomic():
+            model.objects.bulk_update(changed, TOTAL_FIELDS)
+        updated += len(changed)
+
+
+class DocumentTotals(models.Model):
+    """
+    Stored money totals of a document with line items. Whatever writes the
+    items calls refresh_totals() in the same transaction.
+    """
+
+    subtotal = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    vat_amount = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    grand_total = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+
+    class Meta:
+        abstract = True
+
+    def is_vat_applicable(self):
+        return bool(self.vat_applicable)
+
+    def compute_totals(self):
+        """(subtotal, vat_amount, grand_total) summed from the items in SQL."""
+        subtotal = self.items.aggregate(
+            total=Sum(ExpressionWrapper(F("quantity") * F("unit_price"), output_field=MONEY_FIELD))
+        )["total"] or Decimal("0")
+        subtotal = round_money(subtotal)
+        vat_amount = round_money(subtotal * VAT_RATE) if self.is_vat_applicable() else Decimal("0.00")
+        return subtotal, vat_amount, subtotal + vat_amount
+
+    def refresh_totals(self, save=True):
+        self.subtotal, self.vat_amount, self.grand_total = self.compute_totals()
+        if save:
+            self.save(update_fields=[*TOTAL_FIELDS, "updated_at"])
+
+    def get_subtotal(self):
+        return self.subtotal
+
+    def get_vat_amount(self):
+        return self.vat_amount
+
+    def get_grand_total(self):
+        return self.grand_total
+
+
+class RFQ(DocumentTotals):
+    company_name = models.CharField(max_length=100, null=True, blank=True)
+    company_address = models.TextField(null=True, blank=True)
+    company_phone = models.CharField(max_length=100, null=True, blank=True)
+    company_email = models.EmailField(null=True, blank=True)
+    rfq_channel = models.ForeignKey(
+        "channels.RFQChannel", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    point_of_contact_name = models.CharField(max_length=100, null=True, blank=True)
+    point_of_contact_email = models.EmailField(null=True, blank=True)
+    point_of_contact_phone = models.CharField(max_length=100, null=True, blank=True)
+    assigned_sales_person = models.ForeignKey(
+        "team.TeamMember", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    due_date_for_quotation = models.DateField(null=True, blank=True)
+    rfq_status = models.CharField(
+        max_length=20,
+        choices=[
+            ("Pending", "Pending"),
+            ("Processing", "Processing"),
+            ("Completed", "Completed"),
+        ],
+        null=True,
+        blank=True,
+    )
+    series_number = models.CharField(max_length=50, unique=True, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    email_sent = models.BooleanField(default=False, blank=True, null=True)
+    vat_applicable = models.BooleanField(default=False, blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["rfq_status", "created_at"], name="rfq_status_created_idx"),
+            models.Index(fields=["created_at"], name="rfq_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"RFQ {self.id} - {self.company_name or 'Unnamed'}"
+
+
+class RFQItem(models.Model):
+    rfq = models.ForeignKey(RFQ, related_name="items", on_delete=models.CASCADE)
+    item = models.ForeignKey(
+        "item.Item", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    quantity = models.PositiveIntegerField(null=True, blank=True)
+    unit = models.ForeignKey(
+        "unit.Unit", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    unit_price = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True
+    )
+
+    def __str__(self):
+        return f"{self.item} - {self.rfq}"
+
+# models.py - Updated QuotationTerms model
+class QuotationTerms(models.Model):
+    content = models.TextField(null=True, blank=True, default="")
+    updated_at = models.DateTimeField(null=True, blank=True, auto_now=True)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)  # ✅ ADD created_at field
+    is_default = models.BooleanField(default=False)
+    
+    class Meta:
+        verbose_name_plural = "Quotation Terms & Conditions"
+        ordering = ['-updated_at']  # ✅ ADDED: Show latest first
+
+    def __str__(self):
+        if self.is_default:
+            return f"Default Terms ({self.updated_at.strftime('%Y-%m-%d') if self.updated_at else 'N/A'})"
+        return f"Custom Terms ({self.updated_at.strftime('%Y-%m-%d') if self.updated_at else 'N/A'})"
+
+    def save(self, *args, **kwargs):
+        # Ensure only one default term exists
+        if self.is_default:
+            # Use pk instead of id for consistency (pk works before and after save)
+            QuotationTerms.objects.filter(is_default=True).exclude(pk=self.pk).update(is_default=False)
+        previous_key = self.content_cache_key(self.pk, self.updated_at) if self.pk else None
+        super().save(*args, **kwargs)
+        if previous_key:
+            transaction.on_commit(lambda: cache.delete(previous_key))
+
+    def delete(self, *args, **kwargs):
+        previous_key = self.content_cache_key(self.pk, self.updated_at)
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(lambda: cache.delete(previous_key))
+        return result
+
+    @staticmethod
+    def content_cache_key(pk, updated_at):
+        return f"{DEFAULT_TERMS_CACHE_KEY}:{pk}:{updated_at.timestamp() if updated_at else ''}"
+
+    @classmethod
+    def get_default_content(cls):
+        """
+        Default terms content, cached under the default row's pk and
+        updated_at, which are read with one small query each time: a saved
+        or replaced default row is picked up by every process as soon as it
+        is committed, and the superseded entry is dropped after the commit.
+        Read-only: falls back to DEFAULT_TERMS_CONTENT when no default row
+        exists.
+        """
+        default_terms = cls.objects.filter(is_default=True).values_list("pk", "updated_at").first()
+        if default_terms:
+            key = cls.content_cache_key(*default_terms)
+        else:
+            key = f"{DEFAULT_TERMS_CACHE_KEY}:builtin"
+        content = cache.get(key)
+        if content is None:
+            if default_terms:
+                content = cls.objects.filter(pk=default_terms[0]).values_list("content", flat=True).first()
+            content = content.strip() if content else DEFAULT_TERMS_CONTENT
+            cache.set(key, content, DEFAULT_TERMS_CACHE_TIMEOUT)
+        return content
+
+
+class Quotation(DocumentTotals):
+    rfq = models.ForeignKey(RFQ, on_delete=models.CASCADE, related_name="quotations")
+    company_name = models.CharField(max_length=100, null=True, blank=True)
+    company_address = models.TextField(null=True, blank=True)
+    company_phone = models.CharField(max_length=50, null=True, blank=True)
+    company_email = models.EmailField(null=True, blank=True)
+    rfq_channel = models.ForeignKey(
+        "channels.RFQChannel", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    point_of_contact_name = models.CharField(max_length=100, null=True, blank=True)
+    point_of_contact_email = models.EmailField(null=True, blank=True)
+    point_of_contact_phone = models.CharField(max_length=50, null=True, blank=True)
+    assigned_sales_person = models.ForeignKey(
+        "team.TeamMember", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    due_date_for_quotation = models.DateField(null=True, blank=True)
+    quotation_status = models.CharField(
+        max_length=20,
+        choices=[
+            ("Pending", "Pending"),
+            ("Approved", "Approved"),
+            ("PO Created", "PO Created"),
+            ("Not Approved", "Not Approved"),
+        ],
+        default="Pending",
+    )
+    not_approved_reason_remark = models.TextField(null=True, blank=True)
+    next_followup_date = models.DateField(null=True, blank=True)
+    followup_frequency = models.CharField(
+        max_length=20,
+        choices=[
+            ("24_hours", "24 Hours"),
+            ("3_days", "3 Days"),
+            ("7_days", "7 Days"),
+            ("every_7th_day", "Every 7th Day"),
+        ],
+        default="24_hours",
+    )
+    remarks = models.TextField(null=True, blank=True)
+    series_number = models.CharField(max_length=50, unique=True, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    email_sent = models.BooleanField(default=False, blank=True, null=True)
+    vat_applicable = models.BooleanField(default=False, blank=True, null=True)
+    terms = models.ForeignKey(
+        QuotationTerms, on_delete=models.SET_NULL, null=True, blank=True
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["quotation_status", "created_at"], name="quotation_status_created_idx"),
+            models.Index(fields=["created_at"], name="quotation_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"Quotation {self.id} - {self.company_name or 'Unnamed'}"
+
+    def save(self, *args, **kwargs):
+        if not self.next_followup_date or "followup_frequency" in kwargs.get(
+            "update_fields", []
+        ):
+            today = self.created_at.date() if self.created_at else timezone.now().date()
+            if self.followup_frequency == "24_hours":
+                self.next_followup_date = today + timedelta(days=1)
+            elif self.followup_frequency == "3_days":
+                self.next_followup_date = today + timedelta(days=3)
+            elif self.followup_frequency == "7_days":
+                self.next_followup_date = today + timedelta(days=7)
+            elif self.followup_frequency == "every_7th_day":
+                self.next_followup_date = today + timedelta(days=7)
+        super().save(*args, **kwargs)
+
+
+class QuotationItem(models.Model):
+    quotation = models.ForeignKey(
+        Quotation, related_name="items", on_delete=models.CASCADE
+    )
+    item = models.ForeignKey(
+        "item.Item", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    quantity = models.PositiveIntegerField(null=True, blank=True)
+    unit = models.ForeignKey(
+        "unit.Unit", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    unit_price = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True
+    )
+
+    def __str__(self):
+        return f"{self.item} - {self.quotation}"
+
+
+class PurchaseOrder(DocumentTotals):
+    quotation = models.ForeignKey(
+        Quotation, on_delete=models.CASCADE, related_name="purchase_orders"
+    )
+    order_type = models.CharField(
+        max_length=20,
+        choices=[("full", "Full"), ("partial", "Partial")],
+        default="full",
+    )
+    client_po_number = models.CharField(max_length=100, blank=True, null=True)
+    po_file = models.FileField(upload_to="po_files/", blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    series_number = models.CharField(max_length=50, unique=True, blank=True, null=True)
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ("Collection Pending", "Collection Pending"),
+            ("Collected", "Collected"),
+            ("Completed", "Completed"),
+        ],
+        default="Collection Pending",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="po_status_created_idx"),
+            models.Index(fields=["created_at"], name="po_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"PO {self.id} - {self.quotation.company_name or 'Unnamed'} ({self.order_type})"
+
+    def is_vat_applicable(self):
+        # Purchase orders follow the VAT setting of their quotation
+        return bool(self.quotation.vat_applicable)
+
+    def save(self, *args, **kwargs):
+        if not self.series_number and self._state.adding:
+            self.series_number = SeriesAllocator(
+                "PurchaseOrder", PurchaseOrder, "series_number", default_prefix="PO-PRIME"
+            ).allocate()
+        super().save(*args, **kwargs)
+
+
+class PurchaseOrderItem(models.Model):
+    purchase_order = models.ForeignKey(
+        PurchaseOrder, related_name="items", on_delete=models.CASCADE
+    )
+    item = models.ForeignKey(
+        "item.Item", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    quantity = models.PositiveIntegerField(null=True, blank=True)
+    unit = models.ForeignKey(
+        "unit.Unit", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    unit_price = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True
+    )
+
+    def __str__(self):
+        return f"{self.item} - {self.purchase_order}"
+
+
+class ImportJob(models.Model):
+    file = models.FileField(upload_to="import_jobs/")
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ("Pending", "Pending"),
+            ("Processing", "Processing"),
+            ("Completed", "Completed"),
+            ("Failed", "Failed"),
+        ],
+        default="Pending",
+    )
+    rows_processed = models.PositiveIntegerField(default=0)
+    rows_failed = models.PositiveIntegerField(default=0)
+    created_items = models.JSONField(default=list, blank=True)
+    created_units = models.JSONField(default=list, blank=True)
+    items = models.JSONField(default=list, blank=True)
+    error = models.TextField(blank=True, null=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Import {self.id} - {self.status}"
+
+
+@receiver([post_save, post_delete], sender=RFQ)
+@receiver([post_save, post_delete], sender=RFQItem)
+@receiver([post_save, post_delete], sender=Quotation)
+@receiver([post_save, post_delete], sender=QuotationItem)
+@receiver([post_save, post_delete], sender=QuotationTerms)
+@receiver([post_save, post_delete], sender=PurchaseOrder)
+@receiver([post_save, post_delete], sender=PurchaseOrderItem)
+def bump_documents_version(sender, **kwargs):
+    bump_collection_version(sender)
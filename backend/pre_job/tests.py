@@ -1,3 +1,207 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.db import connection
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+
+from backend.testing import QueryBudgetTestCase, create_order_fixtures
+from item.models import Item
+from unit.models import Unit
+
+from .models import RFQ, PurchaseOrder, PurchaseOrderItem, Quotation, QuotationItem, QuotationTerms
+from .serializers import QuotationSummarySerializer
+
+
+class QueryBudgetTests(QueryBudgetTestCase):
+    """Query budgets for the pre-job routes with three full order chains."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=3)
+        cls.rfq = RFQ.objects.first()
+        cls.quotation = Quotation.objects.first()
+        cls.purchase_order = PurchaseOrder.objects.first()
+
+    def test_rfq_routes(self):
+        self.assertQueryBudget("/api/rfqs/", 7)
+        self.assertQueryBudget(f"/api/rfqs/{self.rfq.pk}/", 3)
+
+    def test_quotation_routes(self):
+        self.assertQueryBudget("/api/quotations/", 5)
+        self.assertQueryBudget(f"/api/quotations/{self.quotation.pk}/", 5)
+
+    def test_purchase_order_routes(self):
+        self.assertQueryBudget("/api/purchase-orders/", 2)
+        self.assertQueryBudget(f"/api/purchase-orders/{self.purchase_order.pk}/", 2)
+
+    def test_summary_views(self):
+        response = self.assertQueryBudget("/api/quotations/?view=summary", 1)
+        self.assertEqual(
+            set(response.json()[0]),
+            set(QuotationSummarySerializer.Meta.fields),
+        )
+        response = self.assertQueryBudget("/api/purchase-orders/?view=summary&page_size=2", 1)
+        self.assertEqual(response.json()["results"][0]["customer"], "Company 2")
+
+    def test_terms_and_import_job_routes(self):
+        self.assertQueryBudget("/api/terms/", 1)
+        self.assertQueryBudget("/api/import-jobs/", 1)
+
+
+class ListResponseTests(QueryBudgetTestCase):
+    """Opt-in cursor pagination and ``?fields=`` on a document list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=5, lines=2)
+
+    def test_lists_stay_plain_arrays_unless_paginated(self):
+        self.assertEqual(len(self.client.get("/api/rfqs/").json()), 5)
+
+    def test_cursor_pages_cover_the_list_once(self):
+        numbers = []
+        url = "/api/rfqs/?page_size=2&fields=id,series_number"
+        while url:
+            page = self.client.get(url).json()
+            self.assertLessEqual(len(page["results"]), 2)
+            numbers.extend(row["series_number"] for row in page["results"])
+            url = page["next"]
+        self.assertEqual(numbers, [f"TEST-RFQ-{number:03d}" for number in reversed(range(5))])
+
+    def test_sparse_fields_skip_the_nested_items(self):
+        response = self.assertQueryBudget("/api/rfqs/?fields=id,series_number", 1)
+        self.assertEqual(set(response.json()[0]), {"id", "series_number"})
+
+
+class NestedItemValidationTests(QueryBudgetTestCase):
+    """Nested item ids are resolved per model, not per line."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=2, lines=30)
+        cls.rfqs = list(RFQ.objects.order_by("id"))
+        cls.items = list(Item.objects.values_list("id", flat=True))
+        cls.unit = Unit.objects.get().pk
+
+    def create_quotation(self, rfq, lines):
+        payload = {
+            "rfq": rfq.pk,
+            "company_name": rfq.company_name,
+            "rfq_channel": rfq.rfq_channel_id,
+            "assigned_sales_person": rfq.assigned_sales_person_id,
+            "items": [
+                {"item": item, "quantity": 1, "unit": self.unit, "unit_price": "10.00"}
+                for item in self.items[:lines]
+            ],
+        }
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post("/api/quotations/", payload, format="json")
+        self.assertEqual(response.status_code, 201, response.content[:500])
+        self.assertEqual(len(response.json()["items"]), lines)
+        return len(context.captured_queries)
+
+    def test_quotation_create_does_not_grow_with_lines(self):
+        few = self.create_quotation(self.rfqs[0], 3)
+        many = self.create_quotation(self.rfqs[1], 30)
+        self.assertLessEqual(many, few)
+
+    def test_unknown_item_is_rejected(self):
+        payload = {
+            "rfq": self.rfqs[0].pk,
+            "rfq_channel": None,
+            "assigned_sales_person": None,
+            "items": [{"item": 0, "quantity": 1, "unit": self.unit, "unit_price": "1.00"}],
+        }
+        response = self.client.post("/api/quotations/", payload, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("item", response.json()["items"][0])
+
+    def test_boolean_item_is_rejected(self):
+        self.assertIn(1, self.items)
+        payload = {
+            "rfq": self.rfqs[0].pk,
+            "rfq_channel": None,
+            "assigned_sales_person": None,
+            "items": [{"item": True, "quantity": 1, "unit": self.unit, "unit_price": "1.00"}],
+        }
+        response = self.client.post("/api/quotations/", payload, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Incorrect type", response.json()["items"][0]["item"][0])
+
+
+class PurchaseOrderWriteTests(QueryBudgetTestCase):
+    """Purchase order lines are written in bulk, whatever the line count."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_order_fixtures(count=1, lines=1)
+        cls.quotation = Quotation.objects.get()
+        cls.unit = Unit.objects.get()
+        Item.objects.bulk_create(Item(name=f"Line {index}") for index in range(500))
+        QuotationItem.objects.bulk_create(
+            QuotationItem(quotation=cls.quotation, item=item, quantity=2, unit=cls.unit, unit_price=5)
+            for item in Item.objects.filter(name__startswith="Line ")
+        )
+
+    def test_full_conversion_of_a_large_quotation(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                "/api/purchase-orders/",
+                {"quotation": self.quotation.pk, "order_type": "full"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201, response.content[:500])
+        # Constant in the line count; SQLite splits the 501 row insert in three
+        queries = [query["sql"] for query in context.captured_queries]
+        self.assertLessEqual(len(queries), 25, "\n".join(queries))
+        purchase_order = PurchaseOrder.objects.get(pk=response.json()["id"])
+        self.assertEqual(purchase_order.items.count(), 501)
+        self.assertEqual(purchase_order.grand_total, 5010)
+        self.quotation.refresh_from_db()
+        self.assertEqual(self.quotation.quotation_status, "PO Created")
+
+    def test_update_only_touches_changed_lines(self):
+        purchase_order = PurchaseOrder.objects.get()
+        original = purchase_order.items.get()
+        items = list(Item.objects.filter(name__startswith="Line ")[:2])
+        payload = [
+            {"item": original.item_id, "quantity": original.quantity, "unit": self.unit.pk, "unit_price": "10.00"},
+            {"item": items[0].pk, "quantity": 4, "unit": self.unit.pk, "unit_price": "1.50"},
+        ]
+        response = self.client.patch(
+            f"/api/purchase-orders/{purchase_order.pk}/", {"items": payload}, format="json"
+        )
+        self.assertEqual(response.status_code, 200, response.content[:500])
+        self.assertEqual(purchase_order.items.get(item=original.item).pk, original.pk)
+
+        payload[0]["quantity"] = 9
+        payload[1]["item"] = items[1].pk
+        response = self.client.patch(
+            f"/api/purchase-orders/{purchase_order.pk}/", {"items": payload}, format="json"
+        )
+        self.assertEqual(response.status_code, 200, response.content[:500])
+        lines = {line.item_id: line for line in purchase_order.items.all()}
+        self.assertEqual(set(lines), {original.item_id, items[1].pk})
+        self.assertEqual(lines[original.item_id].pk, original.pk)
+        self.assertEqual(lines[original.item_id].quantity, 9)
+        purchase_order.refresh_from_db()
+        self.assertEqual(purchase_order.subtotal, 96)
+
+
+class DefaultTermsTests(QueryBudgetTestCase):
+    def test_cached_content_follows_the_default_row(self):
+        terms = QuotationTerms.objects.create(content="First terms", is_default=True)
+        self.assertEqual(QuotationTerms.get_default_content(), "First terms")
+        # A write from another process never touches this process's cache
+        QuotationTerms.objects.filter(pk=terms.pk).update(
+            content="Second terms", updated_at=timezone.now() + timedelta(seconds=1)
+        )
+        self.assertEqual(QuotationTerms.get_default_content(), "Second terms")
+        with self.assertNumQueries(1):
+            self.assertEqual(QuotationTerms.get_default_content(), "Second terms")
+        terms.delete()
+        self.assertNotEqual(QuotationTerms.get_default_content(), "Second terms")
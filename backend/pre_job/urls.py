@@ -1,13 +1,14 @@
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from .views import RFQViewSet, QuotationViewSet, PurchaseOrderViewSet, QuotationTermsViewSet
-
-router = DefaultRouter()
-router.register(r'rfqs', RFQViewSet, basename='rfq')
-router.register(r'quotations', QuotationViewSet, basename='quotation')
-router.register(r'purchase-orders', PurchaseOrderViewSet, basename='purchase-order')
-router.register(r'terms', QuotationTermsViewSet, basename='terms') 
-
-urlpatterns = [
-    path('', include(router.urls)),
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import RFQViewSet, QuotationViewSet, PurchaseOrderViewSet, QuotationTermsViewSet, ImportJobViewSet
+
+router = DefaultRouter()
+router.register(r'rfqs', RFQViewSet, basename='rfq')
+router.register(r'quotations', QuotationViewSet, basename='quotation')
+router.register(r'purchase-orders', PurchaseOrderViewSet, basename='purchase-order')
+router.register(r'terms', QuotationTermsViewSet, basename='terms') 
+router.register(r'import-jobs', ImportJobViewSet, basename='import-job')
+
+urlpatterns = [
+    path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('series', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeriesCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('series_name', models.CharField(max_length=100)),
+                ('prefix', models.CharField(max_length=50)),
+                ('last_value', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('series_name', 'prefix')},
+            },
+        ),
+    ]
@@ -1,4 +1,8 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.etags import bump_collection_version
 
 class NumberSeries(models.Model):
     series_name = models.CharField(max_length=100, unique=True)
@@ -8,3 +12,21 @@ class NumberSeries(models.Model):
 
     def __str__(self):
         return self.series_name
+
+
+class SeriesCounter(models.Model):
+    """Last sequence number handed out for a series/prefix pair."""
+    series_name = models.CharField(max_length=100)
+    prefix = models.CharField(max_length=50)
+    last_value = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("series_name", "prefix")
+
+    def __str__(self):
+        return f"{self.series_name} ({self.prefix}): {self.last_value}"
+
+
+@receiver([post_save, post_delete], sender=NumberSeries)
+def bump_series_version(sender, **kwargs):
+    bump_collection_version(sender)
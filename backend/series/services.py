@@ -0,0 +1,187 @@
+import re
+import uuid
+
+from django.db import transaction
+from django.db.models import BigIntegerField, CharField, F, Max, Value
+from django.db.models.functions import Cast, Concat, LPad, Substr
+
+from backend.etags import bump_collection_version
+
+from .models import NumberSeries, SeriesCounter
+
+SEQUENCE_WIDTH = 6
+SERIES_NUMBER_RE = re.compile(r"^(?P<prefix>.*?)(?P<separator>-?)(?P<sequence>\d+)$")
+# Parks renumbered rows outside the live range so the unique index never
+# sees two rows with the same number while the sequence is shifted.
+RENUMBER_MARKER = "~"
+
+
+def format_series_number(prefix, value):
+    return f"{prefix}-{value:0{SEQUENCE_WIDTH}d}"
+
+
+class SeriesBlock:
+    """
+    A contiguous range of sequence numbers reserved in one counter update.
+    Numbers are handed out with ``take()``; ``release()`` gives the unused
+    tail back if no other allocation happened after this block.
+    """
+
+    def __init__(self, counter_id, prefix, first, last):
+        self.counter_id = counter_id
+        self.prefix = prefix
+        self.first = first
+        self.last = last
+        self.next_value = first
+
+    def __len__(self):
+        return self.last - self.next_value + 1
+
+    def __iter__(self):
+        while len(self):
+            yield self.take()
+
+    def take(self):
+        if self.next_value > self.last:
+            raise ValueError("Series block exhausted")
+        value = self.next_value
+        self.next_value += 1
+        return format_series_number(self.prefix, value)
+
+    def release(self):
+        if not len(self):
+            return 0
+        unused = len(self)
+        released = SeriesCounter.objects.filter(
+            pk=self.counter_id, last_value=self.last
+        ).update(last_value=self.next_value - 1)
+        if not released:
+            return 0
+        self.last = self.next_value - 1
+        return unused
+
+
+class SeriesAllocator:
+    """
+    Allocates series numbers such as ``WO-PRM-000042`` from a per-series
+    counter row, incremented atomically, instead of scanning
+    ``MAX(number)`` on the document table.
+
+    The counter is seeded from the highest number already stored in
+    ``model.field`` the first time a series/prefix pair is used. When the
+    ``NumberSeries`` row is missing, ``default_prefix`` is used if given,
+    otherwise ``NumberSeries.DoesNotExist`` propagates.
+    """
+
+    def __init__(self, series_name, model, field, default_prefix=None):
+        self.series_name = series_name
+        self.model = model
+        self.field = field
+        self.default_prefix = default_prefix
+
+    def get_prefix(self):
+        try:
+            return NumberSeries.objects.get(series_name=self.series_name).prefix
+        except NumberSeries.DoesNotExist:
+            if self.default_prefix is None:
+                raise
+            return self.default_prefix
+
+    def allocate(self):
+        """Return the next series number."""
+        return self.reserve(1).take()
+
+    def reserve(self, count):
+        """Reserve ``count`` consecutive numbers, e.g. for a bulk import."""
+        if count < 1:
+            raise ValueError("count must be positive")
+        prefix = self.get_prefix()
+        with transaction.atomic():
+            counter, _ = SeriesCounter.objects.get_or_create(
+                series_name=self.series_name,
+                prefix=prefix,
+                defaults={"last_value": lambda: self.scan_last_value(prefix)},
+            )
+            SeriesCounter.objects.filter(pk=counter.pk).update(
+                last_value=F("last_value") + count
+            )
+            last = SeriesCounter.objects.values_list("last_value", flat=True).get(
+                pk=counter.pk
+            )
+        return SeriesBlock(counter.pk, prefix, last - count + 1, last)
+
+    def scan_last_value(self, prefix):
+        """Highest sequence already used with ``prefix`` (counter seeding only)."""
+        max_number = self.model.objects.filter(
+            **{f"{self.field}__startswith": f"{prefix}-"}
+        ).aggregate(max_number=Max(self.field))["max_number"]
+        if not max_number:
+            return 0
+        return int(max_number.split("-")[-1])
+
+
+def close_series_gap(model, field, deleted_number, series_name=None):
+    """
+    Shift every number after ``deleted_number`` that shares its prefix down
+    by one, using two set-based UPDATEs instead of one save() per row, and
+    rewind the ``series_name`` counter so the next allocation reuses the
+    freed number. Returns the number of renumbered rows.
+    """
+    match = SERIES_NUMBER_RE.match(deleted_number or "")
+    if not match:
+        return 0
+    prefix = match.group("prefix")
+    head = prefix + match.group("separator")
+    width = len(match.group("sequence"))
+    parked_head = RENUMBER_MARKER + head
+
+    with transaction.atomic():
+        # Lock the counter before shifting, so SeriesAllocator cannot hand out
+        # a number between the shift and the rewind below
+        counter = None
+        if series_name:
+            counter = (
+                SeriesCounter.objects.select_for_update()
+                .filter(series_name=series_name, prefix=prefix)
+                .first()
+            )
+        renumbered = model.objects.filter(
+            **{
+                f"{field}__regex": rf"^{re.escape(head)}[0-9]{{{width}}}$",
+                f"{field}__gt": deleted_number,
+            }
+        ).update(**{field: Concat(Value(RENUMBER_MARKER), F(field))})
+        if renumbered:
+            sequence = Cast(Substr(F(field), len(parked_head) + 1), BigIntegerField())
+            model.objects.filter(**{f"{field}__startswith": parked_head}).update(
+                **{
+                    field: Concat(
+                        Value(head),
+                        LPad(Cast(sequence - 1, CharField()), width, Value("0")),
+                    )
+                }
+            )
+        if counter is not None and counter.last_value >= int(match.group("sequence")):
+            SeriesCounter.objects.filter(pk=counter.pk).update(last_value=F("last_value") - 1)
+        if renumbered:
+            # The UPDATEs above send no post_save signals
+            bump_collection_version(model)
+    return renumbered
+
+
+def close_series_gap_later(model, field, deleted_number, series_name=None):
+    """
+    Queue ``close_series_gap`` on Celery once the current transaction
+    commits. Returns the task id, which can be polled at
+    ``/api/series/renumber-jobs/<task_id>/``.
+    """
+    from .tasks import close_series_gap_task
+
+    task_id = str(uuid.uuid4())
+    transaction.on_commit(
+        lambda: close_series_gap_task.apply_async(
+            args=[model._meta.label, field, deleted_number, series_name],
+            task_id=task_id,
+        )
+    )
+    return task_id
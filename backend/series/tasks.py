@@ -0,0 +1,25 @@
+from celery import shared_task
+from django.apps import apps
+import logging
+
+from .services import close_series_gap
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True)
+def close_series_gap_task(self, model_label, field, deleted_number, series_name=None):
+    """
+    Background renumbering after a document delete.
+    Progress is reported through the task state (PROGRESS, then SUCCESS).
+    """
+    self.update_state(
+        state="PROGRESS",
+        meta={"deleted_number": deleted_number, "renumbered": 0},
+    )
+    model = apps.get_model(model_label)
+    renumbered = close_series_gap(model, field, deleted_number, series_name)
+    logger.info(
+        f"Closed series gap at {deleted_number} on {model_label}.{field}: {renumbered} rows renumbered"
+    )
+    return {"deleted_number": deleted_number, "renumbered": renumbered}
@@ -1,3 +1,31 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from pre_job.models import RFQ
+
+from .models import SeriesCounter
+from .services import close_series_gap, format_series_number
+
+
+class CloseSeriesGapTests(TestCase):
+    def setUp(self):
+        for value in (1, 2, 3):
+            RFQ.objects.create(company_name="Company", series_number=format_series_number("RFQ", value))
+        self.counter = SeriesCounter.objects.create(series_name="RFQ", prefix="RFQ", last_value=3)
+
+    def test_renumbers_and_rewinds_under_the_counter_lock(self):
+        RFQ.objects.filter(series_number="RFQ-000002").delete()
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(close_series_gap(RFQ, "series_number", "RFQ-000002", "RFQ"), 1)
+        self.assertEqual(
+            sorted(RFQ.objects.values_list("series_number", flat=True)), ["RFQ-000001", "RFQ-000002"]
+        )
+        self.counter.refresh_from_db()
+        self.assertEqual(self.counter.last_value, 2)
+        # The counter row is read (FOR UPDATE where supported) before any renumbering
+        statements = [query["sql"] for query in context.captured_queries if "SAVEPOINT" not in query["sql"]]
+        self.assertTrue(statements[0].startswith("SELECT"))
+        self.assertIn("series_seriescounter", statements[0])
+        if connection.features.has_select_for_update:
+            self.assertIn("FOR UPDATE", statements[0])
@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import NumberSeriesViewSet
+from .views import NumberSeriesViewSet, RenumberJobStatusView
 
 router = DefaultRouter()
 router.register(r'series', NumberSeriesViewSet, basename='series')
 
 urlpatterns = [
+    path('series/renumber-jobs/<str:task_id>/', RenumberJobStatusView.as_view(), name='series_renumber_job'),
     path('', include(router.urls)),
-]
\ No newline at end of file
+]
@@ -1,9 +1,25 @@
+from celery.result import AsyncResult
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from .models import NumberSeries
 from .serializers import NumberSeriesSerializer
+from backend.mixins import ConditionalGetMixin
 
-class NumberSeriesViewSet(viewsets.ModelViewSet):
+class NumberSeriesViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     queryset = NumberSeries.objects.all()
-    serializer_class = NumberSeriesSerializer
\ No newline at end of file
+    etag_models = (NumberSeries,)
+    serializer_class = NumberSeriesSerializer
+
+
+class RenumberJobStatusView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, task_id):
+        result = AsyncResult(task_id)
+        info = result.info if isinstance(result.info, dict) else None
+        if result.failed():
+            info = {"error": str(result.info)}
+        return Response({"task_id": task_id, "state": result.state, "progress": info})
@@ -1,4 +1,8 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.etags import bump_collection_version
 
 class Technician(models.Model):
     name = models.CharField(max_length=100, unique=True, null=True, blank=True, help_text="Name of the technician")
@@ -22,4 +26,10 @@ class TeamMember(models.Model):
         return f"{self.name} - {self.designation}"
 
     class Meta:
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+
+
+@receiver([post_save, post_delete], sender=Technician)
+@receiver([post_save, post_delete], sender=TeamMember)
+def bump_team_version(sender, **kwargs):
+    bump_collection_version(sender)
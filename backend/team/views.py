@@ -2,13 +2,16 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from .models import TeamMember,Technician
 from .serializers import TeamMemberSerializer,TechnicianSerializer
+from backend.mixins import ConditionalGetMixin
 
-class TeamMemberViewSet(viewsets.ModelViewSet):
+class TeamMemberViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = TeamMember.objects.all()
+    etag_models = (TeamMember,)
     serializer_class = TeamMemberSerializer
     permission_classes = [AllowAny]
     
-class TechnicianViewSet(viewsets.ModelViewSet):
+class TechnicianViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Technician.objects.all()
+    etag_models = (Technician,)
     serializer_class = TechnicianSerializer
     permission_classes = [AllowAny]
\ No newline at end of file
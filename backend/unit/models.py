@@ -1,4 +1,8 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.etags import bump_collection_version
 
 class Unit(models.Model):
     name = models.CharField(max_length=50, unique=True, null=True, blank=True)
@@ -6,3 +10,8 @@ class Unit(models.Model):
 
     def __str__(self):
         return self.name
+
+
+@receiver([post_save, post_delete], sender=Unit)
+def bump_units_version(sender, **kwargs):
+    bump_collection_version(sender)
@@ -2,8 +2,10 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from .models import Unit
 from .serializers import UnitSerializer
+from backend.mixins import ConditionalGetMixin
 
-class UnitViewSet(viewsets.ModelViewSet):
+class UnitViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Unit.objects.all()
+    etag_models = (Unit,)
     serializer_class = UnitSerializer
     permission_classes = [AllowAny]
\ No newline at end of file
@@ -37,7 +37,7 @@ import ProcessedInvoices from "./pages/PostJobPhase/ProcessedInvoices";
 import Users from "./pages/UserRoles/Users";
 import Roles from "./pages/UserRoles/Roles";
 import Permissions from "./pages/UserRoles/Permissions";
-import apiClient from "./helpers/apiClient";
+import { loadPermissions } from "./helpers/tokenPermissions";
 import Loading from "./components/Loading";
 import InitiateDelivery from "./pages/JobExecution/ProcessingWorkOrders/InitiateDelivery";
 import EditDeclinedWorkOrders from "./pages/JobExecution/ProcessingWorkOrders/EditDeclinedWorkOrders";
@@ -62,31 +62,13 @@ const ProtectedRoute = ({
       }
 
       try {
-        const response = await apiClient.get("/profile/");
-        const user = response.data;
-
-        if (user.is_superuser || user.role?.name === "Superadmin") {
-          setHasPermission(true);
-          setIsLoading(false);
-          return;
-        }
-
-        const roleId = user.role?.id;
-        if (!roleId) {
-          setHasPermission(false);
-          setIsLoading(false);
-          return;
-        }
-
-        const roleResponse = await apiClient.get(`/roles/${roleId}/`);
-        const perms = roleResponse.data.permissions || [];
-        const pagePerm = perms.find((p) => p.page === requiredPage);
-
-        if (!requiredPage || (pagePerm && pagePerm[`can_${requiredAction}`])) {
-          setHasPermission(true);
-        } else {
-          setHasPermission(false);
-        }
+        const access = await loadPermissions();
+        const pagePerm = access.permissions.find((p) => p.page === requiredPage);
+        setHasPermission(
+          access.isSuperadmin ||
+            !requiredPage ||
+            Boolean(pagePerm && pagePerm[`can_${requiredAction}`])
+        );
       } catch (error) {
         console.error("Failed to fetch permissions:", error);
         setHasPermission(false);
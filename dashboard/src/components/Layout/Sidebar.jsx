@@ -37,6 +37,7 @@ import {
 import { motion, AnimatePresence } from "framer-motion";
 import logo from "../../assets/images/img-logo.webp";
 import apiClient from "../../helpers/apiClient";
+import { loadPermissions } from "../../helpers/tokenPermissions";
 
 const Sidebar = ({ toggleSidebar }) => {
   const location = useLocation();
@@ -56,21 +57,14 @@ const Sidebar = ({ toggleSidebar }) => {
   useEffect(() => {
     const fetchProfileAndCounts = async () => {
       try {
-        const [profileResponse, declinedWOsResponse, managerApprovalWOsResponse] = await Promise.all([
-          apiClient.get("/profile/"),
+        const [access, declinedWOsResponse, managerApprovalWOsResponse] = await Promise.all([
+          loadPermissions(),
           apiClient.get("work-orders/", { params: { status: "Declined" } }),
           apiClient.get("work-orders/", { params: { status: "Manager Approval" } }),
         ]);
 
-        const user = profileResponse.data;
-        setIsSuperadmin(user.is_superuser || user.role?.name === "Superadmin");
-        const roleId = user.role?.id;
-        if (roleId) {
-          const roleResponse = await apiClient.get(`/roles/${roleId}/`);
-          setPermissions(roleResponse.data.permissions || []);
-        } else {
-          setPermissions([]);
-        }
+        setIsSuperadmin(access.isSuperadmin);
+        setPermissions(access.permissions);
 
         setDeclinedWOsCount(declinedWOsResponse.data?.length || 0);
         setManagerApprovalWOsCount(managerApprovalWOsResponse.data?.length || 0);
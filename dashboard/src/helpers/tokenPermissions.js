@@ -0,0 +1,52 @@
+import apiClient from "./apiClient";
+
+const ACTION_BITS = {
+  can_view: 1,
+  can_add: 2,
+  can_edit: 4,
+  can_delete: 8,
+};
+
+const decodePayload = (token) => {
+  try {
+    const base64 = token.split(".")[1].replace(/-/g, "+").replace(/_/g, "/");
+    return JSON.parse(atob(base64));
+  } catch {
+    return null;
+  }
+};
+
+// Permissions embedded in the access token (JWT_EMBED_PERMISSIONS on the backend).
+// Returns null when the token carries no permission claims.
+export const getTokenPermissions = () => {
+  const token = localStorage.getItem("access_token");
+  const payload = token ? decodePayload(token) : null;
+  if (!payload || !payload.perms) return null;
+
+  const permissions = Object.entries(payload.perms).map(([page, bits]) => ({
+    page,
+    ...Object.fromEntries(
+      Object.entries(ACTION_BITS).map(([action, bit]) => [action, Boolean(bits & bit)])
+    ),
+  }));
+  return {
+    isSuperadmin: Boolean(payload.is_superuser) || payload.role === "Superadmin",
+    permissions,
+  };
+};
+
+// { isSuperadmin, permissions } for the signed-in user: read from the token
+// claims when present, otherwise from /profile/ and /roles/<id>/.
+export const loadPermissions = async () => {
+  const tokenPermissions = getTokenPermissions();
+  if (tokenPermissions) return tokenPermissions;
+
+  const response = await apiClient.get("/profile/");
+  const user = response.data;
+  const roleId = user.role?.id;
+  const permissions = roleId ? (await apiClient.get(`/roles/${roleId}/`)).data.permissions || [] : [];
+  return {
+    isSuperadmin: Boolean(user.is_superuser) || user.role?.name === "Superadmin",
+    permissions,
+  };
+};
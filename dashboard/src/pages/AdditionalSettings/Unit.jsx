@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import apiClient from '../../helpers/apiClient';
+import { loadPermissions } from '../../helpers/tokenPermissions';
 import InputField from '../../components/InputField';
 
 const Unit = () => {
@@ -19,16 +20,9 @@ const Unit = () => {
   useEffect(() => {
     const fetchProfile = async () => {
       try {
-        const response = await apiClient.get('/profile/');
-        const user = response.data;
-        setIsSuperadmin(user.is_superuser || user.role?.name === 'Superadmin');
-        const roleId = user.role?.id;
-        if (roleId) {
-          const res = await apiClient.get(`/roles/${roleId}/`);
-          setPermissions(res.data.permissions || []);
-        } else {
-          setPermissions([]);
-        }
+        const access = await loadPermissions();
+        setIsSuperadmin(access.isSuperadmin);
+        setPermissions(access.permissions);
       } catch (error) {
         console.error('Unable to fetch user profile:', error);
         setPermissions([]);
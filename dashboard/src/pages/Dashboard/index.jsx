@@ -66,62 +66,23 @@ const Dashboard = () => {
     const fetchCounts = async () => {
       try {
         setLoading(true);
-        const [
-          rfqsRes,
-          quotationsRes,
-          poRes,
-          woRes,
-          dnRes,
-          closedWoRes,
-          invoicesRes,
-          managerApprovalRes,
-          declinedWoRes,
-        ] = await Promise.all([
-          apiClient.get('/rfqs/'),
-          apiClient.get('/quotations/'),
-          apiClient.get('/purchase-orders/'),
-          apiClient.get('/work-orders/?status=Submitted,Manager Approval,Approved'),
-          apiClient.get('/delivery-notes/'),
-          apiClient.get('/work-orders/?status=Completed'),
-          apiClient.get('/invoices/?status=processed'),
-          apiClient.get('/work-orders/?status=Manager Approval'),
-          apiClient.get('/work-orders/?status=Declined'),
-        ]);
-
-        // Updated RFQ Logic: Enrich RFQs with hasQuotation check, then filter for Pending only
-        const rfqsWithQuotationStatus = await Promise.all(
-          rfqsRes.data.map(async (rfq) => {
-            try {
-              const quotationRes = await apiClient.get(`/quotations/?rfq=${rfq.id}`);
-              const hasQuotation = quotationRes.data.length > 0;
-              return { ...rfq, hasQuotation };
-            } catch (error) {
-              console.error(`Error checking quotation for RFQ ${rfq.id}:`, error);
-              return { ...rfq, hasQuotation: false };
-            }
-          })
-        );
-        const pendingRfqs = rfqsWithQuotationStatus.filter(
-          (rfq) => rfq.rfq_status === "Pending" && !rfq.hasQuotation
-        );
-
-        console.log('Work Orders Response:', woRes.data);
-        console.log('Invoices Response:', invoicesRes.data);
-        console.log('Manager Approval Response:', managerApprovalRes.data);
-        console.log('Declined Work Orders Response:', declinedWoRes.data);
-        console.log('Pending RFQs (filtered):', pendingRfqs.length);
+        const { data } = await apiClient.get('/dashboard/summary/');
+        const woByStatus = data.work_orders.by_status || {};
 
         setCounts({
-          rfqs: pendingRfqs.length, // Now only Pending RFQs without quotations
-          quotations: quotationsRes.data?.length || 0,
-          purchaseOrders: poRes.data?.length || 0,
-          workOrders: woRes.data?.length || 0, // Updated to count all relevant statuses
-          deliveryNotes: dnRes.data?.length || 0,
-          closedWorkOrders: closedWoRes.data?.length || 0,
-          overdueWorkOrders: woRes.data?.filter(wo => wo.isOverdue)?.length || 0,
-          invoices: invoicesRes.data?.filter(invoice => invoice.invoice_status === 'processed')?.length || 0,
-          managerApproval: managerApprovalRes.data?.length || 0,
-          declinedWorkOrders: declinedWoRes.data?.length || 0,
+          rfqs: data.rfqs.pending_without_quotation, // Pending RFQs without quotations
+          quotations: data.quotations.total,
+          purchaseOrders: data.purchase_orders.total,
+          workOrders:
+            (woByStatus['Submitted'] || 0) +
+            (woByStatus['Manager Approval'] || 0) +
+            (woByStatus['Approved'] || 0),
+          deliveryNotes: data.delivery_notes.total,
+          closedWorkOrders: woByStatus['Completed'] || 0,
+          overdueWorkOrders: data.work_orders.overdue,
+          invoices: data.invoices.processed,
+          managerApproval: woByStatus['Manager Approval'] || 0,
+          declinedWorkOrders: woByStatus['Declined'] || 0,
         });
       } catch (err) {
         console.error('Error fetching counts:', err);
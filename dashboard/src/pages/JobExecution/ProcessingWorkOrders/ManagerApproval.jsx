@@ -1,6 +1,7 @@
 import { useState, useEffect } from "react";
 import { toast } from "react-toastify";
 import apiClient from "../../../helpers/apiClient";
+import { loadPermissions } from "../../../helpers/tokenPermissions";
 import Modal from "../../../components/Modal";
 import InputField from "../../../components/InputField";
 import { useNavigate } from "react-router-dom";
@@ -36,16 +37,9 @@ const ManagerApproval = () => {
   useEffect(() => {
     const fetchProfile = async () => {
       try {
-        const response = await apiClient.get("/profile/");
-        const user = response.data;
-        setIsSuperadmin(user.is_superuser || user.role?.name === "Superadmin");
-        const roleId = user.role?.id;
-        if (roleId) {
-          const res = await apiClient.get(`/roles/${roleId}/`);
-          setPermissions(res.data.permissions || []);
-        } else {
-          setPermissions([]);
-        }
+        const access = await loadPermissions();
+        setIsSuperadmin(access.isSuperadmin);
+        setPermissions(access.permissions);
       } catch (error) {
         console.error("Unable to fetch user profile:", error);
         setPermissions([]);
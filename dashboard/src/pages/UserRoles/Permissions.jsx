@@ -4,6 +4,7 @@ import { Settings } from "lucide-react";
 import Button from "../../components/Button";
 import Modal from "../../components/Modal";
 import apiClient from "../../helpers/apiClient";
+import { loadPermissions } from "../../helpers/tokenPermissions";
 import Loading from "../../components/Loading";
 
 const Permissions = () => {
@@ -52,16 +53,9 @@ const Permissions = () => {
   useEffect(() => {
     const fetchProfile = async () => {
       try {
-        const response = await apiClient.get("/profile/");
-        const user = response.data;
-        setIsSuperadmin(user.is_superuser || user.role?.name === "Superadmin");
-        const roleId = user.role?.id;
-        if (roleId) {
-          const res = await apiClient.get(`/roles/${roleId}/`);
-          setPermissionsData(res.data.permissions || []);
-        } else {
-          setPermissionsData([]);
-        }
+        const access = await loadPermissions();
+        setIsSuperadmin(access.isSuperadmin);
+        setPermissionsData(access.permissions);
       } catch (error) {
         console.error("Unable to fetch user profile:", error);
         setPermissionsData([]);